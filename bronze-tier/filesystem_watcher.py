@@ -1,35 +1,123 @@
 """
 Filesystem Watcher for Bronze Tier AI Employee
 Monitors Inbox/ folder and moves new files to Needs_Action/ with metadata.
+
+The observer thread only records events; a pool of copy workers picks up a
+file once it is complete: closed after writing (inotify IN_CLOSE_WRITE on
+Linux), renamed into Inbox/, or unchanged in size for STABLE_CHECKS checks.
 """
 
 import time
 import shutil
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 
+# Write-completion detection
+STABLE_CHECKS = 3
+STABLE_INTERVAL = 0.5  # Seconds between size checks
+STABLE_TIMEOUT = 300  # Seconds before a file that keeps changing is skipped
+INGEST_WORKERS = 4
+
+# Partial downloads and temp files; the final name arrives via rename
+TEMP_SUFFIXES = ('.tmp', '.part', '.crdownload', '.swp')
+
+
 class InboxHandler(FileSystemEventHandler):
     """Handles file system events in the Inbox folder."""
 
-    def __init__(self, needs_action_path: Path):
+    def __init__(self, needs_action_path: Path, workers: int = INGEST_WORKERS):
         self.needs_action_path = needs_action_path
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        # src_path -> [first_seen, last (size, mtime), stable checks]; guarded by _lock
+        self._pending = {}
+        # Paths handed to a copy worker and not finished yet; guarded by _lock
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._checker = threading.Thread(target=self._check_stable_loop, daemon=True)
+
+    def start(self):
+        """Start the size-stability checker."""
+        self._checker.start()
+
+    def stop(self):
+        """Stop checking and wait for in-flight copies."""
+        self._stopped.set()
+        self._checker.join()
+        self.pool.shutdown(wait=True)
+
+    @staticmethod
+    def _is_candidate(path: Path) -> bool:
+        return not path.name.startswith('.') and not path.name.endswith(TEMP_SUFFIXES)
 
     def on_created(self, event):
-        """Called when a file or directory is created."""
+        """Called when a file or directory is created (it may still be being written)."""
         if event.is_directory:
             return
 
         src_path = Path(event.src_path)
 
         # Skip hidden files and temporary files
-        if src_path.name.startswith('.') or src_path.name.endswith('.tmp'):
-            return
+        if self._is_candidate(src_path):
+            with self._lock:
+                self._pending.setdefault(src_path, [time.monotonic(), None, 0])
 
-        # Wait briefly to ensure file is fully written
-        time.sleep(0.1)
+    def on_closed(self, event):
+        """Called when a file opened for writing is closed (Linux)."""
+        if not event.is_directory:
+            self._submit(Path(event.src_path))
 
+    def on_moved(self, event):
+        """Called when a file is renamed; a file renamed into Inbox/ is complete."""
+        if event.is_directory:
+            return
+        dest_path = Path(event.dest_path)
+        with self._lock:
+            self._pending.pop(Path(event.src_path), None)
+            if self._is_candidate(dest_path):
+                self._pending[dest_path] = [time.monotonic(), None, 0]
+        self._submit(dest_path)
+
+    def _submit(self, src_path: Path):
+        """Hand a pending file to the copy workers (once)."""
+        with self._lock:
+            # A path still being copied stays pending; the checker retries it afterwards
+            if src_path not in self._pending or src_path in self._in_flight:
+                return
+            del self._pending[src_path]
+            self._in_flight.add(src_path)
+        self.pool.submit(self._process_file, src_path)
+
+    def _check_stable_loop(self):
+        """Submit pending files whose size and mtime stopped changing."""
+        while not self._stopped.wait(STABLE_INTERVAL):
+            with self._lock:
+                pending = list(self._pending.items())
+
+            for src_path, entry in pending:
+                try:
+                    stat = src_path.stat()
+                except FileNotFoundError:
+                    with self._lock:
+                        self._pending.pop(src_path, None)
+                    continue
+
+                signature = (stat.st_size, stat.st_mtime_ns)
+                entry[2] = entry[2] + 1 if signature == entry[1] else 0
+                entry[1] = signature
+                if entry[2] >= STABLE_CHECKS:
+                    self._submit(src_path)
+                elif time.monotonic() - entry[0] > STABLE_TIMEOUT:
+                    with self._lock:
+                        self._pending.pop(src_path, None)
+                    print(f"[-] Skipped (still changing): {src_path.name}")
+
+    def _process_file(self, src_path: Path):
+        """Copy one complete file to Needs_Action/ and write its metadata (worker thread)."""
         # Generate unique filename with FILE_ prefix
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         new_filename = f"FILE_{timestamp}_{src_path.name}"
@@ -74,6 +162,9 @@ New file dropped for processing.
 
         except Exception as e:
             print(f"[-] Error processing {src_path.name}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(src_path)
 
 
 def main():
@@ -98,6 +189,7 @@ def main():
     print(f"Output to: {needs_action_path.absolute()}")
     print("Press Ctrl+C to stop\n")
 
+    event_handler.start()
     observer.start()
 
     try:
@@ -108,6 +200,7 @@ def main():
         observer.stop()
 
     observer.join()
+    event_handler.stop()
     print("Watcher stopped.")
 
 
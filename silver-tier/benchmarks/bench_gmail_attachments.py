@@ -0,0 +1,85 @@
+"""
+Gmail Attachment Benchmark - Silver Tier
+
+Drains messages with nested multipart bodies and large attachments from the
+fake Gmail service and reports the peak Python memory (tracemalloc) of the
+drain, next to fetching one attachment and decoding it in one piece. The
+encoded attachments.get response dominates both: a download costs about
+2.7x the attachment size at its peak, which MAX_ATTACHMENT_BYTES bounds.
+The fake builds a fresh response for every attachments.get, so the encoded
+payload is counted in both figures. Saved files are checked byte for byte
+against the originals.
+
+Usage:
+    python benchmarks/bench_gmail_attachments.py [messages] [attachment_mb]
+"""
+
+import os
+import sys
+import time
+import base64
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from fake_gmail import FakeGmailService
+from gmail_watcher import GmailWatcher
+
+
+def peak_of(func) -> tuple:
+    """Run func under tracemalloc; returns (result, peak_bytes, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    attachment_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+
+    service = FakeGmailService()
+    originals = {}
+    for i in range(message_count):
+        content = os.urandom(int(attachment_mb * 1024 * 1024))
+        message_id = service.add_message(subject=f"Report {i}", body=f"See attached report {i}.",
+                                         attachments={f"report_{i}.bin": content})
+        originals[message_id] = content
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        watcher = GmailWatcher(tmp_path, checkpoint_path=tmp_path / 'history.json',
+                               service=service, dedupe_path=tmp_path / 'dedupe.sqlite3')
+        _, drain_peak, drain_time = peak_of(watcher.check_for_new_items)
+
+        intact = 0
+        for message_id, content in originals.items():
+            saved = list(tmp_path.glob(f"EMAIL_{message_id}_attachments/*"))
+            bodies_ok = 'See attached report' in next(tmp_path.glob(f"EMAIL_{message_id}_*.md")).read_text()
+            if len(saved) == 1 and saved[0].read_bytes() == content and bodies_ok:
+                intact += 1
+
+        # Baseline: fetch one attachment and decode it in a single call
+        message_id, attachment_id = next(iter(originals)), next(iter(service.attachments))
+        request = service.users().messages().attachments().get(
+            userId='me', messageId=message_id, id=attachment_id, fields='data')
+        _, whole_peak, _ = peak_of(lambda: base64.urlsafe_b64decode(request.execute()['data']))
+
+    print("\n" + "=" * 60)
+    print("Gmail Attachment Benchmark")
+    print("=" * 60)
+    print(f"Messages: {message_count}, attachment size: {attachment_mb:.1f} MB each")
+    print(f"Files intact: {intact}/{message_count}, drain time: {drain_time * 1000:.1f} ms")
+    print(f"Peak memory, chunked drain (all messages):   {drain_peak / 1e6:6.1f} MB")
+    print(f"Peak memory, one-shot fetch+decode (1 file): {whole_peak / 1e6:6.1f} MB")
+    print(f"API calls: {dict(service.calls)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
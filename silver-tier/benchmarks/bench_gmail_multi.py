@@ -0,0 +1,74 @@
+"""
+Multi-Mailbox Gmail Benchmark - Silver Tier
+
+Runs MultiGmailWatcher against several fake Gmail services, one of which
+has a large backlog, and reports how long the quiet accounts wait for their
+first file. With fair scheduling that wait stays at about one round
+instead of the time it takes to drain the busy mailbox.
+
+Usage:
+    python benchmarks/bench_gmail_multi.py [accounts] [backlog] [latency_ms]
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from fake_gmail import FakeGmailService
+from gmail_multi import MultiGmailWatcher
+
+
+def main():
+    account_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    backlog = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 5.0) / 1000
+
+    names = [f"account{i}" for i in range(account_count)]
+    services = {name: FakeGmailService(email_address=f"{name}@example.com", latency=latency)
+                for name in names}
+    for i in range(backlog):
+        services[names[0]].add_message(subject=f"Backlog {i}")
+    for name in names[1:]:
+        services[name].add_message(subject=f"Hello {name}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        watcher = MultiGmailWatcher(tmp_path, [{'name': name} for name in names],
+                                    dedupe_path=tmp_path / 'dedupe.sqlite3',
+                                    state_path=tmp_path, services=services)
+
+        first_file = {}
+        rounds = 0
+        start = time.perf_counter()
+        while True:
+            watcher.check_for_new_items()
+            rounds += 1
+            elapsed = time.perf_counter() - start
+            for name in names:
+                if name not in first_file and any(tmp_path.glob(f"EMAIL_{name}_*.md")):
+                    first_file[name] = elapsed
+            if not watcher._wake.is_set():
+                break
+            watcher._wake.clear()
+        total = time.perf_counter() - start
+        files = len(list(tmp_path.glob('EMAIL_*.md')))
+        watcher.close()
+
+    quiet_waits = [first_file[name] for name in names[1:] if name in first_file]
+    print("\n" + "=" * 60)
+    print("Multi-Mailbox Gmail Benchmark")
+    print("=" * 60)
+    print(f"Accounts: {account_count}, backlog on {names[0]}: {backlog}, "
+          f"latency: {latency * 1000:.0f} ms")
+    print(f"Rounds: {rounds}, files created: {files}, total: {total * 1000:.1f} ms")
+    print(f"Busy account fully drained:      {total * 1000:8.1f} ms")
+    if quiet_waits:
+        print(f"Quiet accounts first file (max): {max(quiet_waits) * 1000:8.1f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
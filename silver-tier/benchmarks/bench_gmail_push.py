@@ -0,0 +1,105 @@
+"""
+Gmail Push Latency Benchmark - Silver Tier
+
+Runs GmailWatcher in push mode against the fake Gmail service and a local
+stand-in for Pub/Sub that posts synthetic push notifications. Measures the
+time from notification to the EMAIL_*.md file appearing in Needs_Action/.
+
+Usage:
+    python benchmarks/bench_gmail_push.py [notifications] [burst_size]
+"""
+
+import sys
+import json
+import time
+import base64
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from fake_gmail import FakeGmailService
+from base_watcher import MetricsSink
+from gmail_push import PushListener, PUSH_PATH
+from gmail_watcher import GmailWatcher
+
+
+def post_notification(port: int, history_id: int):
+    """Post a Pub/Sub-style push envelope to the listener."""
+    data = json.dumps({'emailAddress': 'me@example.com', 'historyId': history_id})
+    envelope = {
+        'message': {
+            'data': base64.b64encode(data.encode('utf-8')).decode('ascii'),
+            'messageId': str(history_id),
+        },
+        'subscription': 'projects/bench/subscriptions/gmail-push',
+    }
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{PUSH_PATH}",
+        data=json.dumps(envelope).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    urllib.request.urlopen(request).close()
+
+
+def wait_for_file(folder: Path, message_id: str, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if any(folder.glob(f"EMAIL_{message_id}_*.md")):
+            return True
+        time.sleep(0.001)
+    return False
+
+
+def main():
+    notifications = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    burst_size = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        service = FakeGmailService()
+        watcher = GmailWatcher(tmp_path, checkpoint_path=tmp_path / 'history.json',
+                               service=service, dedupe_path=tmp_path / 'dedupe.sqlite3')
+        watcher.metrics = MetricsSink(tmp_path / 'metrics.jsonl')
+
+        listener = PushListener(watcher.on_push_notification, port=0)
+        listener.start()
+
+        # Long safety-net interval so only push notifications drive syncs
+        runner = threading.Thread(target=watcher.run, kwargs={'check_interval': 3600}, daemon=True)
+        runner.start()
+        time.sleep(0.2)
+
+        latencies = []
+        for _ in range(notifications):
+            message_id = service.add_message(subject="Push benchmark")
+            start = time.perf_counter()
+            # Gmail often sends several notifications per change; they should coalesce
+            for _ in range(burst_size):
+                post_notification(listener.port, service.history_id)
+            if wait_for_file(tmp_path, message_id):
+                latencies.append(time.perf_counter() - start)
+
+        listener.stop()
+        watcher.stop()
+        runner.join()
+
+    latencies.sort()
+    print("\n" + "=" * 60)
+    print("Gmail Push Latency Benchmark")
+    print("=" * 60)
+    print(f"Notifications: {notifications} x burst {burst_size}, files created: {len(latencies)}")
+    print(f"Debounce window: {listener.debounce * 1000:.0f} ms")
+    if latencies:
+        print(f"Latency p50: {latencies[len(latencies) // 2] * 1000:.1f} ms")
+        print(f"Latency max: {latencies[-1] * 1000:.1f} ms")
+    print(f"Notifications received: {listener.received}, history.list calls: "
+          f"{service.calls['history.list']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
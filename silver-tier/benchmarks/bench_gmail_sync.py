@@ -0,0 +1,131 @@
+"""
+Gmail Sync Benchmark - Silver Tier
+
+Compares the cost of GmailWatcher poll cycles against the fake Gmail
+service: full query sync vs. incremental history sync, plus the
+fallback when the history checkpoint expires. A simulated per-request
+latency shows the wall-clock effect of batching message fetches.
+
+Usage:
+    python benchmarks/bench_gmail_sync.py [mailbox_size] [cycles] [latency_ms] [drain_size]
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from fake_gmail import FakeGmailService
+from gmail_watcher import GmailWatcher
+
+
+def run_cycles(watcher: GmailWatcher, service: FakeGmailService, cycles: int,
+               new_per_cycle: int, incremental: bool) -> dict:
+    """Run poll cycles, adding new mail before each, and collect timings."""
+    service.calls.clear()
+    durations = []
+    for cycle in range(cycles):
+        for i in range(new_per_cycle):
+            service.add_message(subject=f"Cycle {cycle} message {i}")
+        if not incremental:
+            watcher.history_id = None
+        start = time.perf_counter()
+        watcher.check_for_new_items()
+        durations.append(time.perf_counter() - start)
+    return {
+        'avg_ms': sum(durations) / len(durations) * 1000,
+        'api_calls': sum(service.calls.values()),
+        'calls': dict(service.calls),
+    }
+
+
+def run_backlog(tmp_path: Path, backlog: int, latency: float) -> dict:
+    """Time one cycle that has to create a file for every message in a backlog."""
+    service = FakeGmailService(latency=latency)
+    watcher = GmailWatcher(tmp_path, checkpoint_path=tmp_path / 'history.json',
+                           service=service, dedupe_path=tmp_path / 'dedupe.sqlite3')
+    watcher.check_for_new_items()
+    for i in range(backlog):
+        service.add_message(subject=f"Backlog {i}")
+    service.calls.clear()
+    start = time.perf_counter()
+    watcher.check_for_new_items()
+    return {
+        'avg_ms': (time.perf_counter() - start) * 1000,
+        'api_calls': sum(service.calls.values()),
+        'calls': dict(service.calls),
+    }
+
+
+def run_drain(tmp_path: Path, mailbox_size: int, latency: float) -> dict:
+    """Time a first-run drain of a large mailbox through the paginated pipeline."""
+    service = FakeGmailService(latency=latency)
+    for i in range(mailbox_size):
+        service.add_message(subject=f"Outage backlog {i}")
+    watcher = GmailWatcher(tmp_path, checkpoint_path=tmp_path / 'history.json',
+                           service=service, dedupe_path=tmp_path / 'dedupe.sqlite3')
+    start = time.perf_counter()
+    watcher.check_for_new_items()
+    elapsed = time.perf_counter() - start
+    return {
+        'avg_ms': elapsed * 1000,
+        'api_calls': sum(service.calls.values()),
+        'calls': dict(service.calls),
+        'msgs_per_sec': mailbox_size / elapsed,
+    }
+
+
+def main():
+    mailbox_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 20.0) / 1000
+    drain_size = int(sys.argv[4]) if len(sys.argv) > 4 else 2000
+
+    print("=" * 60)
+    print("Gmail Sync Benchmark")
+    print("=" * 60)
+    print(f"Mailbox size: {mailbox_size}, cycles: {cycles}, 1 new message per cycle")
+    print(f"Simulated latency: {latency * 1000:.0f} ms per round trip\n")
+
+    results = {}
+    for mode in ('full', 'incremental'):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            service = FakeGmailService(latency=latency)
+            for i in range(mailbox_size):
+                service.add_message(subject=f"Backlog {i}")
+
+            watcher = GmailWatcher(tmp_path, checkpoint_path=tmp_path / 'history.json',
+                                   service=service, dedupe_path=tmp_path / 'dedupe.sqlite3')
+            watcher.check_for_new_items()  # initial sync seeds the checkpoint
+            results[mode] = run_cycles(watcher, service, cycles, 1, mode == 'incremental')
+
+            if mode == 'incremental':
+                service.add_message(subject="Arrived while history expired")
+                service.expire_history()
+                service.calls.clear()
+                start = time.perf_counter()
+                watcher.check_for_new_items()
+                results['expired'] = {
+                    'avg_ms': (time.perf_counter() - start) * 1000,
+                    'api_calls': sum(service.calls.values()),
+                    'calls': dict(service.calls),
+                }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results['backlog_100'] = run_backlog(Path(tmp), 100, latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        results[f'drain_{drain_size}'] = run_drain(Path(tmp), drain_size, latency)
+
+    for mode, stats in results.items():
+        print(f"{mode:12s} avg {stats['avg_ms']:8.2f} ms/cycle  "
+              f"{stats['api_calls']:5d} API calls  {stats['calls']}")
+        if 'msgs_per_sec' in stats:
+            print(f"{'':12s} {stats['msgs_per_sec']:.0f} messages/sec")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Inbox Burst Benchmark - Silver Tier
+
+Writes a burst of small files into Inbox/ (like an unzip or rsync) while the
+silver InboxHandler is running, and measures how long it takes until every
+file has its metadata in Needs_Action/. Runs twice:
+
+- batched: the default coalescing stage (BATCH_WINDOW / BATCH_SIZE)
+- per-file: batch size 1, no window - one metadata write and one manifest
+  commit per file, like the handler before batching
+
+Reports files per second, files missing at the timeout, whether all
+Needs_Action names are unique, and the manifest row count.
+
+Usage:
+    python benchmarks/bench_inbox_burst.py [files] [timeout_seconds]
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from watchdog.observers import Observer
+from filesystem_watcher import InboxHandler, open_inbox_manifest
+
+
+def count_metadata(folder: Path) -> int:
+    with os.scandir(folder) as entries:
+        return sum(1 for entry in entries if entry.name.endswith('.md'))
+
+
+def run_burst(files: int, timeout: float, **handler_options) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        inbox, needs_action = tmp_path / 'Inbox', tmp_path / 'Needs_Action'
+        inbox.mkdir()
+        needs_action.mkdir()
+        manifest_path = tmp_path / 'State' / 'inbox_manifest.sqlite3'
+
+        handler = InboxHandler(needs_action, store_path=tmp_path / 'Store',
+                               manifest_path=manifest_path, **handler_options)
+        observer = Observer()
+        observer.schedule(handler, str(inbox), recursive=False)
+        handler.start()
+        observer.start()
+
+        start = time.perf_counter()
+        for i in range(files):
+            (inbox / f"doc_{i:05d}.txt").write_text(f"Document {i}\n")
+        written = time.perf_counter() - start
+
+        done = 0
+        while time.perf_counter() - start < timeout:
+            done = count_metadata(needs_action)
+            if done >= files:
+                break
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        observer.stop()
+        observer.join()
+        handler.stop()
+
+        names = [p.name for p in needs_action.glob('*.md')]
+        manifest = open_inbox_manifest(manifest_path)
+        rows = len(manifest)
+        manifest.close()
+
+    return {
+        'write_s': written,
+        'elapsed_s': elapsed,
+        'done': done,
+        'unique': len(set(names)) == len(names),
+        'manifest_rows': rows,
+    }
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    timeout = float(sys.argv[2]) if len(sys.argv) > 2 else 300.0
+
+    results = {
+        'batched': run_burst(files, timeout),
+        'per-file': run_burst(files, timeout, batch_size=1, batch_window=0),
+    }
+
+    print("\n" + "=" * 72)
+    print("Inbox Burst Benchmark")
+    print("=" * 72)
+    print(f"{files} files written into Inbox/ at once")
+    for mode, r in results.items():
+        print(f"{mode:9s} all metadata in {r['elapsed_s']:7.2f}s ({r['done'] / r['elapsed_s']:7.0f} files/s)  "
+              f"missing {files - r['done']:5d}  names unique {'yes' if r['unique'] else 'NO'}  "
+              f"manifest rows {r['manifest_rows']}")
+    print(f"(burst itself took {results['batched']['write_s']:.2f}s to write)")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Inbox Ingestion Strategies Benchmark - Silver Tier
+
+Ingests files of several sizes with every strategy in watchers/ingest.py,
+without fallback, and reports time, throughput and the disk space the
+ingested file adds: allocated blocks, and the drop in free space (which also
+shows blocks shared by a reflink). Strategies the filesystem does not
+support are listed as such. shutil.copy2, the old InboxHandler path, is
+included for reference. Every result is checked byte for byte.
+
+Run it on the filesystem that holds your vault (default: a temp dir there).
+
+Usage:
+    python benchmarks/bench_ingest.py [sizes_mb (comma separated)] [directory]
+"""
+
+import os
+import sys
+import time
+import shutil
+import filecmp
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from ingest import ingest_file, STRATEGIES, UnsupportedStrategy
+
+
+def write_source(path: Path, size: int):
+    """Random file of size bytes, written in 1 MB pieces."""
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining:
+            chunk = min(remaining, 1024 * 1024)
+            f.write(os.urandom(chunk))
+            remaining -= chunk
+
+
+def allocated_bytes(source: Path, dest: Path) -> int:
+    """Blocks allocated to dest; 0 when it is the source's inode (reflinked blocks still count)."""
+    dest_stat = dest.stat()
+    if source.exists() and source.stat().st_ino == dest_stat.st_ino:
+        return 0
+    return dest_stat.st_blocks * 512
+
+
+def free_bytes(path: Path) -> int:
+    stat = os.statvfs(path)
+    return stat.f_bavail * stat.f_frsize
+
+
+def run(strategy: str, source: Path, inbox: Path, needs_action: Path) -> dict:
+    dest = needs_action / f"FILE_{strategy}_{source.name}"
+    if strategy == 'rename':
+        # rename consumes its source; ingest a hardlinked twin so the original stays
+        twin = inbox / f"twin_{source.name}"
+        os.link(source, twin)
+        ingest_source = twin
+    else:
+        ingest_source = source
+
+    os.sync()
+    free_before = free_bytes(needs_action)
+    start = time.perf_counter()
+    try:
+        if strategy == 'copy2':
+            shutil.copy2(ingest_source, dest)
+        else:
+            ingest_file(ingest_source, dest, strategy, fallback=False)
+        os.sync()
+    except UnsupportedStrategy as error:
+        if ingest_source != source:
+            ingest_source.unlink()
+        return {'supported': False, 'reason': error.strerror}
+    elapsed = time.perf_counter() - start
+
+    result = {
+        'supported': True,
+        'seconds': elapsed,
+        'extra_bytes': allocated_bytes(source, dest) if strategy != 'rename' else 0,
+        'disk_delta': max(0, free_before - free_bytes(needs_action)),
+        'intact': filecmp.cmp(source, dest, shallow=False),
+    }
+    dest.unlink()
+    return result
+
+
+def main():
+    sizes_mb = [float(s) for s in sys.argv[1].split(',')] if len(sys.argv) > 1 else [1, 64, 512]
+    directory = sys.argv[2] if len(sys.argv) > 2 else None
+    strategies = list(STRATEGIES) + ['copy2']
+
+    print("\n" + "=" * 84)
+    print("Inbox Ingestion Strategies Benchmark")
+    print("=" * 84)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        inbox, needs_action = Path(tmp) / 'Inbox', Path(tmp) / 'Needs_Action'
+        inbox.mkdir()
+        needs_action.mkdir()
+        print(f"Working directory: {tmp}")
+
+        for size_mb in sizes_mb:
+            size = int(size_mb * 1024 * 1024)
+            source = inbox / f"drop_{size_mb:g}MB.bin"
+            write_source(source, size)
+            print(f"\n{size_mb:g} MB")
+            for strategy in strategies:
+                r = run(strategy, source, inbox, needs_action)
+                if not r['supported']:
+                    print(f"  {strategy:16s} unsupported here ({r['reason']})")
+                    continue
+                rate = size / r['seconds'] / 1e6 if r['seconds'] else float('inf')
+                print(f"  {strategy:16s} {r['seconds'] * 1000:9.1f} ms  {rate:9.0f} MB/s  "
+                      f"new blocks {r['extra_bytes'] / 1e6:8.1f} MB  "
+                      f"free space used {r['disk_delta'] / 1e6:8.1f} MB  "
+                      f"{'OK' if r['intact'] else 'MISMATCH'}")
+            source.unlink()
+    print("=" * 84)
+
+
+if __name__ == "__main__":
+    main()
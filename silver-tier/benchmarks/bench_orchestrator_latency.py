@@ -0,0 +1,90 @@
+"""
+Orchestrator Approval Latency Benchmark - Silver Tier
+
+Runs the orchestrator loop in a temporary vault with send_email replaced by
+a recorder, moves approval files from Pending_Approval/ to Approved/ one at a
+time (as a human would), and measures approval-to-send latency: the move ->
+the send call. Before the event-driven loop the expected latency was half the
+30 second polling interval on average, 30 seconds at worst.
+
+Usage:
+    python benchmarks/bench_orchestrator_latency.py [approvals] [gap_seconds]
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+APPROVAL_TEMPLATE = """---
+action: send_email
+to: "client{i}@example.com"
+subject: "Invoice {i}"
+---
+
+# Approval Required: Send Email
+
+- **Body:** Please find invoice {i} attached.
+
+- [ ] Approve
+"""
+
+
+def main():
+    approvals = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    gap = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The orchestrator resolves its folders relative to the working directory
+        os.chdir(tmp)
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+        import orchestrator
+
+        sent = {}
+
+        def record_send(to, subject, body, attachment_path=None, cc=None):
+            sent[subject] = time.perf_counter()
+            return {'success': True, 'message': f"Sent to {to}", 'message_id': subject}
+
+        orchestrator.send_email = record_send
+        orchestrator.EMAIL_MCP_AVAILABLE = True
+
+        stop = threading.Event()
+        loop = threading.Thread(target=orchestrator.run_orchestrator, args=(stop,), daemon=True)
+        loop.start()
+        time.sleep(1.0)
+
+        moved = {}
+        for i in range(approvals):
+            pending = orchestrator.FOLDER_PENDING / f"APPROVAL_email_{i}.md"
+            pending.write_text(APPROVAL_TEMPLATE.format(i=i), encoding='utf-8')
+            time.sleep(gap)
+            moved[f"Invoice {i}"] = time.perf_counter()
+            os.replace(pending, orchestrator.FOLDER_APPROVED / pending.name)
+            time.sleep(gap)
+
+        deadline = time.perf_counter() + 5
+        while len(sent) < approvals and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        stop.set()
+        loop.join()
+        os.chdir(Path(__file__).resolve().parent)
+
+    latencies = sorted((sent[s] - moved[s]) * 1000 for s in moved if s in sent)
+    print("\n" + "=" * 60)
+    print("Orchestrator Approval Latency Benchmark")
+    print("=" * 60)
+    print(f"Mode: {'filesystem events' if orchestrator.WATCHDOG_AVAILABLE else 'polling'}")
+    print(f"Approvals sent: {len(latencies)}/{approvals}")
+    if latencies:
+        print(f"Latency p50 {latencies[len(latencies) // 2]:7.1f} ms   "
+              f"max {latencies[-1]:7.1f} ms")
+    print(f"Polling loop (before): ~{orchestrator.POLL_INTERVAL / 2 * 1000:.0f} ms average, "
+          f"{orchestrator.POLL_INTERVAL * 1000:.0f} ms worst case")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
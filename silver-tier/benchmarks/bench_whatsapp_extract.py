@@ -0,0 +1,94 @@
+"""
+WhatsApp Chat List Extraction Benchmark - Silver Tier
+
+Loads the saved chat list fixture (benchmarks/fixtures/whatsapp_chat_list.html)
+into headless Chromium and compares the per-poll cost of the old per-row
+extraction (several Playwright calls per row) with the single
+CRAWL_STEP_JS 'next' evaluate that WhatsAppWatcher._crawl_chats issues for
+each screen of the list. The fixture is not virtualized, so every step reads
+all of its rows. No WhatsApp session is needed.
+
+Usage:
+    python benchmarks/bench_whatsapp_extract.py [polls]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from playwright.sync_api import sync_playwright
+
+from whatsapp_watcher import SELECTORS, UNREAD_INDICATORS, CRAWL_STEP_JS, EXTRACT_SPEC
+
+FIXTURE = Path(__file__).resolve().parent / 'fixtures' / 'whatsapp_chat_list.html'
+
+
+def legacy_extract(page) -> tuple:
+    """The previous per-row extraction; returns (rows, playwright_calls)."""
+    calls = 1
+    rows = []
+    for row in page.query_selector_all(SELECTORS['chat_list']):
+        name_elem = row.query_selector(SELECTORS['chat_name'])
+        preview_elem = row.query_selector(SELECTORS['message_preview'])
+        time_elem = row.query_selector(SELECTORS['last_message_time'])
+        calls += 3
+        name = name_elem.inner_text() if name_elem else None
+        preview = preview_elem.inner_text() if preview_elem else ''
+        timestamp = time_elem.get_attribute('datetime') if time_elem else None
+        calls += bool(name_elem) + bool(preview_elem) + bool(time_elem)
+
+        is_unread = False
+        for indicator in UNREAD_INDICATORS:
+            calls += 1
+            if row.query_selector(indicator):
+                is_unread = True
+                break
+        calls += 2
+        if 'unread' in (row.get_attribute('class') or '') or 'unread' in str(row.evaluate('el => el.className')):
+            is_unread = True
+        rows.append([name, preview, timestamp, is_unread])
+    return rows, calls
+
+
+def crawl_step(page) -> list:
+    """One _crawl_chats step: read the rendered rows (and scroll the pane) in one evaluate."""
+    return page.evaluate(CRAWL_STEP_JS, [EXTRACT_SPEC, 'next'])['rows']
+
+
+def time_polls(func, polls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(polls):
+        func()
+    return (time.perf_counter() - start) / polls
+
+
+def main():
+    polls = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.set_content(FIXTURE.read_text(encoding='utf-8'))
+
+        legacy_rows, legacy_calls = legacy_extract(page)
+        batched_rows = crawl_step(page)
+        matches = legacy_rows == [row[:4] for row in batched_rows]
+
+        legacy_time = time_polls(lambda: legacy_extract(page), polls)
+        batched_time = time_polls(lambda: crawl_step(page), polls)
+        browser.close()
+
+    print("\n" + "=" * 60)
+    print("WhatsApp Chat List Extraction Benchmark")
+    print("=" * 60)
+    print(f"Rows per poll: {len(batched_rows)}, polls: {polls}, results identical: {matches}")
+    print(f"Per-row extraction:  {legacy_time * 1000:8.2f} ms/poll  {legacy_calls:4d} Playwright calls")
+    print(f"Crawl step evaluate: {batched_time * 1000:8.2f} ms/poll  {1:4d} Playwright call")
+    print(f"Speedup: {legacy_time / batched_time:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
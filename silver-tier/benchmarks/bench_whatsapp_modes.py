@@ -0,0 +1,123 @@
+"""
+WhatsApp Watcher Modes Benchmark - Silver Tier
+
+Runs WhatsAppWatcher in poll mode (reload every cycle) and event-driven mode
+(MutationObserver) against the offline fixture server for the same time and
+mutation schedule, then compares:
+
+- extraction latency: average watcher cycle time
+- detection latency: new message on the server -> WHATSAPP_*.md written
+- messages detected per second, and the share of server messages detected
+- duplicate rate: files that repeat an already written chat + preview
+
+Usage:
+    python benchmarks/bench_whatsapp_modes.py [seconds] [chats] [mutate_interval] [untimed_ratio]
+"""
+
+import re
+import sys
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from base_watcher import MetricsSink
+from whatsapp_watcher import WhatsAppWatcher
+from whatsapp_fixture_server import FixtureServer
+
+# Safety-net / poll interval used for both modes
+CHECK_INTERVAL = 10
+
+
+def read_files(folder: Path) -> list:
+    """(chat name, preview, written_at) for every WHATSAPP_*.md in folder."""
+    files = []
+    for path in folder.glob('WHATSAPP_*.md'):
+        text = path.read_text(encoding='utf-8')
+        name = re.search(r'^chat_name: "(.*)"$', text, re.M).group(1)
+        preview = re.search(r'## Message Preview\n\n(.*)\n', text).group(1)
+        files.append((name, preview, path.stat().st_mtime))
+    return files
+
+
+def run_mode(event_driven: bool, seconds: float, chats: int, mutate_interval: float,
+             untimed_ratio: float) -> dict:
+    server = FixtureServer(chats=chats, mutate_interval=mutate_interval,
+                           untimed_ratio=untimed_ratio).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        watcher = WhatsAppWatcher(tmp_path, session_path=str(tmp_path / 'session'), headless=True,
+                                  dedupe_path=tmp_path / 'dedupe.sqlite3',
+                                  crawl_state_path=tmp_path / 'crawl.json',
+                                  event_driven=event_driven, url=server.url, max_rss_mb=0)
+        watcher.metrics = MetricsSink(tmp_path / 'metrics.jsonl')
+
+        first_event = len(server.events)
+        timer = threading.Timer(seconds, watcher.stop)
+        timer.start()
+        try:
+            watcher.run(check_interval=CHECK_INTERVAL)
+        finally:
+            timer.cancel()
+            watcher.close()
+            server.stop()
+
+        files = read_files(tmp_path)
+        cycles = [json.loads(line) for line in (tmp_path / 'metrics.jsonl').read_text().splitlines()]
+
+    events = server.events[first_event:]
+    written = {}
+    for name, preview, written_at in sorted(files, key=lambda f: f[2]):
+        written.setdefault((name, preview), []).append(written_at)
+
+    latencies = []
+    detected = 0
+    for event in events:
+        times = [t for t in written.get((event['name'], event['preview']), []) if t >= event['at']]
+        if times:
+            detected += 1
+            latencies.append(min(times) - event['at'])
+
+    durations = [c['duration_ms'] for c in cycles if 'duration_ms' in c]
+    return {
+        'cycles': len(durations),
+        'cycle_ms': sum(durations) / len(durations) if durations else 0.0,
+        'events': len(events),
+        'detected': detected,
+        'per_second': detected / seconds,
+        'latency_ms': sorted(latencies)[len(latencies) // 2] * 1000 if latencies else 0.0,
+        'files': len(files),
+        'duplicate_rate': (len(files) - len(written)) / len(files) if files else 0.0,
+        'reloads': watcher.reloads,
+        'events_seen': watcher.events,
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    chats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    mutate_interval = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+    untimed_ratio = float(sys.argv[4]) if len(sys.argv) > 4 else 0.2
+
+    results = {
+        'poll': run_mode(False, seconds, chats, mutate_interval, untimed_ratio),
+        'event': run_mode(True, seconds, chats, mutate_interval, untimed_ratio),
+    }
+
+    print("\n" + "=" * 72)
+    print("WhatsApp Watcher Modes Benchmark")
+    print("=" * 72)
+    print(f"{seconds:g}s per mode, {chats} chats, a new message every {mutate_interval:g}s, "
+          f"{untimed_ratio:.0%} chats without a timestamp")
+    for mode, r in results.items():
+        print(f"{mode:6s} cycles {r['cycles']:4d} ({r['cycle_ms']:7.1f} ms avg)  "
+              f"detected {r['detected']:3d}/{r['events']:<3d} ({r['per_second']:.2f}/s)  "
+              f"p50 latency {r['latency_ms']:7.0f} ms  "
+              f"duplicates {r['duplicate_rate']:5.1%}  reloads {r['reloads']}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
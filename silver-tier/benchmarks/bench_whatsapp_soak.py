@@ -0,0 +1,69 @@
+"""
+WhatsApp Soak Benchmark - Silver Tier
+
+Runs WhatsAppWatcher cycles against the virtualized chat list fixture for a
+fixed time with tight recycle limits and samples resident memory (watcher +
+Playwright driver + browser) after every cycle, so RSS growth and context
+recycling can be watched over time. Requires psutil.
+
+Usage:
+    python benchmarks/bench_whatsapp_soak.py [minutes] [max_rss_mb] [max_context_age_s] [interval_s]
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from base_watcher import MetricsSink
+from whatsapp_watcher import WhatsAppWatcher, PSUTIL_AVAILABLE
+
+FIXTURE = Path(__file__).resolve().parent / 'fixtures' / 'whatsapp_virtual_list.html'
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    max_rss_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 600.0
+    max_age = float(sys.argv[3]) if len(sys.argv) > 3 else 120.0
+    interval = float(sys.argv[4]) if len(sys.argv) > 4 else 5.0
+
+    if not PSUTIL_AVAILABLE:
+        sys.exit("psutil is required: pip install psutil")
+
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        watcher = WhatsAppWatcher(tmp_path, session_path=str(tmp_path / 'session'), headless=True,
+                                  dedupe_path=tmp_path / 'dedupe.sqlite3',
+                                  crawl_state_path=tmp_path / 'crawl.json',
+                                  url=f"{FIXTURE.as_uri()}?chats=400",
+                                  max_rss_mb=max_rss_mb, max_context_age=max_age)
+        watcher.metrics = MetricsSink(tmp_path / 'metrics.jsonl')
+        try:
+            start = time.monotonic()
+            while time.monotonic() - start < minutes * 60:
+                _, duration = watcher._run_cycle()
+                samples.append((time.monotonic() - start, watcher._resident_memory_mb(),
+                                watcher.recycles, duration))
+                print(f"{samples[-1][0]:7.1f}s  RSS {samples[-1][1]:7.1f} MB  "
+                      f"recycles {watcher.recycles}  cycle {duration * 1000:6.0f} ms")
+                watcher._sleep(interval)
+        finally:
+            watcher.close()
+
+    rss = [sample[1] for sample in samples]
+    print("\n" + "=" * 60)
+    print("WhatsApp Soak Benchmark")
+    print("=" * 60)
+    print(f"Duration: {minutes:g} min, cycles: {len(samples)}, recycles: {samples[-1][2] if samples else 0}")
+    print(f"Limits: {max_rss_mb:g} MB RSS, {max_age:g} s context age")
+    if rss:
+        print(f"RSS min/avg/max: {min(rss):.1f} / {sum(rss) / len(rss):.1f} / {max(rss):.1f} MB")
+    print(f"Requests blocked: {watcher.blocked_requests}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
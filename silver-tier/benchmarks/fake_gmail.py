@@ -0,0 +1,270 @@
+"""
+Fake Gmail API service for offline benchmarks - Silver Tier
+
+Mimics the subset of the googleapiclient Gmail v1 resource chain that
+GmailWatcher uses (users().messages(), messages().attachments(),
+users().history(), getProfile)
+so sync paths can be exercised without OAuth or network access.
+
+Usage:
+======
+from fake_gmail import FakeGmailService
+service = FakeGmailService()
+service.add_message(subject="Invoice due", sender="billing@example.com")
+watcher = GmailWatcher(needs_action_path, service=service)
+"""
+
+import time
+import base64
+import random
+import itertools
+from collections import Counter
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+class _Request:
+    """Deferred call, executed like googleapiclient.http.HttpRequest."""
+
+    def __init__(self, service, method: str, func, kwargs: dict):
+        self.service = service
+        self.method = method
+        self.func = func
+        self.kwargs = kwargs
+
+    def execute(self, http=None, num_retries: int = 0):
+        self.service.calls[self.method] += 1
+        self.service.simulate_round_trip()
+        return self.func(**self.kwargs)
+
+
+class _BatchRequest:
+    """Batch of requests sent in one round trip, like BatchHttpRequest."""
+
+    def __init__(self, service, callback=None):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request: _Request, callback=None, request_id: str = None):
+        request_id = request_id or str(len(self.requests))
+        self.requests.append((request_id, request, callback or self.callback))
+
+    def execute(self):
+        self.service.calls['batch'] += 1
+        self.service.simulate_round_trip()
+        for request_id, request, callback in self.requests:
+            self.service.batched[request.method] += 1
+            try:
+                response, exception = request.func(**request.kwargs), None
+            except HttpError as error:
+                response, exception = None, error
+            if callback:
+                callback(request_id, response, exception)
+
+
+class _Resource:
+    """Resource exposing a fixed set of methods that return _Request objects."""
+
+    def __init__(self, service, prefix: str, methods: dict):
+        self._service = service
+        self._prefix = prefix
+        self._methods = methods
+
+    def __getattr__(self, name):
+        if name not in self._methods:
+            raise AttributeError(name)
+        target = self._methods[name]
+        if isinstance(target, _Resource):
+            return lambda: target
+        return lambda **kwargs: _Request(self._service, f"{self._prefix}.{name}", target, kwargs)
+
+
+class FakeGmailService:
+    """
+    In-memory mailbox with a history log.
+
+    Every mutation bumps the mailbox historyId and appends a history record,
+    mirroring how Gmail exposes changes through users.history.list.
+    `calls` counts HTTP round trips per method (a batch counts once) and
+    `batched` counts the individual requests carried inside batches.
+    `latency` adds a simulated delay to every round trip and `error_rate`
+    makes that fraction of round trips fail with HTTP 429.
+    """
+
+    def __init__(self, email_address: str = 'me@example.com', page_size: int = 100,
+                 latency: float = 0.0, error_rate: float = 0.0):
+        self.email_address = email_address
+        self.page_size = page_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.messages = {}
+        self.attachments = {}
+        self.history = []
+        self.history_id = 1000
+        self.oldest_history_id = self.history_id
+        self.calls = Counter()
+        self.batched = Counter()
+        self._ids = itertools.count(1)
+
+        attachments = _Resource(self, 'attachments', {
+            'get': self._attachments_get,
+        })
+        messages = _Resource(self, 'messages', {
+            'list': self._messages_list,
+            'get': self._messages_get,
+            'attachments': attachments,
+        })
+        history = _Resource(self, 'history', {
+            'list': self._history_list,
+        })
+        self._users = _Resource(self, 'users', {
+            'messages': messages,
+            'history': history,
+            'getProfile': self._get_profile,
+        })
+
+    def users(self):
+        return self._users
+
+    def new_batch_http_request(self, callback=None):
+        return _BatchRequest(self, callback)
+
+    def simulate_round_trip(self):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.error_rate and random.random() < self.error_rate:
+            self.calls['rate_limited'] += 1
+            raise HttpError(httplib2.Response({'status': 429}), b'{"error": "rateLimitExceeded"}')
+
+    # ------------------------------------------------------------------
+    # Mailbox mutation helpers
+    # ------------------------------------------------------------------
+
+    def add_message(self, subject: str = 'Test message', sender: str = 'sender@example.com',
+                    body: str = 'Hello from the fake Gmail service.',
+                    labels=('INBOX', 'UNREAD', 'IMPORTANT'), attachments: dict = None) -> str:
+        """
+        Add a message and record a messageAdded history entry.
+
+        With `attachments` ({filename: bytes}) the payload is nested like
+        Gmail's: multipart/mixed > multipart/alternative (text + html) plus
+        one part per attachment, whose data is only served by attachments.get.
+        """
+        message_id = f"{next(self._ids):016x}"
+        text_part = {'mimeType': 'text/plain', 'filename': '',
+                     'body': {'size': len(body), 'data': self._encode(body.encode('utf-8'))}}
+        headers = [
+            {'name': 'From', 'value': sender},
+            {'name': 'To', 'value': self.email_address},
+            {'name': 'Subject', 'value': subject},
+            {'name': 'Date', 'value': 'Mon, 1 Jan 2026 09:00:00 +0000'},
+        ]
+        if attachments:
+            html = f"<p>{body}</p>".encode('utf-8')
+            parts = [{'mimeType': 'multipart/alternative', 'filename': '', 'body': {'size': 0}, 'parts': [
+                text_part,
+                {'mimeType': 'text/html', 'filename': '', 'body': {'size': len(html), 'data': self._encode(html)}},
+            ]}]
+            for filename, content in attachments.items():
+                attachment_id = f"att-{message_id}-{len(parts)}"
+                self.attachments[attachment_id] = content
+                parts.append({'mimeType': 'application/octet-stream', 'filename': filename,
+                              'body': {'size': len(content), 'attachmentId': attachment_id}})
+            payload = {'mimeType': 'multipart/mixed', 'filename': '', 'headers': headers,
+                       'body': {'size': 0}, 'parts': parts}
+        else:
+            payload = dict(text_part, headers=headers)
+
+        self.messages[message_id] = {
+            'id': message_id,
+            'threadId': message_id,
+            'labelIds': list(labels),
+            'snippet': body[:100],
+            'payload': payload,
+        }
+        self.history_id += 1
+        self.history.append({
+            'id': str(self.history_id),
+            'messagesAdded': [{'message': self._stub(message_id)}],
+        })
+        return message_id
+
+    def expire_history(self):
+        """Drop all history records so older startHistoryIds return 404."""
+        self.history.clear()
+        self.oldest_history_id = self.history_id
+
+    # ------------------------------------------------------------------
+    # API method implementations
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).decode('ascii')
+
+    def _stub(self, message_id: str) -> dict:
+        message = self.messages[message_id]
+        return {'id': message_id, 'threadId': message['threadId'],
+                'labelIds': list(message['labelIds'])}
+
+    def _matches_query(self, message: dict, q: str) -> bool:
+        labels = set(message['labelIds'])
+        for term in (q or '').split():
+            if term.startswith('is:') and term[3:].upper() not in labels:
+                return False
+        return True
+
+    def _get_profile(self, userId: str, **kwargs):
+        return {'emailAddress': self.email_address, 'historyId': str(self.history_id),
+                'messagesTotal': len(self.messages)}
+
+    def _messages_list(self, userId: str, q: str = '', maxResults: int = 100,
+                       pageToken: str = None, **kwargs):
+        # Newest first, like Gmail
+        matching = [mid for mid in reversed(list(self.messages))
+                    if self._matches_query(self.messages[mid], q)]
+        start = int(pageToken or 0)
+        page = matching[start:start + maxResults]
+        result = {'resultSizeEstimate': len(matching)}
+        if page:
+            result['messages'] = [{'id': mid, 'threadId': mid} for mid in page]
+        if start + maxResults < len(matching):
+            result['nextPageToken'] = str(start + maxResults)
+        return result
+
+    def _messages_get(self, userId: str, id: str, format: str = 'full',
+                      metadataHeaders=None, **kwargs):
+        if id not in self.messages:
+            raise HttpError(httplib2.Response({'status': 404}), b'{"error": "Not Found"}')
+        message = dict(self.messages[id])
+        if format == 'metadata':
+            payload = dict(message['payload'])
+            payload.pop('body', None)
+            if metadataHeaders:
+                wanted = {h.lower() for h in metadataHeaders}
+                payload['headers'] = [h for h in payload['headers'] if h['name'].lower() in wanted]
+            message['payload'] = payload
+        return message
+
+    def _attachments_get(self, userId: str, messageId: str, id: str, **kwargs):
+        if id not in self.attachments:
+            raise HttpError(httplib2.Response({'status': 404}), b'{"error": "Not Found"}')
+        # Encoded per call: like a parsed HTTP response, the payload is a new object every time
+        content = self.attachments[id]
+        return {'size': len(content), 'data': self._encode(content)}
+
+    def _history_list(self, userId: str, startHistoryId: str, historyTypes=None,
+                      pageToken: str = None, maxResults: int = None, **kwargs):
+        if int(startHistoryId) < self.oldest_history_id:
+            raise HttpError(httplib2.Response({'status': 404}), b'{"error": "historyId expired"}')
+        records = [r for r in self.history if int(r['id']) > int(startHistoryId)]
+        page_size = maxResults or self.page_size
+        start = int(pageToken or 0)
+        result = {'historyId': str(self.history_id)}
+        if records[start:start + page_size]:
+            result['history'] = records[start:start + page_size]
+        if start + page_size < len(records):
+            result['nextPageToken'] = str(start + page_size)
+        return result
@@ -0,0 +1,241 @@
+"""
+Offline WhatsApp Web fixture server - Silver Tier
+
+Serves a synthetic WhatsApp Web chat list whose markup is generated from the
+current SELECTORS in watchers/whatsapp_watcher.py, so the watcher can be
+tested and benchmarked without a phone session or QR scan. A background
+thread mutates the list on a schedule (new message -> preview, time, unread
+badge, move to top) and records every mutation as ground truth.
+
+The page picks up mutations by fetching /rows once per REFRESH_MS and
+replacing the chat list (which the watcher's MutationObserver sees); a
+reload renders the current state server side. Some chats can be rendered
+without a <time> element (untimed_ratio), like chats WhatsApp shows with no
+timestamp.
+
+Usage:
+======
+from whatsapp_fixture_server import FixtureServer
+server = FixtureServer(chats=50, mutate_interval=2.0).start()
+watcher = WhatsAppWatcher(needs_action_path, url=server.url, headless=True)
+
+Or standalone:
+    python benchmarks/whatsapp_fixture_server.py [port] [chats] [mutate_interval]
+"""
+
+import re
+import sys
+import html
+import json
+import time
+import random
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'watchers'))
+
+from whatsapp_watcher import SELECTORS
+
+# Page refresh period; kept above Playwright's 500 ms networkidle window
+REFRESH_MS = 1000
+
+PREVIEWS = [
+    'Can you send the invoice today?', 'See you tomorrow', 'urgent: server is down',
+    'Thanks!', 'Meeting moved to 3pm', 'Payment received', 'Please reply asap',
+    'Deadline is Friday', 'Call me when free', 'Sounds good',
+]
+
+_ATTRIBUTE = re.compile(r'\[(?P<name>[\w-]+)(?:(?P<op>\*?=)"(?P<value>[^"]*)")?\]')
+
+
+def element(selector: str, content: str = '', **attributes) -> str:
+    """
+    Render an element matching the last compound of a CSS selector.
+
+    Exact attributes ([a="v"]) are copied; substring attributes ([a*="v"])
+    take the keyword argument of the same name (dashes as underscores),
+    which must contain the substring. Extra keyword arguments are added as
+    plain attributes.
+    """
+    compound = selector.split()[-1]
+    tag = re.match(r'[a-z]+', compound)
+    tag = tag.group(0) if tag else 'div'
+
+    rendered = {}
+    for match in _ATTRIBUTE.finditer(compound):
+        name, op, literal = match['name'], match['op'], match['value'] or ''
+        key = name.replace('-', '_')
+        if op == '*=':
+            value = attributes.pop(key, literal)
+            if literal not in value:
+                raise ValueError(f"{name}={value!r} does not satisfy {match.group(0)}")
+            rendered[name] = value
+        else:
+            rendered[name] = literal
+    for key, value in attributes.items():
+        rendered[key.replace('_', '-')] = value
+
+    attrs = ''.join(f' {name}="{html.escape(str(value))}"' for name, value in rendered.items())
+    return f"<{tag}{attrs}>{content}</{tag}>"
+
+
+class FixtureServer:
+    """Local HTTP server with a mutating, SELECTORS-conformant chat list."""
+
+    def __init__(self, chats: int = 50, mutate_interval: float = 2.0, untimed_ratio: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: int = 7):
+        self.random = random.Random(seed)
+        self.mutate_interval = mutate_interval
+        self.version = 0
+        self.events = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._mutator = None
+
+        now = time.time()
+        self.chats = [{
+            'name': f"Contact {i:03d}",
+            'preview': self.random.choice(PREVIEWS),
+            'time': None if self.random.random() < untimed_ratio else self._iso(now - (i + 1) * 600),
+            'unread': 0,
+        } for i in range(chats)]
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == '/':
+                    body, content_type = server.render_page().encode('utf-8'), 'text/html; charset=utf-8'
+                elif parsed.path == '/rows':
+                    since = int(parse_qs(parsed.query).get('since', ['-1'])[0])
+                    with server._lock:
+                        if since == server.version:
+                            self.send_response(204)
+                            self.end_headers()
+                            return
+                        payload = {'version': server.version, 'html': server.render_rows()}
+                    body, content_type = json.dumps(payload).encode('utf-8'), 'application/json'
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @staticmethod
+    def _iso(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def render_row(self, chat: dict) -> str:
+        name = element(SELECTORS['chat_name'], element('span', html.escape(chat['name']), title=chat['name'], dir='auto'))
+        parts = [name]
+        if chat['time']:
+            parts.append(element(SELECTORS['last_message_time'], chat['time'][11:16], datetime=chat['time']))
+        parts.append(element(SELECTORS['message_preview'], html.escape(chat['preview']),
+                             title=f"{chat['name']}: {chat['preview']}", dir='ltr'))
+        if chat['unread']:
+            parts.append(element(SELECTORS['unread_indicator'], str(chat['unread']),
+                                 aria_label=f"{chat['unread']} unread messages"))
+        row = element(SELECTORS['chat_list'], ''.join(parts), tabindex='-1')
+        return f'<div role="listitem">{row}</div>'
+
+    def render_rows(self) -> str:
+        return '\n'.join(self.render_row(chat) for chat in self.chats)
+
+    def render_page(self) -> str:
+        with self._lock:
+            rows, version = self.render_rows(), self.version
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>WhatsApp</title>
+<style>#pane-side {{ height: 720px; width: 420px; overflow-y: auto; }}</style></head>
+<body>
+<div id="pane-side"><div aria-label="Chat list" role="grid" id="grid">
+{rows}
+</div></div>
+<script>
+  let version = {version};
+  async function refresh() {{
+    try {{
+      const response = await fetch('/rows?since=' + version);
+      if (response.status === 200) {{
+        const data = await response.json();
+        version = data.version;
+        document.getElementById('grid').innerHTML = data.html;
+      }}
+    }} catch (e) {{}}
+    setTimeout(refresh, {REFRESH_MS});
+  }}
+  setTimeout(refresh, {REFRESH_MS});
+</script>
+</body>
+</html>"""
+
+    def mutate(self):
+        """Deliver one new message to a random chat and move it to the top."""
+        with self._lock:
+            # Recent chats are the busiest, like a real account
+            index = min(int(self.random.expovariate(1 / 8)), len(self.chats) - 1)
+            chat = self.chats.pop(index)
+            chat['preview'] = self.random.choice(PREVIEWS)
+            chat['unread'] += 1
+            now = time.time()
+            if chat['time'] is not None:
+                chat['time'] = self._iso(now)
+            self.chats.insert(0, chat)
+            self.version += 1
+            self.events.append({'name': chat['name'], 'preview': chat['preview'], 'at': now})
+
+    def _mutate_loop(self):
+        while not self._stop.wait(self.mutate_interval):
+            self.mutate()
+
+    def start(self) -> 'FixtureServer':
+        self._thread.start()
+        if self.mutate_interval:
+            self._mutator = threading.Thread(target=self._mutate_loop, daemon=True)
+            self._mutator.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8086
+    chats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    mutate_interval = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+
+    server = FixtureServer(chats=chats, mutate_interval=mutate_interval, port=port).start()
+    print(f"WhatsApp fixture serving {chats} chats at {server.url} (mutating every {mutate_interval:g}s)")
+    print("Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
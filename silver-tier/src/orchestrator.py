@@ -1,13 +1,19 @@
 """
 Orchestrator for Personal AI Employee - Silver Tier
 
-Polls Needs_Action/ folder every 30 seconds.
+Watches Needs_Action/ and the approval folders (Pending_Approval/,
+Approved/, Rejected/) for filesystem events and runs only the affected
+folder's handler, so an approval executes within a second of the move.
+Falls back to polling every 30 seconds when watchdog is not installed.
 When files are detected, prompts user to process them with Qwen.
 Handles Human-in-the-Loop (HITL) approval workflow.
 """
 
+import os
+import sys
 import time
 import shutil
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -18,6 +24,16 @@ except ImportError:
     EMAIL_MCP_AVAILABLE = False
     print("⚠️  email_mcp not available. Install: pip install python-dotenv")
 
+# Modules shared with the watchers (signature_index.py)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'watchers'))
+from signature_index import SignatureIndex, file_signature
+
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
 
 # Folder paths
 FOLDER_PENDING = Path('Pending_Approval')
@@ -36,9 +52,32 @@ for folder in [FOLDER_PENDING, FOLDER_APPROVED, FOLDER_REJECTED, FOLDER_DONE,
 # Approval log file
 APPROVAL_LOG = FOLDER_LOGS / 'approval_log.txt'
 
+# Which Pending_Approval/ files were already announced, kept outside the
+# documents (see signature_index.py)
+NOTIFICATION_INDEX_FILE = Path('State') / 'approval_notifications.sqlite3'
+NOTIFICATIONS = SignatureIndex(NOTIFICATION_INDEX_FILE, table='notified', time_column='notified_at')
+
 # Time-based triggers
 LAST_DAILY_BRIEFING = None  # Track to avoid duplicate briefings
 
+# Queue sizes last announced (avoid repeating the same prompt)
+LAST_CHECK_COUNT = 0
+LAST_PENDING_COUNT = 0
+
+# Event-driven loop (see run_orchestrator)
+DEBOUNCE_SECONDS = 0.2  # Quiet time before a changed folder is handled
+DEBOUNCE_MAX_WAIT = 1.0  # Handle a folder at most this long after its first event
+# Needs_Action/ only reprints the processing prompt; wait for a burst (Inbox
+# unzip, mail backlog) to settle, and repeat it at most every 30 s while it lasts
+NEEDS_ACTION_DEBOUNCE_SECONDS = 5.0
+NEEDS_ACTION_DEBOUNCE_MAX_WAIT = 30.0
+RECONCILE_INTERVAL = 300  # Full pass over all folders (safety net)
+TRIGGER_INTERVAL = 30  # Time-based trigger checks
+POLL_INTERVAL = 30  # Full pass interval without watchdog
+
+# Events that can change a folder's contents; our own reads (opened, closed_no_write) are ignored
+ROUTED_EVENT_TYPES = {'created', 'modified', 'moved', 'deleted', 'closed'}
+
 
 def log_approval_action(message: str):
     """Log approval workflow actions to file."""
@@ -203,18 +242,39 @@ def get_needs_action_files(needs_action_path: Path) -> list:
     return files, metadata_files
 
 
-def get_pending_approval_files(pending_path: Path) -> list:
-    """Get list of NEW pending approval files (not yet notified)."""
+def get_pending_approval_files(pending_path: Path, index: SignatureIndex = None) -> list:
+    """
+    Get list of NEW pending approval files (not yet notified), as (name, signature).
+
+    Files whose (inode, size, mtime) matches the notification index cost one
+    stat and no read. Only files missing from the index are read, for the
+    legacy appended NOTIFIED: marker; those are indexed so they are never
+    read again. Index entries of files no longer pending are dropped.
+    """
     if not pending_path.exists():
         return []
 
+    index = index or NOTIFICATIONS
+    known = index.entries()
+    present = set()
     pending = []
-    for item in pending_path.iterdir():
-        if item.is_file() and item.suffix == '.md':
-            # Check if this is a new file (not yet processed)
-            content = item.read_text(encoding='utf-8')
-            if 'NOTIFIED:' not in content:
-                pending.append(item.name)
+    with os.scandir(pending_path) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith('.md'):
+                continue
+            present.add(entry.name)
+            signature = file_signature(entry.stat())
+            if known.get(entry.name) == signature:
+                continue
+            if entry.name not in known:
+                # Legacy marker from before the index; checked once per file
+                content = Path(entry.path).read_text(encoding='utf-8')
+                if 'NOTIFIED:' in content:
+                    index.record(entry.name, signature)
+                    continue
+            pending.append((entry.name, signature))
+
+    index.forget({name: signature for name, signature in known.items() if name not in present})
     return pending
 
 
@@ -464,10 +524,288 @@ End your response with: `<TASK_COMPLETE>`
     return prompt
 
 
+def run_time_triggers():
+    """Print prompts for any time-based trigger that is due."""
+    triggers = check_time_based_triggers()
+
+    if 'daily_briefing' in triggers:
+        print("\n" + "=" * 60)
+        print("📊 Generating Daily Briefing...")
+        print("=" * 60)
+        print("\n📋 Paste the following prompt into Qwen chat:\n")
+        print("-" * 60)
+
+        prompt = generate_daily_briefing_prompt()
+        print(prompt)
+
+        print("-" * 60)
+        print("\nWaiting for changes...\n")
+
+    if 'end_of_day_summary' in triggers:
+        print("\n" + "=" * 60)
+        print("🌆 Generating End of Day Summary...")
+        print("=" * 60)
+        print("\n📋 Paste the following prompt into Qwen chat:\n")
+        print("-" * 60)
+
+        prompt = generate_end_of_day_summary_prompt()
+        print(prompt)
+
+        print("-" * 60)
+        print("\nWaiting for changes...\n")
+
+
+def process_approved():
+    """HITL workflow: execute everything in Approved/."""
+    approved_files = get_approved_files(FOLDER_APPROVED)
+
+    if approved_files:
+        print("\n" + "=" * 60)
+        print(f"✅ Approved actions ready: {len(approved_files)}")
+        print("=" * 60)
+
+        for filename in approved_files:
+            filepath = FOLDER_APPROVED / filename
+            print(f"\n📄 Processing approval: {filename}")
+
+            # Execute the approved action
+            result = execute_approved_action(filepath)
+
+            if result['success']:
+                print(f"   ✅ SUCCESS: {result['message']}")
+                if result.get('message_id'):
+                    print(f"   📧 Message ID: {result['message_id']}")
+
+                # Move to Done/
+                done_path = FOLDER_DONE / filename
+                shutil.move(str(filepath), str(done_path))
+                log_approval_action(f"EXECUTED: {filename} → {result['message']}")
+
+            else:
+                print(f"   ⚠️  {result['message']}")
+                # Keep in Approved/ for manual review
+                log_approval_action(f"FAILED: {filename} → {result['message']}")
+
+        print("\n" + "-" * 60)
+
+
+def process_rejected():
+    """HITL workflow: log and archive everything in Rejected/."""
+    rejected_files = get_approved_files(FOLDER_REJECTED)
+
+    if rejected_files:
+        print("\n" + "=" * 60)
+        print(f"❌ Rejected actions: {len(rejected_files)}")
+        print("=" * 60)
+
+        for filename in rejected_files:
+            filepath = FOLDER_REJECTED / filename
+            print(f"\n📄 Rejected: {filename}")
+
+            # Update file with rejection timestamp
+            content = filepath.read_text(encoding='utf-8')
+            if 'Rejected by user' not in content:
+                content += f"\n\n**Rejected:** {datetime.now().isoformat()}\n**Status:** Rejected by user"
+                filepath.write_text(content, encoding='utf-8')
+
+            # Move to Done/
+            done_path = FOLDER_DONE / f"REJECTED_{filename}"
+            shutil.move(str(filepath), str(done_path))
+            log_approval_action(f"REJECTED: {filename}")
+
+        print("\n" + "-" * 60)
+
+
+def process_pending():
+    """Announce new requests in Pending_Approval/."""
+    global LAST_PENDING_COUNT
+
+    pending_files = get_pending_approval_files(FOLDER_PENDING)
+
+    if pending_files:
+        print("\n" + "=" * 60)
+        print(f"⚠️  Approval needed: {len(pending_files)} file(s)")
+        print("=" * 60)
+
+        for filename, signature in pending_files:
+            filepath = FOLDER_PENDING / filename
+            print(f"\n📋 {filename}")
+
+            # Parse to show action type
+            parsed = parse_approval_file(filepath)
+            action = parsed['action'] or 'Unknown'
+            to_addr = parsed['to'] or 'N/A'
+            subject = parsed['subject'] or 'N/A'
+
+            print(f"   Action: {action}")
+            print(f"   To: {to_addr}")
+            print(f"   Subject: {subject}")
+            print(f"   → Review: Pending_Approval/{filename}")
+            print(f"   → To approve: Move to Approved/")
+            print(f"   → To reject: Move to Rejected/")
+
+            # Mark as notified (so we don't show again); the file itself is left untouched
+            NOTIFICATIONS.record(filename, signature)
+
+        print("\n" + "-" * 60)
+        LAST_PENDING_COUNT = len(pending_files)
+
+    elif LAST_PENDING_COUNT > 0:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] All approvals processed")
+        LAST_PENDING_COUNT = 0
+
+
+def process_needs_action():
+    """Prompt for processing when the Needs_Action/ queue changes."""
+    global LAST_CHECK_COUNT
+
+    files, metadata_files = get_needs_action_files(FOLDER_NEEDS_ACTION)
+    current_count = len(files)
+
+    if current_count > 0 and current_count != LAST_CHECK_COUNT:
+        print("\n" + "=" * 60)
+        print(f"⚠️  New files detected! ({current_count} files)")
+        print("=" * 60)
+        print("\n📋 Paste the following prompt into Qwen chat:\n")
+        print("-" * 60)
+
+        prompt = generate_qwen_prompt(files, metadata_files)
+        print(prompt)
+
+        print("-" * 60)
+        print("\nWaiting for changes...\n")
+        LAST_CHECK_COUNT = current_count
+
+    elif current_count == 0:
+        if LAST_CHECK_COUNT > 0:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Queue is now empty")
+        LAST_CHECK_COUNT = 0
+
+
+# Folder -> handler, in the order a pass runs them
+FOLDER_HANDLERS = (
+    (FOLDER_APPROVED, process_approved),
+    (FOLDER_REJECTED, process_rejected),
+    (FOLDER_PENDING, process_pending),
+    (FOLDER_NEEDS_ACTION, process_needs_action),
+)
+
+
+class FolderEvents:
+    """
+    Debounced record of which watched folders changed.
+
+    Passed to a watchdog Observer as the event handler (it only needs
+    dispatch()). The main loop calls wait(), which returns a folder once its
+    events have been quiet for DEBOUNCE_SECONDS (or DEBOUNCE_MAX_WAIT after
+    its first event), so a burst of writes to one folder runs its handler
+    once. debounce overrides both per folder: (quiet seconds, max wait).
+    """
+
+    def __init__(self, folders: list, debounce: dict = None):
+        self.folders = {str(folder.absolute()): folder for folder in folders}
+        self.debounce = debounce or {}
+        # folder -> [first event, last event] since it was last handled
+        self._dirty = {}
+        self._cond = threading.Condition()
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in ROUTED_EVENT_TYPES:
+            return
+        paths = [event.src_path, getattr(event, 'dest_path', '')]
+        now = time.monotonic()
+        with self._cond:
+            for path in paths:
+                folder = self.folders.get(os.path.dirname(os.fsdecode(path))) if path else None
+                if folder is not None:
+                    self._dirty.setdefault(folder, [now, now])[1] = now
+            self._cond.notify()
+
+    def _due_in(self, folder: Path, now: float) -> float:
+        """Seconds until a dirty folder's debounce expires (<= 0: due now)."""
+        first, last = self._dirty[folder]
+        quiet, max_wait = self.debounce.get(folder, (DEBOUNCE_SECONDS, DEBOUNCE_MAX_WAIT))
+        return min(last + quiet, first + max_wait) - now
+
+    def wait(self, timeout: float) -> set:
+        """Block until some folder's changes settle or timeout passes; returns (and clears) those folders."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                due_in = {folder: self._due_in(folder, now) for folder in self._dirty}
+                due = {folder for folder, left in due_in.items() if left <= 0}
+                if due:
+                    for folder in due:
+                        del self._dirty[folder]
+                    return due
+                remaining = deadline - now
+                if remaining <= 0:
+                    return set()
+                self._cond.wait(min([remaining, *due_in.values()]))
+
+
+def start_folder_observer(events: FolderEvents):
+    """Watch every handler folder (non-recursive); returns the running Observer."""
+    observer = Observer()
+    for folder, _ in FOLDER_HANDLERS:
+        observer.schedule(events, str(folder.absolute()), recursive=False)
+    observer.start()
+    return observer
+
+
+def run_orchestrator(stop_event: threading.Event = None):
+    """
+    Run the orchestrator until stop_event is set (or forever).
+
+    With watchdog, each change to a handler folder runs only that folder's
+    handler, after a short debounce (a longer one for Needs_Action/, whose
+    handler only reprints the prompt). A full pass over all folders still runs
+    every RECONCILE_INTERVAL seconds as a safety net (missed events, folders
+    recreated). Without watchdog, every folder is polled each POLL_INTERVAL.
+    """
+    stop_event = stop_event or threading.Event()
+    all_folders = {folder for folder, _ in FOLDER_HANDLERS}
+
+    debounce = {FOLDER_NEEDS_ACTION: (NEEDS_ACTION_DEBOUNCE_SECONDS, NEEDS_ACTION_DEBOUNCE_MAX_WAIT)}
+    events = FolderEvents(list(all_folders), debounce) if WATCHDOG_AVAILABLE else None
+    observer = start_folder_observer(events) if events else None
+
+    next_reconcile = next_trigger = time.monotonic()
+    try:
+        while not stop_event.is_set():
+            now = time.monotonic()
+            # Wake at least once a second to notice stop_event
+            timeout = max(0.0, min(next_reconcile, next_trigger, now + 1.0) - now)
+            if events:
+                dirty = events.wait(timeout)
+            else:
+                stop_event.wait(timeout)
+                dirty = set()
+            now = time.monotonic()
+
+            if now >= next_trigger:
+                run_time_triggers()
+                next_trigger = now + TRIGGER_INTERVAL
+
+            if now >= next_reconcile:
+                # Ensure directories exist, then check every folder
+                for folder in all_folders | {FOLDER_DONE, FOLDER_PLANS}:
+                    folder.mkdir(exist_ok=True)
+                dirty = set(all_folders)
+                next_reconcile = now + (RECONCILE_INTERVAL if events else POLL_INTERVAL)
+
+            for folder, handler in FOLDER_HANDLERS:
+                if folder in dirty:
+                    handler()
+    finally:
+        if observer:
+            observer.stop()
+            observer.join()
+
+
 def main():
     """Main function to run the orchestrator loop with HITL approval workflow."""
-    global LAST_DAILY_BRIEFING
-    
     print("=" * 60)
     print("🤖 Personal AI Employee - Orchestrator (Silver Tier)")
     print("=" * 60)
@@ -477,7 +815,10 @@ def main():
     print(f"❌ Rejected: {FOLDER_REJECTED.absolute()}")
     print(f"💾 Done: {FOLDER_DONE.absolute()}")
     print(f"📋 Plans: {FOLDER_PLANS.absolute()}")
-    print("Polling interval: 30 seconds")
+    if WATCHDOG_AVAILABLE:
+        print(f"Mode: filesystem events (full rescan every {RECONCILE_INTERVAL} seconds)")
+    else:
+        print(f"Polling interval: {POLL_INTERVAL} seconds (pip install watchdog for instant reactions)")
     print("Time-based triggers: Daily Briefing (8 AM), EOD Summary (5 PM)")
     if EMAIL_MCP_AVAILABLE:
         print("📧 Email MCP: ✓ Available")
@@ -485,175 +826,8 @@ def main():
         print("📧 Email MCP: ✗ Not available (install python-dotenv)")
     print("Press Ctrl+C to stop\n")
 
-    last_check_count = 0
-    last_pending_count = 0
-
     try:
-        while True:
-            # Ensure directories exist
-            for folder in [FOLDER_PENDING, FOLDER_APPROVED, FOLDER_REJECTED,
-                          FOLDER_DONE, FOLDER_NEEDS_ACTION, FOLDER_PLANS]:
-                if not folder.exists():
-                    folder.mkdir(exist_ok=True)
-
-            # =============================================
-            # TIME-BASED TRIGGERS (Daily Briefing, etc.)
-            # =============================================
-            triggers = check_time_based_triggers()
-            
-            if 'daily_briefing' in triggers:
-                print("\n" + "=" * 60)
-                print("📊 Generating Daily Briefing...")
-                print("=" * 60)
-                print("\n📋 Paste the following prompt into Qwen chat:\n")
-                print("-" * 60)
-                
-                prompt = generate_daily_briefing_prompt()
-                print(prompt)
-                
-                print("-" * 60)
-                print("\nWaiting for next check in 30 seconds...\n")
-
-            if 'end_of_day_summary' in triggers:
-                print("\n" + "=" * 60)
-                print("🌆 Generating End of Day Summary...")
-                print("=" * 60)
-                print("\n📋 Paste the following prompt into Qwen chat:\n")
-                print("-" * 60)
-                
-                prompt = generate_end_of_day_summary_prompt()
-                print(prompt)
-                
-                print("-" * 60)
-                print("\nWaiting for next check in 30 seconds...\n")
-
-            # =============================================
-            # HITL WORKFLOW: Check Approved/ for execution
-            # =============================================
-            approved_files = get_approved_files(FOLDER_APPROVED)
-            
-            if approved_files:
-                print("\n" + "=" * 60)
-                print(f"✅ Approved actions ready: {len(approved_files)}")
-                print("=" * 60)
-
-                for filename in approved_files:
-                    filepath = FOLDER_APPROVED / filename
-                    print(f"\n📄 Processing approval: {filename}")
-
-                    # Execute the approved action
-                    result = execute_approved_action(filepath)
-
-                    if result['success']:
-                        print(f"   ✅ SUCCESS: {result['message']}")
-                        if result.get('message_id'):
-                            print(f"   📧 Message ID: {result['message_id']}")
-                        
-                        # Move to Done/
-                        done_path = FOLDER_DONE / filename
-                        shutil.move(str(filepath), str(done_path))
-                        log_approval_action(f"EXECUTED: {filename} → {result['message']}")
-                        
-                    else:
-                        print(f"   ⚠️  {result['message']}")
-                        # Keep in Approved/ for manual review
-                        log_approval_action(f"FAILED: {filename} → {result['message']}")
-
-                print("\n" + "-" * 60)
-
-            # =============================================
-            # HITL WORKFLOW: Check Rejected/ for logging
-            # =============================================
-            rejected_files = get_approved_files(FOLDER_REJECTED)
-            
-            if rejected_files:
-                print("\n" + "=" * 60)
-                print(f"❌ Rejected actions: {len(rejected_files)}")
-                print("=" * 60)
-
-                for filename in rejected_files:
-                    filepath = FOLDER_REJECTED / filename
-                    print(f"\n📄 Rejected: {filename}")
-                    
-                    # Update file with rejection timestamp
-                    content = filepath.read_text(encoding='utf-8')
-                    if 'Rejected by user' not in content:
-                        content += f"\n\n**Rejected:** {datetime.now().isoformat()}\n**Status:** Rejected by user"
-                        filepath.write_text(content, encoding='utf-8')
-                    
-                    # Move to Done/
-                    done_path = FOLDER_DONE / f"REJECTED_{filename}"
-                    shutil.move(str(filepath), str(done_path))
-                    log_approval_action(f"REJECTED: {filename}")
-
-                print("\n" + "-" * 60)
-
-            # =============================================
-            # Check Pending_Approval/ for new requests
-            # =============================================
-            pending_files = get_pending_approval_files(FOLDER_PENDING)
-            
-            if pending_files:
-                print("\n" + "=" * 60)
-                print(f"⚠️  Approval needed: {len(pending_files)} file(s)")
-                print("=" * 60)
-
-                for filename in pending_files:
-                    filepath = FOLDER_PENDING / filename
-                    print(f"\n📋 {filename}")
-                    
-                    # Parse to show action type
-                    parsed = parse_approval_file(filepath)
-                    action = parsed['action'] or 'Unknown'
-                    to_addr = parsed['to'] or 'N/A'
-                    subject = parsed['subject'] or 'N/A'
-                    
-                    print(f"   Action: {action}")
-                    print(f"   To: {to_addr}")
-                    print(f"   Subject: {subject}")
-                    print(f"   → Review: Pending_Approval/{filename}")
-                    print(f"   → To approve: Move to Approved/")
-                    print(f"   → To reject: Move to Rejected/")
-                    
-                    # Mark as notified (so we don't show again)
-                    content = filepath.read_text(encoding='utf-8')
-                    content += f"\n\n**NOTIFIED:** {datetime.now().isoformat()}"
-                    filepath.write_text(content, encoding='utf-8')
-
-                print("\n" + "-" * 60)
-                last_pending_count = len(pending_files)
-
-            elif last_pending_count > 0:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] All approvals processed")
-                last_pending_count = 0
-
-            # =============================================
-            # Check Needs_Action/ for new files
-            # =============================================
-            files, metadata_files = get_needs_action_files(FOLDER_NEEDS_ACTION)
-            current_count = len(files)
-
-            if current_count > 0 and current_count != last_check_count:
-                print("\n" + "=" * 60)
-                print(f"⚠️  New files detected! ({current_count} files)")
-                print("=" * 60)
-                print("\n📋 Paste the following prompt into Qwen chat:\n")
-                print("-" * 60)
-
-                prompt = generate_qwen_prompt(files, metadata_files)
-                print(prompt)
-
-                print("-" * 60)
-                print("\nWaiting for next check in 30 seconds...\n")
-                last_check_count = current_count
-
-            elif current_count == 0:
-                if last_check_count > 0:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Queue is now empty")
-                last_check_count = 0
-
-            time.sleep(30)
-
+        run_orchestrator()
     except KeyboardInterrupt:
         print("\n\nStopping orchestrator...")
         print("Orchestrator stopped.")
@@ -12,6 +12,7 @@ Features:
 - Generates Plans/*.md files
 - Moves processed files to Done/
 - Creates approval requests for sensitive actions
+- Skips repeat file drops (metadata with duplicate_of:)
 """
 
 import shutil
@@ -369,9 +370,15 @@ def run_reasoning_loop():
     
     # Read and categorize all files
     categorized_files = []
+    duplicates = []
     for md_file in md_files:
         try:
             metadata = read_file_metadata(md_file)
+            if metadata.get('duplicate_of'):
+                # Repeat drop of content already in the pipeline; nothing new to reason about
+                duplicates.append(md_file)
+                log_message(f"   [SKIP] {md_file.name} (duplicate of {metadata['duplicate_of'].strip(chr(34))})")
+                continue
             categorized = categorize_file(metadata)
             categorized_files.append(categorized)
             
@@ -381,8 +388,15 @@ def run_reasoning_loop():
         except Exception as e:
             log_message(f"   [ERR] Error reading {md_file.name}: {e}")
     
+    # Duplicate references go straight to Done/
+    for md_file in duplicates:
+        shutil.move(str(md_file), str(FOLDER_DONE / md_file.name))
+
     if not categorized_files:
-        log_message("[ERR] No valid files to process")
+        if duplicates:
+            log_message(f"[OK] Only duplicates found; {len(duplicates)} moved to Done/")
+        else:
+            log_message("[ERR] No valid files to process")
         return
     
     print()
@@ -411,6 +425,7 @@ def run_reasoning_loop():
     print(f"  - Emails: {len([f for f in categorized_files if f['category'] == 'email'])}")
     print(f"  - Messages: {len([f for f in categorized_files if f['category'] == 'message'])}")
     print(f"  - Documents: {len([f for f in categorized_files if f['category'] == 'document'])}")
+    print(f"Duplicates Skipped: {len(duplicates)}")
     print(f"Approval Needed: {len(approval_items)}")
     print(f"Plan Created: {plan_path.name}")
     print(f"Log File: {REASONING_LOG}")
@@ -0,0 +1,156 @@
+"""
+Watcher Runtime for Personal AI Employee - Silver Tier
+
+Shared BaseWatcher used by the Gmail and WhatsApp watchers.
+
+- Adaptive polling: the interval backs off while idle and snaps back to the
+  minimum as soon as items are flowing, with jitter so watchers don't align
+- wake() cuts a sleep short (push notifications, browser events)
+- Per-cycle timing stats go to a common metrics sink
+  (Logs/watcher_metrics.jsonl, one JSON object per line)
+"""
+
+import json
+import time
+import random
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Optional
+
+from dedupe_store import DedupeStore, DEDUPE_DB_FILE
+
+
+# Default base interval in seconds (watchers pass their own CHECK_INTERVAL)
+DEFAULT_CHECK_INTERVAL = 60
+
+# Adaptive polling: interval range relative to the base interval
+MIN_INTERVAL_FACTOR = 0.25
+MAX_INTERVAL_FACTOR = 4.0
+IDLE_BACKOFF = 1.5  # Multiply the interval by this after each idle cycle
+JITTER = 0.1  # +/- 10% random jitter on every sleep
+
+# Common metrics sink shared by all watchers
+METRICS_FILE = Path('Logs') / 'watcher_metrics.jsonl'
+
+
+class AdaptiveInterval:
+    """Computes the next poll interval from how many items the last cycle found."""
+
+    def __init__(self, base: float, min_interval: Optional[float] = None,
+                 max_interval: Optional[float] = None, backoff: float = IDLE_BACKOFF,
+                 jitter: float = JITTER):
+        self.base = base
+        self.min_interval = min_interval if min_interval is not None else base * MIN_INTERVAL_FACTOR
+        self.max_interval = max_interval if max_interval is not None else base * MAX_INTERVAL_FACTOR
+        self.backoff = backoff
+        self.jitter = jitter
+        self.current = base
+
+    def next(self, new_items: int) -> float:
+        if new_items > 0:
+            self.current = self.min_interval
+        else:
+            self.current = min(self.max_interval, max(self.current, self.min_interval) * self.backoff)
+        return self.current * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class MetricsSink:
+    """Append-only JSON-lines file shared by all watchers (thread safe)."""
+
+    def __init__(self, path: Path = METRICS_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def record(self, watcher: str, **fields):
+        entry = {'ts': datetime.now().isoformat(), 'watcher': watcher, **fields}
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + '\n')
+            except OSError as e:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Metrics write failed: {e}")
+
+
+class BaseWatcher:
+    """
+    Base class for all watchers in the AI Employee system.
+
+    dedupe_path=None skips the dedupe index, for watchers that only drive
+    other watchers (each with its own index) and never record IDs themselves.
+    """
+
+    def __init__(self, needs_action_path: Path, dedupe_path: Optional[Path] = DEDUPE_DB_FILE,
+                 metrics: Optional[MetricsSink] = None, namespace: Optional[str] = None):
+        self.needs_action_path = needs_action_path
+        # Persistent, bounded dedupe index shared by all watchers (see dedupe_store.py)
+        self.processed_ids: Optional[DedupeStore] = None
+        if dedupe_path is not None:
+            self.processed_ids = DedupeStore(namespace=namespace or self.__class__.__name__,
+                                             db_path=dedupe_path)
+        self.metrics = metrics or MetricsSink()
+        self.stats = {'cycles': 0, 'items': 0, 'busy_seconds': 0.0}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def check_for_new_items(self) -> int:
+        """Check for new items to process and return how many were created. Override in subclass."""
+        raise NotImplementedError
+
+    def wake(self):
+        """Cut the current sleep short and check immediately (safe from any thread)."""
+        self._wake.set()
+
+    def stop(self):
+        """Ask run() to return after the current cycle (safe from any thread)."""
+        self._stopped.set()
+        self._wake.set()
+
+    def _sleep(self, timeout: float) -> bool:
+        """Sleep until timeout or wake(); returns True if woken. Override to pump events."""
+        woken = self._wake.wait(timeout)
+        self._wake.clear()
+        return woken
+
+    def _run_cycle(self) -> tuple:
+        """Run one check; returns (new_items, duration_seconds)."""
+        start = time.perf_counter()
+        new_items = self.check_for_new_items() or 0
+        duration = time.perf_counter() - start
+
+        self.stats['cycles'] += 1
+        self.stats['items'] += new_items
+        self.stats['busy_seconds'] += duration
+        return new_items, duration
+
+    def run(self, check_interval: float = DEFAULT_CHECK_INTERVAL,
+            min_interval: Optional[float] = None, max_interval: Optional[float] = None):
+        """Run the watcher with adaptive polling until Ctrl+C or stop()."""
+        interval = AdaptiveInterval(check_interval, min_interval, max_interval)
+        name = self.__class__.__name__
+
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {name} started...")
+        print(f"Output to: {self.needs_action_path.absolute()}")
+        print(f"Check interval: {check_interval} seconds "
+              f"(adaptive {interval.min_interval:g}-{interval.max_interval:g}s)")
+        print("Press Ctrl+C to stop\n")
+
+        woken = False
+        try:
+            while not self._stopped.is_set():
+                new_items, duration = self._run_cycle()
+                sleep_for = interval.next(new_items)
+                self.metrics.record(name, duration_ms=round(duration * 1000, 1),
+                                    new_items=new_items, next_interval=round(sleep_for, 1),
+                                    woken=woken)
+                woken = self._sleep(sleep_for)
+        except KeyboardInterrupt:
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Stopping {name}...")
+
+        cycles = self.stats['cycles']
+        if cycles:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] {cycles} cycle(s), "
+                  f"{self.stats['items']} item(s), "
+                  f"avg {self.stats['busy_seconds'] / cycles * 1000:.0f} ms/cycle")
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {name} stopped.")
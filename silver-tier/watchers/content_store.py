@@ -0,0 +1,149 @@
+"""
+Content-Addressed Store for Personal AI Employee - Silver Tier
+
+Keeps every file dropped into Inbox/ exactly once, under the SHA-256 of its
+content: Store/<first two hex digits>/<digest>. A small JSON record next to
+each blob (<digest>.json) remembers the first drop (original name, metadata
+file, time), so a repeat drop of the same bytes can point back at it instead
+of creating another copy. Extraction results (extract.py) are cached the
+same way, in <digest>.extract.json.
+
+- Hashing streams the file: files of MMAP_THRESHOLD bytes and up are hashed
+  straight from a read-only memory map, smaller ones through a reused buffer
+- Blobs are placed with ingest.ingest_file(private=True): a reflink where
+  the filesystem supports it (no extra space), otherwise a copy, or a rename
+  with the 'rename' strategy. Never a hardlink - the blob would share its
+  inode with the user's file in Inbox/, and an in-place edit there would
+  change the bytes behind the digest
+- Blobs are made read-only
+- Concurrent workers dropping the same content are serialized per digest;
+  exactly one of them stores the blob
+
+Usage:
+======
+from content_store import ContentStore
+store = ContentStore()
+entry = store.put(source_path, metadata_file='FILE_..._report.pdf.md')
+if entry['duplicate']:
+    ...  # entry['metadata_file'] is the first drop's metadata
+"""
+
+import os
+import json
+import mmap
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from ingest import ingest_file, INGEST_STRATEGY
+
+
+# Default store location, next to State/ in the vault
+STORE_DIR = Path('Store')
+
+DIGEST_ALGORITHM = 'sha256'
+
+# Files this large and up are hashed through mmap
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Read buffer for smaller files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Striped locks serializing puts of the same digest
+LOCK_STRIPES = 64
+
+
+def file_digest(path: Path) -> str:
+    """Hex SHA-256 of a file's content, without loading it into memory."""
+    digest = hashlib.new(DIGEST_ALGORITHM)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+                digest.update(view[:count])
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """Stores files once under their content digest."""
+
+    def __init__(self, root: Path = STORE_DIR, strategy: str = INGEST_STRATEGY):
+        self.root = Path(root)
+        self.strategy = strategy
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _record_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        return self._locks[int(digest[:8], 16) % LOCK_STRIPES]
+
+    def get(self, digest: str) -> dict:
+        """The record of a stored digest, or None."""
+        try:
+            return json.loads(self._record_path(digest).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+
+    def _extraction_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.extract.json"
+
+    def extraction(self, digest: str) -> dict:
+        """Cached extraction result (see extract.py) for a stored digest, or None."""
+        try:
+            return json.loads(self._extraction_path(digest).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save_extraction(self, digest: str, result: dict):
+        temp = self._extraction_path(digest).with_suffix('.tmp')
+        temp.write_text(json.dumps(result, indent=2), encoding='utf-8')
+        os.replace(temp, self._extraction_path(digest))
+
+    def put(self, source: Path, metadata_file: str = '') -> dict:
+        """
+        Store source under its digest unless the content is already stored.
+
+        Returns the digest, the blob path, the first drop's record and
+        'duplicate' (True when the content was already in the store).
+        """
+        source = Path(source)
+        digest = file_digest(source)
+        blob = self.blob_path(digest)
+
+        with self._lock_for(digest):
+            record = self.get(digest)
+            duplicate = record is not None and blob.exists()
+            if not duplicate:
+                blob.parent.mkdir(exist_ok=True)
+                blob.unlink(missing_ok=True)
+                # 'hardlink' falls back to a private copy
+                strategy = 'auto' if self.strategy == 'hardlink' else self.strategy
+                method = ingest_file(source, blob, strategy, private=True)
+                blob.chmod(0o444)
+                record = {
+                    'digest': f"{DIGEST_ALGORITHM}:{digest}",
+                    'size': blob.stat().st_size,
+                    'original_name': source.name,
+                    'metadata_file': metadata_file,
+                    'stored_at': datetime.now().isoformat(),
+                    'ingested_via': method,
+                }
+                temp = self._record_path(digest).with_suffix('.tmp')
+                temp.write_text(json.dumps(record, indent=2), encoding='utf-8')
+                os.replace(temp, self._record_path(digest))
+
+        return {**record, 'blob': blob, 'duplicate': duplicate}
@@ -0,0 +1,180 @@
+"""
+Dedupe Store for Personal AI Employee - Silver Tier
+
+Persistent, bounded replacement for the in-memory `processed_ids` set used
+by the watchers. One SQLite database (State/dedupe.sqlite3) is shared by all
+watchers; each watcher keeps its IDs under its own namespace.
+
+- A fixed-size bloom filter answers "never seen" without touching disk
+- SQLite (primary key lookup) confirms bloom filter hits; a hit rewrites
+  last_seen only once it is REFRESH_FRACTION of the TTL old, so lookups of
+  recently seen IDs stay read-only
+- Entries expire after TTL_DAYS and the oldest are evicted beyond
+  MAX_ENTRIES, so memory and disk stay flat over weeks of uptime
+- IDs survive restarts, so a restart never recreates Needs_Action files
+
+Usage:
+======
+from dedupe_store import DedupeStore
+processed_ids = DedupeStore(namespace='GmailWatcher')
+if message_id not in processed_ids:
+    ...
+    processed_ids.add(message_id)
+"""
+
+import math
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Iterable
+
+
+# Default database shared by all watchers
+DEDUPE_DB_FILE = Path('State') / 'dedupe.sqlite3'
+
+# Retention limits per namespace
+MAX_ENTRIES = 100_000
+TTL_DAYS = 30
+
+# Run TTL/size eviction after this many inserts
+EVICT_EVERY = 1000
+
+# A hit refreshes last_seen only when it is older than this fraction of the TTL
+REFRESH_FRACTION = 0.1
+
+# Target false-positive rate of the bloom filter
+BLOOM_ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """Fixed-size bloom filter; memory is set by capacity, not by inserts."""
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+
+
+class DedupeStore:
+    """
+    Set-like store of processed item IDs for one watcher namespace.
+
+    Supports `item_id in store` and `store.add(item_id)` so it drops in
+    where a plain set was used. Safe to share across threads.
+    """
+
+    def __init__(self, namespace: str, db_path: Path = DEDUPE_DB_FILE,
+                 max_entries: int = MAX_ENTRIES, ttl_days: float = TTL_DAYS):
+        self.namespace = namespace
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_days * 86400
+        self.refresh_after = self.ttl_seconds * REFRESH_FRACTION
+        self.bloom = BloomFilter(max_entries)
+        self._lock = threading.Lock()
+        self._inserts_since_evict = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30,
+                                    isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS processed ('
+            ' namespace TEXT NOT NULL,'
+            ' item_id TEXT NOT NULL,'
+            ' last_seen REAL NOT NULL,'
+            ' PRIMARY KEY (namespace, item_id)'
+            ') WITHOUT ROWID'
+        )
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_processed_last_seen ON processed (namespace, last_seen)'
+        )
+
+        with self._lock:
+            self._evict()
+
+    def __contains__(self, item_id: str) -> bool:
+        if item_id not in self.bloom:
+            return False
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT last_seen FROM processed WHERE namespace = ? AND item_id = ?',
+                (self.namespace, item_id)
+            ).fetchone()
+            if row is None:
+                return False
+            # Refresh a stale last_seen so IDs still being reported are not evicted (LRU)
+            now = time.time()
+            if row[0] < now - self.refresh_after:
+                self.conn.execute(
+                    'UPDATE processed SET last_seen = ? WHERE namespace = ? AND item_id = ?',
+                    (now, self.namespace, item_id)
+                )
+            return True
+
+    def add(self, item_id: str):
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO processed (namespace, item_id, last_seen) VALUES (?, ?, ?)',
+                (self.namespace, item_id, time.time())
+            )
+            self.bloom.add(item_id)
+            self._inserts_since_evict += 1
+            if self._inserts_since_evict >= EVICT_EVERY:
+                self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT COUNT(*) FROM processed WHERE namespace = ?', (self.namespace,)
+            ).fetchone()
+        return row[0]
+
+    def _evict(self):
+        """Drop expired and least-recently-seen entries, then rebuild the bloom filter."""
+        self.conn.execute(
+            'DELETE FROM processed WHERE namespace = ? AND last_seen < ?',
+            (self.namespace, time.time() - self.ttl_seconds)
+        )
+        self.conn.execute(
+            'DELETE FROM processed WHERE namespace = ? AND item_id IN ('
+            ' SELECT item_id FROM processed WHERE namespace = ?'
+            ' ORDER BY last_seen DESC LIMIT -1 OFFSET ?)',
+            (self.namespace, self.namespace, self.max_entries)
+        )
+
+        # Bloom filters cannot delete, so rebuild from what is left. The new
+        # filter is swapped in whole: lookups check the bloom without the lock
+        # and must never see a half-built one (a false "never seen")
+        bloom = BloomFilter(self.max_entries)
+        cursor = self.conn.execute(
+            'SELECT item_id FROM processed WHERE namespace = ?', (self.namespace,)
+        )
+        for (item_id,) in cursor:
+            bloom.add(item_id)
+        self.bloom = bloom
+        self._inserts_since_evict = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,226 @@
+"""
+Content Extraction for Personal AI Employee - Silver Tier
+
+Learns what a dropped file contains once, at ingestion, so reasoning steps can
+read it from the metadata frontmatter instead of reopening the raw file:
+
+- MIME type, sniffed from the first bytes (magic numbers, ZIP member names
+  for office formats, UTF-8 check for text) with the file name as a hint
+- Plain text of text files, PDFs (needs pypdf) and office documents
+  (docx, xlsx, pptx, odt/ods/odp - read with zipfile, no dependency)
+- Page count (PDF pages, document pages, slides, sheets) and word count
+- A one-line preview of the first PREVIEW_CHARS characters
+
+extract_file() is a plain module-level function so InboxHandler can run it
+in a process pool; results are cached next to the stored blob by content
+digest (see content_store.py), so the same content is never extracted twice.
+
+Setup (optional, for PDFs):
+    pip install pypdf
+"""
+
+import re
+import codecs
+import zipfile
+import mimetypes
+from pathlib import Path
+from xml.etree import ElementTree
+
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+
+# Bytes read for sniffing
+SNIFF_BYTES = 8192
+
+# Upper bound on extracted text kept in memory (characters); longer text is
+# cut and flagged, so words counts only the kept part
+MAX_TEXT_CHARS = 1_000_000
+
+# Largest uncompressed ZIP member (office XML part) that will be read
+MAX_ZIP_MEMBER_BYTES = 64 * 1024 * 1024
+
+PREVIEW_CHARS = 200
+
+# Magic numbers (prefix -> MIME type)
+SIGNATURES = (
+    (b'%PDF-', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'\x1f\x8b', 'application/gzip'),
+    (b'{\\rtf', 'application/rtf'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'application/x-ole-storage'),  # Legacy .doc/.xls/.ppt
+    (b'PK\x03\x04', 'application/zip'),
+)
+
+# ZIP member identifying an OOXML document
+OOXML_TYPES = {
+    'word/document.xml': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'xl/workbook.xml': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'ppt/presentation.xml': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+}
+
+_TAG = re.compile(r'<[^>]+>')
+_SPACE = re.compile(r'\s+')
+
+
+def sniff_mime(path: Path, name: str = '') -> str:
+    """MIME type from content; name (the original file name) only breaks ties."""
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    guessed = mimetypes.guess_type(name or str(path))[0]
+
+    for prefix, mime in SIGNATURES:
+        if head.startswith(prefix):
+            if mime == 'application/zip':
+                return _sniff_zip(path) or mime
+            return mime
+
+    if b'\x00' in head:
+        return guessed or 'application/octet-stream'
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return guessed or 'application/octet-stream'
+    if guessed and (guessed.startswith('text/') or guessed.endswith(('json', 'xml', 'javascript'))):
+        return guessed
+    return 'text/plain'
+
+
+def _sniff_zip(path: Path) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = set(archive.namelist())
+            for member, mime in OOXML_TYPES.items():
+                if member in names:
+                    return mime
+            if 'mimetype' in names:
+                return archive.read('mimetype').decode('ascii', 'replace').strip()
+    except (zipfile.BadZipFile, OSError):
+        pass
+    return ''
+
+
+def _read_member(archive: zipfile.ZipFile, name: str) -> bytes:
+    """Read one ZIP member, refusing oversized (zip bomb) parts before decompressing."""
+    size = archive.getinfo(name).file_size
+    if size > MAX_ZIP_MEMBER_BYTES:
+        raise ValueError(f"{name} expands to {size} bytes (limit {MAX_ZIP_MEMBER_BYTES})")
+    return archive.read(name)
+
+
+def _xml_text(data: bytes, text_tag: str = None, block_tag: str = None) -> str:
+    """
+    Text of an XML part: all text, or only elements whose local name is text_tag.
+
+    With text_tag, the runs inside each block_tag element (a paragraph, or a
+    shared string) are concatenated as-is, since producers split words across
+    runs; separate blocks are joined with newlines.
+    """
+    root = ElementTree.fromstring(data)
+    if text_tag is None:
+        return ' '.join(root.itertext())
+    blocks = []
+
+    def walk(el, runs):
+        name = el.tag.rsplit('}', 1)[-1]
+        if name == block_tag:
+            # Nested blocks (e.g. text boxes inside a paragraph) get their own line
+            runs = []
+            blocks.append(runs)
+        elif name == text_tag and el.text:
+            if runs is None:
+                blocks.append([el.text])
+            else:
+                runs.append(el.text)
+        for child in el:
+            walk(child, runs)
+
+    walk(root, None)
+    return '\n'.join(text for text in (''.join(runs) for runs in blocks) if text)
+
+
+def _app_property(archive: zipfile.ZipFile, prop: str) -> int:
+    """Pages/Slides count from docProps/app.xml, if the producer wrote it."""
+    try:
+        root = ElementTree.fromstring(_read_member(archive, 'docProps/app.xml'))
+    except (KeyError, ElementTree.ParseError):
+        return None
+    for el in root.iter():
+        if el.tag.rsplit('}', 1)[-1] == prop and el.text and el.text.isdigit():
+            return int(el.text)
+    return None
+
+
+def _extract_office(path: Path, mime: str) -> tuple:
+    """(text, pages) of an OOXML or ODF document."""
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        if mime.endswith('wordprocessingml.document'):
+            return _xml_text(_read_member(archive, 'word/document.xml'), 't', 'p'), _app_property(archive, 'Pages')
+        if mime.endswith('presentationml.presentation'):
+            slides = sorted((n for n in names if re.fullmatch(r'ppt/slides/slide\d+\.xml', n)),
+                            key=lambda n: int(re.search(r'\d+', n.rsplit('/', 1)[-1]).group()))
+            return '\n'.join(_xml_text(_read_member(archive, n), 't', 'p') for n in slides), len(slides)
+        if mime.endswith('spreadsheetml.sheet'):
+            sheets = [n for n in names if re.fullmatch(r'xl/worksheets/sheet\d+\.xml', n)]
+            text = _xml_text(_read_member(archive, 'xl/sharedStrings.xml'), 't', 'si') if 'xl/sharedStrings.xml' in names else ''
+            return text, len(sheets)
+        # OpenDocument (odt/ods/odp)
+        return _xml_text(_read_member(archive, 'content.xml')), None
+
+
+def _extract_pdf(path: Path) -> tuple:
+    reader = PdfReader(str(path))
+    parts, length = [], 0
+    for page in reader.pages:
+        if length > MAX_TEXT_CHARS:
+            # Pages left unread; one character over the limit marks the text as cut
+            break
+        text = page.extract_text() or ''
+        parts.append(text)
+        length += len(text)
+    return '\n'.join(parts), len(reader.pages)
+
+
+def extract_file(path: str, name: str = '') -> dict:
+    """
+    Sniff and extract one file (runs in a worker process).
+
+    Returns mime_type, pages, words and preview; pages/words/preview are
+    None when the type has no text extractor (or pypdf is missing for PDFs).
+    'truncated' is True when the text exceeded MAX_TEXT_CHARS; words then
+    counts only the first MAX_TEXT_CHARS characters.
+    Errors are reported in 'error' instead of raised.
+    """
+    path = Path(path)
+    result = {'mime_type': 'application/octet-stream', 'pages': None, 'words': None, 'preview': None}
+    try:
+        mime = result['mime_type'] = sniff_mime(path, name)
+        text, pages = None, None
+
+        if mime == 'application/pdf':
+            if PYPDF_AVAILABLE:
+                text, pages = _extract_pdf(path)
+        elif mime in OOXML_TYPES.values() or mime.startswith('application/vnd.oasis.opendocument'):
+            text, pages = _extract_office(path, mime)
+        elif mime.startswith('text/') or mime.endswith(('json', 'xml', 'javascript')):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read(MAX_TEXT_CHARS + 1)
+            if mime == 'text/html':
+                text = _TAG.sub(' ', text)
+
+        if text is not None:
+            result['truncated'] = len(text) > MAX_TEXT_CHARS
+            text = text[:MAX_TEXT_CHARS]
+            result['pages'] = pages
+            result['words'] = len(text.split())
+            result['preview'] = _SPACE.sub(' ', text).strip()[:PREVIEW_CHARS]
+    except Exception as error:
+        result['error'] = f"{type(error).__name__}: {error}"
+    return result
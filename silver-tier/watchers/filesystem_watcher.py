@@ -3,76 +3,505 @@ Filesystem Watcher for Personal AI Employee - Bronze Tier
 
 Monitors the Inbox/ folder and copies new files to Needs_Action/
 with accompanying metadata files.
+
+Write Completion:
+=================
+The observer thread only records events. A new file is queued for ingestion
+once it is complete: inotify reported IN_CLOSE_WRITE (on_closed, Linux), it
+was renamed into Inbox/ (finished downloads), or its size and mtime held
+steady for STABLE_CHECKS checks STABLE_INTERVAL seconds apart (other
+platforms, or writers that keep the file open). Files still changing after STABLE_TIMEOUT seconds are skipped.
+
+Batching:
+=========
+Complete files are coalesced: the batcher thread waits up to BATCH_WINDOW
+seconds after the first one (or until BATCH_SIZE are ready), ingests the
+batch on a pool of INGEST_WORKERS threads, then writes its metadata files
+and records it in the manifest in one transaction. Bursts (unzip, rsync)
+thus cost one manifest commit per batch, not per file. Names use FileIds,
+FILE_<YYYYmmdd_HHMMSS_ffffff>_<name>, which never repeat within a process.
+
+Ingestion:
+==========
+Each file is hashed and kept once in the content-addressed Store/ (see
+content_store.py), placed there by ingest.ingest_file with the
+INGEST_STRATEGY strategy as a private copy: a reflink where supported,
+otherwise copy_file_range or a streaming copy (a rename with 'rename').
+The store never hardlinks to the Inbox file, so editing it in place cannot
+change a stored blob. The blob is then placed in Needs_Action/ next to its
+metadata file with the same strategy (with 'auto', a hardlink to the
+read-only blob; 'rename' would empty the store, so it uses 'auto' there).
+The metadata records both methods ("Ingested Via", "Stored Via") and the
+content digest. A drop whose content is already stored gets a metadata file
+only, with `duplicate_of:` naming the first drop's metadata; the reasoning
+loop skips those.
+
+Extraction:
+===========
+Before the metadata is written, each batch's new content is run through
+extract.extract_file on a pool of EXTRACT_WORKERS processes: sniffed MIME
+type, page and word counts and a short preview go into the frontmatter
+(mime_type, pages, words, preview). Results are cached by content digest in
+the store, so repeat drops and restarts never extract the same bytes again.
+
+Catch-up:
+=========
+Every ingested file is recorded in the Inbox manifest (a SignatureIndex, see
+signature_index.py) with its (inode, size, mtime) signature. On startup,
+after the observer is running, catch_up() scans Inbox/ with os.scandir and
+queues every file whose signature is not in the manifest - files dropped
+while the watcher was down. Because live events are already being recorded
+during the scan, nothing falls in a gap; both paths go through the same
+pending queue, and each batch re-checks the manifest before ingesting, so
+nothing is ingested twice.
+
+Earlier watchers left every processed file in Inbox/ and kept no manifest.
+So when catch_up() finds the manifest newly created, it seeds it with the
+files already in Inbox/ instead of queueing them; only later drops are
+ingested.
 """
 
+import os
+import re
+import math
 import time
-import shutil
+import threading
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from ingest import ingest_file, INGEST_STRATEGY
+from content_store import ContentStore, STORE_DIR
+from signature_index import SignatureIndex, file_signature
+from extract import extract_file
+
+
+# Write-completion detection (see module docstring)
+STABLE_CHECKS = 3
+STABLE_INTERVAL = 0.5  # Seconds between size checks
+STABLE_TIMEOUT = 300  # Seconds before a file that keeps changing is skipped
+INGEST_WORKERS = 4
+
+# Content extraction processes (see extract.py) and time limit per file;
+# a batch gets EXTRACT_TIMEOUT per round of EXTRACT_WORKERS files
+EXTRACT_WORKERS = 2
+EXTRACT_TIMEOUT = 120
+
+# Inbox manifest: name -> signature of every ingested Inbox file
+INBOX_MANIFEST_FILE = Path('State') / 'inbox_manifest.sqlite3'
+
+# Partial downloads and editor swap files; the final name arrives via rename
+TEMP_SUFFIXES = ('.tmp', '.part', '.crdownload', '.swp')
+
+# Coalescing (see module docstring)
+BATCH_WINDOW = 0.2  # Seconds to keep collecting after the first ready file
+BATCH_SIZE = 512
+LOG_EACH_UP_TO = 20  # Larger batches log one summary line
+
+
+def open_inbox_manifest(db_path: Path = INBOX_MANIFEST_FILE) -> SignatureIndex:
+    return SignatureIndex(db_path, table='ingested', time_column='ingested_at')
+
+
+class FileIds:
+    """
+    Strictly increasing IDs for Needs_Action names: local time to the
+    microsecond (YYYYmmdd_HHMMSS_ffffff), bumped by 1 us on a tie.
+    """
+
+    def __init__(self):
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            self._last = max(time.time_ns() // 1000, self._last + 1)
+            value = self._last
+        seconds, micros = divmod(value, 1_000_000)
+        return f"{datetime.fromtimestamp(seconds).strftime('%Y%m%d_%H%M%S')}_{micros:06d}"
+
 
 class InboxHandler(FileSystemEventHandler):
     """Handles file system events in the Inbox folder."""
 
-    def __init__(self, needs_action_path: Path):
+    def __init__(self, needs_action_path: Path, workers: int = INGEST_WORKERS,
+                 strategy: str = INGEST_STRATEGY, store_path: Path = STORE_DIR,
+                 manifest_path: Path = INBOX_MANIFEST_FILE,
+                 batch_window: float = BATCH_WINDOW, batch_size: int = BATCH_SIZE,
+                 extract_workers: int = EXTRACT_WORKERS):
         self.needs_action_path = needs_action_path
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.ids = FileIds()
+        self.store = ContentStore(store_path, strategy)
+        # No manifest yet: first start (or upgrade), catch_up seeds it instead of ingesting
+        self.manifest_is_new = not Path(manifest_path).exists()
+        self.manifest = open_inbox_manifest(manifest_path)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='inbox-ingest')
+        self.extract_workers = extract_workers
+        self.extract_pool = self._new_extract_pool()
+        # path -> [first_seen, last (size, mtime), stable checks]; guarded by _lock
+        self._pending = {}
+        # Paths handed to a worker and not finished yet; guarded by _lock
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        # Complete files waiting for the next batch; guarded by _lock
+        self._ready = []
+        self._ready_cond = threading.Condition(self._lock)
+        self._stopped = threading.Event()
+        self._closing = threading.Event()
+        self._checker = threading.Thread(target=self._check_stable_loop, daemon=True)
+        self._batcher = threading.Thread(target=self._batch_loop, daemon=True)
+
+    def start(self):
+        """Start the size-stability checker and batcher (call before the observer starts)."""
+        self._checker.start()
+        self._batcher.start()
+
+    def stop(self):
+        """Stop checking and wait for ready and in-flight files to finish."""
+        self._stopped.set()
+        self._checker.join()
+        with self._ready_cond:
+            self._closing.set()
+            self._ready_cond.notify_all()
+        self._batcher.join()
+        self.pool.shutdown(wait=True)
+        self.extract_pool.shutdown(wait=True)
+        self.manifest.close()
+
+    @staticmethod
+    def _is_candidate(path: Path) -> bool:
+        return not path.name.startswith('.') and not path.name.endswith(TEMP_SUFFIXES)
 
     def on_created(self, event):
-        """Called when a file or directory is created."""
+        """Called when a file or directory is created; the file may still be being written."""
         if event.is_directory:
             return
 
         source_path = Path(event.src_path)
-        self._process_file(source_path)
+        if self._is_candidate(source_path):
+            with self._lock:
+                self._pending.setdefault(source_path, [time.monotonic(), None, 0])
+
+    def on_closed(self, event):
+        """IN_CLOSE_WRITE (Linux): the writer is done with the file."""
+        if not event.is_directory:
+            self._submit(Path(event.src_path))
+
+    def on_moved(self, event):
+        """A file renamed into Inbox/ (e.g. a finished download) is already complete."""
+        if event.is_directory:
+            return
+        with self._lock:
+            self._pending.pop(Path(event.src_path), None)
+            dest_path = Path(event.dest_path)
+            if self._is_candidate(dest_path):
+                self._pending[dest_path] = [time.monotonic(), None, 0]
+        self._submit(dest_path)
+
+    def _submit(self, source_path: Path):
+        """Queue a pending file for the next batch (once)."""
+        with self._lock:
+            # A path still being ingested stays pending; the checker retries it afterwards
+            if source_path not in self._pending or source_path in self._in_flight:
+                return
+            del self._pending[source_path]
+            self._in_flight.add(source_path)
+            self._ready.append(source_path)
+            self._ready_cond.notify()
+
+    def catch_up(self, inbox_path: Path) -> int:
+        """
+        Queue Inbox files not in the manifest (dropped while the watcher was down).
+
+        Call after the observer has started. Files untouched for a full
+        stability window are submitted right away; recently modified ones
+        wait for the stability checker like live drops. Manifest entries for
+        files that left Inbox/ are dropped. Returns the number queued.
 
-    def _process_file(self, source_path: Path):
-        """Process a new file: copy to Needs_Action and create metadata."""
-        # Wait briefly to ensure file is fully written
-        time.sleep(0.1)
+        On a newly created manifest the Inbox files are recorded as already
+        ingested (see module docstring) and nothing is queued, except files
+        live events picked up since the observer started.
+        """
+        known = self.manifest.entries()
+        seen = set()
+        queued = 0
+        quiet_before = time.time() - STABLE_CHECKS * STABLE_INTERVAL
+        seed = [] if self.manifest_is_new else None
 
-        # Generate unique filename with timestamp prefix
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        new_filename = f"FILE_{timestamp}_{source_path.name}"
+        with os.scandir(inbox_path) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False) or not self._is_candidate(Path(entry.name)):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat(follow_symlinks=False)
+                if known.get(entry.name) == file_signature(stat):
+                    continue
+
+                source_path = Path(inbox_path) / entry.name
+                with self._lock:
+                    if source_path in self._pending or source_path in self._in_flight:
+                        continue  # Already picked up by a live event
+                    if seed is not None:
+                        seed.append((entry.name, file_signature(stat)))
+                        continue
+                    self._pending[source_path] = [time.monotonic(), None, 0]
+                if stat.st_mtime < quiet_before:
+                    self._submit(source_path)
+                queued += 1
+
+        if seed is not None:
+            self.manifest.record_many(seed)
+            self.manifest_is_new = False
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] New Inbox manifest: {len(seed)} existing "
+                  f"file(s) recorded as already ingested")
+        self.manifest.forget({name: signature for name, signature in known.items() if name not in seen})
+        return queued
+
+    def _check_stable_loop(self):
+        """Submit pending files whose size and mtime stopped changing."""
+        while not self._stopped.wait(STABLE_INTERVAL):
+            with self._lock:
+                pending = list(self._pending.items())
+
+            for source_path, entry in pending:
+                try:
+                    stat = source_path.stat()
+                except FileNotFoundError:
+                    with self._lock:
+                        self._pending.pop(source_path, None)
+                    continue
+
+                signature = (stat.st_size, stat.st_mtime_ns)
+                entry[2] = entry[2] + 1 if signature == entry[1] else 0
+                entry[1] = signature
+                if entry[2] >= STABLE_CHECKS:
+                    self._submit(source_path)
+                elif time.monotonic() - entry[0] > STABLE_TIMEOUT:
+                    with self._lock:
+                        self._pending.pop(source_path, None)
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Skipped (still changing): {source_path.name}")
+
+    def _batch_loop(self):
+        """Collect ready files for up to BATCH_WINDOW seconds, then ingest them as one batch."""
+        while True:
+            with self._ready_cond:
+                while not self._ready and not self._closing.is_set():
+                    self._ready_cond.wait()
+                if not self._ready:
+                    return
+                deadline = time.monotonic() + self.batch_window
+                while len(self._ready) < self.batch_size and not self._closing.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._ready_cond.wait(remaining)
+                batch = self._ready[:self.batch_size]
+                del self._ready[:self.batch_size]
+
+            try:
+                self._process_batch(batch)
+            finally:
+                with self._lock:
+                    self._in_flight.difference_update(batch)
+
+    def _process_batch(self, batch: list):
+        """Ingest a batch on the worker pool, extract it, then write its metadata files and manifest rows together."""
+        jobs = []
+        for source_path in batch:
+            try:
+                # Signature before processing: the 'rename' strategy moves the file away
+                signature = file_signature(source_path.stat())
+            except FileNotFoundError:
+                continue
+            if self.manifest.get(source_path.name) != signature:
+                jobs.append((source_path, signature, self.ids.next()))
+
+        stored = [(job, fields) for job, fields in zip(jobs, self.pool.map(self._ingest, jobs)) if fields]
+        extractions = self._extract_batch([fields['entry'] for _, fields in stored])
+
+        ingested = []
+        for (source_path, signature, _), fields in stored:
+            metadata_path = fields['metadata_path']
+            try:
+                metadata_path.write_text(self._render_metadata(fields, extractions[fields['entry']['blob'].name]),
+                                         encoding='utf-8')
+            except OSError as e:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Error writing {metadata_path.name}: {e}")
+                continue
+            ingested.append((source_path.name, signature))
+            if len(jobs) <= LOG_EACH_UP_TO:
+                print(fields['message'])
+
+        self.manifest.record_many(ingested)
+        if len(jobs) > LOG_EACH_UP_TO:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed batch: {len(ingested)}/{len(jobs)} file(s)")
+
+    def _ingest(self, job: tuple):
+        """Worker entry point: store and link one file; returns its metadata fields, or None on error."""
+        source_path, _, file_id = job
+        try:
+            return self._process_file(source_path, file_id)
+        except Exception as e:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Error processing {source_path.name}: {e}")
+            return None
+
+    def _process_file(self, source_path: Path, file_id: str) -> dict:
+        """
+        Process a new file: store it by digest and link it into Needs_Action.
+
+        Returns the fields of its metadata file; the batch renders and writes
+        the metadata once the whole batch is ingested and extracted.
+        """
+        new_filename = f"FILE_{file_id}_{source_path.name}"
         dest_path = self.needs_action_path / new_filename
         metadata_path = self.needs_action_path / f"{new_filename}.md"
 
-        # Copy the file to Needs_Action
-        shutil.copy2(source_path, dest_path)
+        # Store the content once under its digest
+        entry = self.store.put(source_path, metadata_file=metadata_path.name)
+
+        if entry['duplicate']:
+            # Same bytes as an earlier drop: metadata only, pointing at the first one
+            file_stat = source_path.stat()
+            method = 'reference'
+            stored_via = 'reference'
+            description = (f"Repeat drop of {entry['original_name']} (already ingested as "
+                           f"{entry['metadata_file']}); no copy was made")
+            message = (f"[{datetime.now().strftime('%H:%M:%S')}] Duplicate: {source_path.name} → "
+                       f"{metadata_path.name} (same as {entry['metadata_file']})")
+        else:
+            # Place the stored blob next to its metadata; never move it out of the store
+            placement = 'auto' if self.store.strategy == 'rename' else self.store.strategy
+            method = ingest_file(entry['blob'], dest_path, placement)
+            file_stat = dest_path.stat()
+            stored_via = entry['ingested_via']
+            description = "New file dropped for processing"
+            message = f"[{datetime.now().strftime('%H:%M:%S')}] Processed: {source_path.name} → {new_filename}"
+
+        return {
+            'metadata_path': metadata_path,
+            'original_name': source_path.name,
+            'entry': entry,
+            'size': file_stat.st_size,
+            'created': datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
+            'method': method,
+            'stored_via': stored_via,
+            'description': description,
+            'message': message,
+        }
+
+    def _new_extract_pool(self) -> ProcessPoolExecutor:
+        # spawn, not fork: this process already runs observer and worker threads
+        return ProcessPoolExecutor(max_workers=self.extract_workers,
+                                   mp_context=multiprocessing.get_context('spawn'))
+
+    def _recycle_extract_pool(self):
+        """Replace the extraction pool, killing workers stuck on a file."""
+        pool, self.extract_pool = self.extract_pool, self._new_extract_pool()
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_batch(self, entries: list) -> dict:
+        """Extraction results (digest -> dict) for stored entries, from cache or the process pool."""
+        results, futures = {}, {}
+        for entry in entries:
+            digest = entry['blob'].name
+            if digest in results or digest in futures:
+                continue
+            cached = self.store.extraction(digest)
+            if cached is not None:
+                results[digest] = cached
+            else:
+                futures[digest] = self.extract_pool.submit(extract_file, str(entry['blob']),
+                                                           entry['original_name'])
+
+        # One deadline for the whole batch, counted from submission
+        rounds = math.ceil(len(futures) / self.extract_workers)
+        done, overdue = wait(futures.values(), timeout=EXTRACT_TIMEOUT * rounds)
+        if overdue:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Extraction timed out for {len(overdue)} file(s); "
+                  f"restarting extraction workers")
+            self._recycle_extract_pool()
 
-        # Get file metadata
-        file_stat = dest_path.stat()
-        size_bytes = file_stat.st_size
-        created_time = datetime.fromtimestamp(file_stat.st_ctime).isoformat()
+        for digest, future in futures.items():
+            try:
+                if future not in done:
+                    raise TimeoutError(f"extraction exceeded {EXTRACT_TIMEOUT * rounds}s")
+                results[digest] = future.result()
+            except Exception as e:
+                results[digest] = {'mime_type': 'application/octet-stream', 'pages': None,
+                                   'words': None, 'preview': None, 'error': f"{type(e).__name__}: {e}"}
+                continue
+            if 'error' not in results[digest]:
+                self.store.save_extraction(digest, results[digest])
+        return results
 
-        # Create metadata file
-        metadata_content = f"""# File Metadata
+    @staticmethod
+    def _render_metadata(fields: dict, extraction: dict) -> str:
+        """Metadata file content for one ingested file."""
+        entry = fields['entry']
+        duplicate_line = f'duplicate_of: "{entry["metadata_file"]}"\n' if entry['duplicate'] else ''
+
+        extraction_lines = f'mime_type: "{extraction["mime_type"]}"\n'
+        details = [f"**MIME Type:** {extraction['mime_type']}"]
+        if extraction['pages'] is not None:
+            extraction_lines += f"pages: {extraction['pages']}\n"
+            details.append(f"**Pages:** {extraction['pages']}")
+        if extraction['words'] is not None:
+            extraction_lines += f"words: {extraction['words']}\n"
+            if extraction.get('truncated'):
+                # Text was cut at MAX_TEXT_CHARS; the count covers the kept part only
+                extraction_lines += "text_truncated: true\n"
+                details.append(f"**Words:** {extraction['words']} (text truncated, count is a lower bound)")
+            else:
+                details.append(f"**Words:** {extraction['words']}")
+        if extraction['preview']:
+            # Quoted YAML scalar; a '---' run would end the frontmatter for simple parsers
+            preview = re.sub(r'-{3,}', '--', extraction['preview']).replace('\\', '\\\\').replace('"', '\\"')
+            extraction_lines += f'preview: "{preview}"\n'
+        preview_section = f"## Preview\n{extraction['preview']}\n\n---\n\n" if extraction['preview'] else ''
+
+        return f"""---
+type: file_drop
+original_name: "{fields['original_name']}"
+size: {fields['size']}
+content_digest: "{entry['digest']}"
+stored_as: "{entry['blob'].as_posix()}"
+{extraction_lines}{duplicate_line}status: {'duplicate' if entry['duplicate'] else 'pending'}
+---
+
+# File Metadata
 
 **Type:** file_drop
-**Original Name:** {source_path.name}
-**Size:** {size_bytes} bytes
-**Created:** {created_time}
+**Original Name:** {fields['original_name']}
+**Size:** {fields['size']} bytes
+**Created:** {fields['created']}
 **Copied To Needs_Action:** {datetime.now().isoformat()}
+**Ingested Via:** {fields['method']}
+**Stored Via:** {fields['stored_via']}
+**Content Digest:** {entry['digest']}
+{chr(10).join(details)}
 
 ---
 
 ## Description
-New file dropped for processing
+{fields['description']}
 
 ---
 
-## Processing Status
+{preview_section}## Processing Status
 - [ ] File analyzed
 - [ ] Plan created
 - [ ] Processed
 - [ ] Moved to Done
 """
 
-        metadata_path.write_text(metadata_content)
-
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed: {source_path.name} → {new_filename}")
-
 
 def main():
     """Main function to start the filesystem watcher."""
@@ -96,8 +525,14 @@ def main():
     print(f"Output to: {needs_action_path.absolute()}")
     print("Press Ctrl+C to stop\n")
 
+    event_handler.start()
     observer.start()
 
+    # Files dropped while the watcher was down; live events are already queued
+    caught_up = event_handler.catch_up(inbox_path)
+    if caught_up:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Catch-up: {caught_up} file(s) dropped while stopped")
+
     try:
         while True:
             time.sleep(1)
@@ -106,6 +541,7 @@ def main():
         observer.stop()
 
     observer.join()
+    event_handler.stop()
     print("Watcher stopped.")
 
 
@@ -0,0 +1,153 @@
+"""
+Multi-Mailbox Gmail Watcher for Personal AI Employee - Silver Tier
+
+Watches several Gmail accounts from one process instead of one process per
+token.json. Accounts are listed in gmail_accounts.json (see
+gmail_accounts.example.json):
+
+    {
+      "accounts": [
+        {"name": "work", "token": "tokens/work_token.json"},
+        {"name": "personal", "token": "tokens/personal_token.json",
+         "credentials": "credentials.json"}
+      ]
+    }
+
+- Each account keeps its own history checkpoint (State/gmail_history_<name>.json)
+  and dedupe namespace, and is stamped into every file's `account:` frontmatter
+- Account names become part of file names, so they are limited to letters,
+  digits, '_' and '-'
+- Accounts are checked on one shared thread pool; file writes share a second pool
+- Fair scheduling: each account may create at most ACCOUNT_TURN_BUDGET files
+  per round. A mailbox with a backlog resumes in the next round, which starts
+  immediately, so one busy mailbox cannot starve the others
+
+First run: each account without a token opens the OAuth consent flow in turn.
+
+Usage:
+    python watchers/gmail_multi.py
+"""
+
+import re
+import json
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from base_watcher import BaseWatcher
+from dedupe_store import DEDUPE_DB_FILE
+from gmail_watcher import GmailWatcher, CHECK_INTERVAL, DRAIN_WORKERS, STATE_PATH
+
+
+# Account list
+ACCOUNTS_CONFIG = Path('gmail_accounts.json')
+
+# Threads checking accounts concurrently
+ACCOUNT_WORKERS = 4
+
+# Max files one account may create per round before yielding
+ACCOUNT_TURN_BUDGET = 100
+
+# Allowed account names (used in checkpoint and Needs_Action file names)
+ACCOUNT_NAME_PATTERN = re.compile(r'[A-Za-z0-9_-]+')
+
+
+def validate_accounts(accounts: list, source: str = 'accounts'):
+    """Raise ValueError unless every account has a unique, file-name-safe 'name'."""
+    names = [a.get('name') for a in accounts]
+    if not accounts or not all(names) or len(set(names)) != len(names):
+        raise ValueError(f"{source}: every account needs a unique 'name'")
+    for name in names:
+        if not isinstance(name, str) or not ACCOUNT_NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"{source}: account name {name!r} may only contain "
+                             "letters, digits, '_' and '-'")
+
+
+def load_accounts(config_path: Path = ACCOUNTS_CONFIG) -> list:
+    """Read and validate the account list."""
+    if not config_path.exists():
+        raise FileNotFoundError(
+            f"Account config not found: {config_path}\n"
+            "Copy gmail_accounts.example.json to gmail_accounts.json and list your mailboxes"
+        )
+    accounts = json.loads(config_path.read_text(encoding='utf-8')).get('accounts', [])
+    validate_accounts(accounts, str(config_path))
+    return accounts
+
+
+class MultiGmailWatcher(BaseWatcher):
+    """Runs one GmailWatcher per account on shared thread pools with round-robin fairness."""
+
+    def __init__(self, needs_action_path: Path, accounts: list,
+                 dedupe_path: Path = DEDUPE_DB_FILE, state_path: Path = STATE_PATH,
+                 account_workers: int = ACCOUNT_WORKERS, turn_budget: int = ACCOUNT_TURN_BUDGET,
+                 services: dict = None):
+        validate_accounts(accounts)
+        # Each account's GmailWatcher keeps its own dedupe namespace; this one needs none
+        super().__init__(needs_action_path, dedupe_path=None)
+        self.account_pool = ThreadPoolExecutor(max_workers=account_workers,
+                                               thread_name_prefix='gmail-account')
+        self.writer_pool = ThreadPoolExecutor(max_workers=DRAIN_WORKERS,
+                                              thread_name_prefix='gmail-writer')
+        self.watchers = {}
+
+        for account in accounts:
+            name = account['name']
+            self.watchers[name] = GmailWatcher(
+                needs_action_path,
+                credentials_path=account.get('credentials', 'credentials.json'),
+                token_path=account.get('token', f"token_{name}.json"),
+                checkpoint_path=Path(state_path) / f"gmail_history_{name}.json",
+                service=(services or {}).get(name),
+                dedupe_path=dedupe_path,
+                account=name,
+                max_items_per_cycle=turn_budget,
+                writer_pool=self.writer_pool,
+            )
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Account ready: {name}")
+
+    def _check_account(self, name: str) -> int:
+        try:
+            return self.watchers[name].check_for_new_items()
+        except Exception as error:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] [{name}] Error: {error}")
+            return 0
+
+    def check_for_new_items(self) -> int:
+        """Run one round: every account gets one budgeted turn, all in parallel."""
+        futures = {name: self.account_pool.submit(self._check_account, name)
+                   for name in self.watchers}
+        created = {name: future.result() for name, future in futures.items()}
+
+        busy = [name for name, watcher in self.watchers.items() if watcher.has_pending_work]
+        if busy:
+            # Start the next round right away; idle accounts still get their turn in it
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Backlog pending for: {', '.join(busy)}")
+            self.wake()
+
+        total = sum(created.values())
+        if total:
+            summary = ', '.join(f"{name}: {count}" for name, count in created.items() if count)
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Round created {total} email(s) ({summary})")
+        return total
+
+    def close(self):
+        self.account_pool.shutdown()
+        self.writer_pool.shutdown()
+
+
+def main():
+    """Main function to start the multi-mailbox Gmail watcher."""
+    root_path = Path('.')
+    needs_action_path = root_path / 'Needs_Action'
+    needs_action_path.mkdir(exist_ok=True)
+
+    watcher = MultiGmailWatcher(needs_action_path, load_accounts())
+    try:
+        watcher.run(check_interval=CHECK_INTERVAL)
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
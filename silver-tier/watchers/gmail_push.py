@@ -0,0 +1,138 @@
+"""
+Gmail Push Listener for Personal AI Employee - Silver Tier
+
+Small local HTTP endpoint that receives Gmail change notifications delivered
+by a Google Cloud Pub/Sub push subscription and wakes the GmailWatcher for an
+immediate incremental sync. The watcher's slow poll stays on as a safety net.
+
+Setup Instructions:
+===================
+1. Create a Pub/Sub topic (e.g. projects/<project>/topics/gmail-watch)
+2. Grant publish rights on the topic to gmail-api-push@system.gserviceaccount.com
+3. Create a push subscription whose endpoint reaches this listener, e.g.
+   https://<public-host>/gmail/push?token=<PUSH_TOKEN>
+   (expose the local port with a tunnel or reverse proxy)
+4. Set PUSH_ENABLED, PUBSUB_TOPIC and PUSH_TOKEN in gmail_watcher.py
+
+Notification format (Pub/Sub push):
+    {"message": {"data": base64('{"emailAddress": "...", "historyId": "1234"}'),
+                 "messageId": "..."},
+     "subscription": "..."}
+"""
+
+import json
+import base64
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+# Listener defaults
+PUSH_HOST = '127.0.0.1'
+PUSH_PORT = 8085
+PUSH_PATH = '/gmail/push'
+
+# Notifications arriving within this window are coalesced into one sync
+PUSH_DEBOUNCE_SECONDS = 0.5
+
+
+class PushListener:
+    """
+    Receives Pub/Sub push notifications and calls `on_notify(history_id)`.
+
+    Bursts are coalesced: the first notification opens a debounce window and
+    the callback fires once at its end with the highest historyId seen.
+    """
+
+    def __init__(self, on_notify: Callable[[str], None], host: str = PUSH_HOST,
+                 port: int = PUSH_PORT, path: str = PUSH_PATH,
+                 debounce: float = PUSH_DEBOUNCE_SECONDS, token: Optional[str] = None):
+        self.on_notify = on_notify
+        self.path = path
+        self.debounce = debounce
+        self.token = token
+        self.received = 0
+        self._pending_history_id: Optional[int] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='GmailPushListener', daemon=True)
+        self._thread.start()
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Push listener on "
+              f"http://{self._server.server_address[0]}:{self.port}{self.path}")
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+
+    def notify(self, history_id: int):
+        """Record a notification and schedule the debounced callback."""
+        with self._lock:
+            self.received += 1
+            if self._pending_history_id is None or history_id > self._pending_history_id:
+                self._pending_history_id = history_id
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _fire(self):
+        with self._lock:
+            history_id = self._pending_history_id
+            self._pending_history_id = None
+            self._timer = None
+        if history_id is not None:
+            try:
+                self.on_notify(str(history_id))
+            except Exception as e:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Push callback error: {e}")
+
+    def _make_handler(self):
+        listener = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != listener.path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if listener.token and parse_qs(url.query).get('token', [''])[0] != listener.token:
+                    self.send_response(403)
+                    self.end_headers()
+                    return
+
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    envelope = json.loads(self.rfile.read(length))
+                    data = json.loads(base64.b64decode(envelope['message']['data']))
+                    history_id = int(data['historyId'])
+                except (KeyError, ValueError, TypeError):
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                listener.notify(history_id)
+                # Any 2xx acknowledges the Pub/Sub message
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -32,21 +32,73 @@ Setup Instructions:
    - Grant permissions
    - token.json will be created automatically
 8. Script will now monitor Gmail every 120 seconds
+
+Incremental Sync:
+=================
+After the first full sync the watcher stores the mailbox historyId in
+State/gmail_history.json and only asks Gmail for changes since then
+(users.history.list). If the checkpoint is too old and Gmail rejects it
+(HTTP 404), the watcher falls back to one full query and starts over.
+
+Backlog Drain:
+==============
+Every sync (full or delta) is drained page by page through the same
+pipeline: list a page → batch-fetch new messages → create files in a
+bounded worker pool. The current page token is saved after each page, so
+an interrupted drain resumes where it stopped. DRAIN_MAX_PER_SECOND caps
+throughput (0 = unlimited).
+
+Push Mode:
+==========
+With PUSH_ENABLED the watcher registers a Gmail watch on PUBSUB_TOPIC and
+runs a local listener (gmail_push.py) for Pub/Sub push notifications. Each
+notification wakes the watcher for an immediate incremental sync; the poll
+drops to PUSH_SAFETY_INTERVAL and only acts as a safety net.
+
+Fast Startup:
+=============
+The Gmail discovery document is cached in State/gmail_v1_discovery.json
+(seeded from the copy bundled with google-api-python-client) and parsed
+once per process, so connecting never fetches it over the network. An
+expired token is refreshed by a background thread instead of blocking
+startup, and that thread keeps refreshing shortly before each expiry.
+
+Partial Responses & Attachments:
+================================
+Every Gmail call sends a fields= mask (LIST_FIELDS, HISTORY_FIELDS,
+MESSAGE_FIELDS) so only the data the watcher reads crosses the wire. The
+body is found by walking the MIME tree recursively, decoding only the part
+that is used. Attachments are fetched separately with attachments.get and
+saved to EMAIL_<id>_attachments/ next to the .md file. attachments.get
+returns the whole base64 payload in one JSON response, so a download
+briefly holds a few times the attachment size in memory; MAX_ATTACHMENT_BYTES
+is the memory bound, and larger parts are listed but not downloaded.
 """
 
+import json
 import time
 import base64
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Set, Optional
+from datetime import datetime, timezone
+from typing import Optional
 from email import message_from_bytes
 
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 
+from base_watcher import BaseWatcher
+from dedupe_store import DEDUPE_DB_FILE
+from gmail_push import PushListener, PUSH_HOST, PUSH_PORT
+
 
 # Gmail API OAuth scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
@@ -57,33 +109,163 @@ CHECK_INTERVAL = 120
 # Query for unread + important emails
 GMAIL_QUERY = 'is:unread is:important'
 
+# Max messages.get calls per Gmail batch HTTP request (Gmail recommends <= 50)
+BATCH_SIZE = 50
+
+# Labels a message must carry to match GMAIL_QUERY (used for history deltas)
+GMAIL_QUERY_LABELS = {'UNREAD', 'IMPORTANT'}
+
+# Backlog drain: messages per list page, file-writer threads, throughput cap (msgs/sec, 0 = off)
+DRAIN_PAGE_SIZE = 100
+DRAIN_WORKERS = 4
+DRAIN_MAX_PER_SECOND = 0
+
+# Partial-response masks for list, history and message calls
+LIST_FIELDS = 'messages/id,nextPageToken,resultSizeEstimate'
+HISTORY_FIELDS = ('history(messagesAdded/message(id,labelIds),labelsAdded/message(id,labelIds)),'
+                  'historyId,nextPageToken')
+MESSAGE_FIELDS = 'id,snippet,payload(mimeType,filename,headers,body,parts)'
+
+# Attachments: saved next to the .md file; each download is held in memory whole
+DOWNLOAD_ATTACHMENTS = True
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024  # Larger parts are listed but not downloaded
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024  # Base64 chars decoded per write; a multiple of 4
+
+# Account label written to every EMAIL_*.md (see gmail_multi.py for several mailboxes)
+DEFAULT_ACCOUNT = 'default'
+
+# Push mode (see gmail_push.py for Pub/Sub setup)
+PUSH_ENABLED = False
+PUBSUB_TOPIC = ''  # e.g. 'projects/<project>/topics/gmail-watch'
+PUSH_TOKEN = ''  # shared secret expected as ?token= on the push endpoint
+PUSH_SAFETY_INTERVAL = 900  # Poll interval while push is active
+WATCH_RENEW_MARGIN = 86400  # Renew the Gmail watch a day before it expires
 
-class BaseWatcher:
-    """Base class for all watchers in the AI Employee system."""
+# Persisted watcher state (history checkpoint)
+STATE_PATH = Path('State')
+HISTORY_CHECKPOINT_FILE = STATE_PATH / 'gmail_history.json'
+DISCOVERY_CACHE_FILE = STATE_PATH / 'gmail_v1_discovery.json'
 
-    def __init__(self, needs_action_path: Path):
-        self.needs_action_path = needs_action_path
-        self.processed_ids: Set[str] = set()
+# Refresh the OAuth token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 300
 
-    def check_for_new_items(self):
-        """Check for new items to process. Override in subclass."""
-        raise NotImplementedError
+# Refresh interval for a token that reports no expiry (access tokens last an hour)
+TOKEN_REFRESH_FALLBACK = 3000
 
-    def run(self, check_interval: int = CHECK_INTERVAL):
-        """Run the watcher in an infinite loop."""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {self.__class__.__name__} started...")
-        print(f"Output to: {self.needs_action_path.absolute()}")
-        print(f"Check interval: {check_interval} seconds")
-        print("Press Ctrl+C to stop\n")
+# Parsed discovery document, shared by every reconnect in this process
+_DISCOVERY_DOC: Optional[dict] = None
 
+
+def load_discovery_document(cache_file: Path = DISCOVERY_CACHE_FILE) -> Optional[dict]:
+    """
+    Return the Gmail v1 discovery document without network access when possible.
+
+    Order: in-process copy → State/ cache file → document bundled with
+    google-api-python-client. Returns None if none is available.
+    """
+    global _DISCOVERY_DOC
+    if _DISCOVERY_DOC is not None:
+        return _DISCOVERY_DOC
+
+    raw = None
+    if cache_file.exists():
+        raw = cache_file.read_text(encoding='utf-8')
+    else:
+        raw = discovery_cache.get_static_doc('gmail', 'v1')
+        if raw:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(raw, encoding='utf-8')
+
+    if raw:
         try:
-            while True:
-                self.check_for_new_items()
-                time.sleep(check_interval)
-        except KeyboardInterrupt:
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Stopping {self.__class__.__name__}...")
+            _DISCOVERY_DOC = json.loads(raw)
+        except ValueError:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Ignoring corrupt discovery cache: {cache_file}")
+            cache_file.unlink(missing_ok=True)
+    return _DISCOVERY_DOC
+
+
+class LockedCredentials(Credentials):
+    """
+    OAuth credentials whose refreshes are serialized.
 
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {self.__class__.__name__} stopped.")
+    The background CredentialRefresher and every AuthorizedHttp (401 retry,
+    refresh before a request with an expired token) refresh the same object
+    from different threads; refresh_lock keeps them from interleaving.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.refresh_lock = threading.RLock()
+
+    @classmethod
+    def from_credentials(cls, creds: Credentials) -> 'LockedCredentials':
+        """Copy plain credentials (e.g. from the OAuth consent flow)."""
+        locked = cls.__new__(cls)
+        locked.__setstate__(creds.__getstate__())
+        return locked
+
+    def refresh(self, request):
+        with self.refresh_lock:
+            super().refresh(request)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop('refresh_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.refresh_lock = threading.RLock()
+
+
+class CredentialRefresher(threading.Thread):
+    """
+    Background thread that keeps OAuth credentials fresh.
+
+    Refreshes immediately if the token is already expired, then sleeps until
+    TOKEN_REFRESH_MARGIN seconds before each expiry (TOKEN_REFRESH_FALLBACK
+    if the token has no expiry). Refreshed tokens are written back to
+    token.json.
+    """
+
+    def __init__(self, creds: LockedCredentials, token_path: Path, margin: float = TOKEN_REFRESH_MARGIN):
+        super().__init__(name='GmailCredentialRefresher', daemon=True)
+        self.creds = creds
+        self.token_path = token_path
+        self.margin = margin
+        self._stopped = threading.Event()
+
+    def _seconds_until_refresh(self) -> float:
+        if not self.creds.valid:
+            return 0
+        if self.creds.expiry is None:
+            return TOKEN_REFRESH_FALLBACK
+        # google-auth stores expiry as naive UTC
+        expiry = self.creds.expiry.replace(tzinfo=timezone.utc)
+        return (expiry - datetime.now(timezone.utc)).total_seconds() - self.margin
+
+    def run(self):
+        failures = 0
+        while not self._stopped.is_set():
+            wait = self._seconds_until_refresh()
+            if wait > 0 and self._stopped.wait(wait):
+                return
+            try:
+                with self.creds.refresh_lock:
+                    # An HTTP thread may have refreshed while we slept
+                    if self._seconds_until_refresh() <= 0 or self.creds.expiry is None:
+                        self.creds.refresh(Request())
+                    self.token_path.write_text(self.creds.to_json(), encoding='utf-8')
+                failures = 0
+            except Exception as e:
+                failures += 1
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Token refresh failed: {e}")
+                if self._stopped.wait(min(300, 5 * 2 ** failures)):
+                    return
+
+    def stop(self):
+        self._stopped.set()
 
 
 class GmailWatcher(BaseWatcher):
@@ -93,12 +275,52 @@ class GmailWatcher(BaseWatcher):
     """
 
     def __init__(self, needs_action_path: Path, credentials_path: str = 'credentials.json',
-                 token_path: str = 'token.json'):
-        super().__init__(needs_action_path)
+                 token_path: str = 'token.json', checkpoint_path: Path = HISTORY_CHECKPOINT_FILE,
+                 service=None, dedupe_path: Path = DEDUPE_DB_FILE,
+                 max_per_second: float = DRAIN_MAX_PER_SECOND, account: str = DEFAULT_ACCOUNT,
+                 max_items_per_cycle: Optional[int] = None,
+                 writer_pool: Optional[ThreadPoolExecutor] = None):
+        # Each extra mailbox keeps its own dedupe namespace
+        namespace = 'GmailWatcher' if account == DEFAULT_ACCOUNT else f"GmailWatcher:{account}"
+        super().__init__(needs_action_path, dedupe_path, namespace=namespace)
+        self.account = account
+        self.max_items_per_cycle = max_items_per_cycle
+        self.writer_pool = writer_pool
         self.credentials_path = credentials_path
         self.token_path = token_path
-        self.service: Optional[build] = None
-        self._connect()
+        self.checkpoint_path = Path(checkpoint_path)
+        self.max_per_second = max_per_second
+        self.history_id: Optional[str] = None
+        self.drain_state: Optional[dict] = None
+        self.creds: Optional[LockedCredentials] = None
+        self._refresher: Optional[CredentialRefresher] = None
+        self._local = threading.local()
+        self.push_topic: Optional[str] = None
+        self.watch_expiration = 0.0
+        self._load_checkpoint()
+        self.service: Optional[build] = service
+        if self.service is None:
+            self._connect()
+
+    def _load_checkpoint(self):
+        """Load the last synced historyId and any interrupted drain from disk."""
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return
+        self.history_id = data.get('history_id')
+        self.drain_state = data.get('drain')
+
+    def _save_checkpoint(self):
+        """Persist sync state atomically so a crash never leaves a torn file."""
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({
+            'history_id': self.history_id,
+            'drain': self.drain_state,
+            'updated': datetime.now().isoformat()
+        }), encoding='utf-8')
+        tmp_path.replace(self.checkpoint_path)
 
     def _connect(self):
         """Authenticate and connect to Gmail API."""
@@ -107,48 +329,66 @@ class GmailWatcher(BaseWatcher):
         # Load existing token if available
         token_path = Path(self.token_path)
         if token_path.exists():
-            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-
-        # Refresh or obtain new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                credentials_file = Path(self.credentials_path)
-                if not credentials_file.exists():
-                    raise FileNotFoundError(
-                        f"Credentials file not found: {self.credentials_path}\n"
-                        "Please follow setup instructions to create credentials.json"
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    credentials_file, SCOPES
+            creds = LockedCredentials.from_authorized_user_file(token_path, SCOPES)
+
+        # Obtain new credentials interactively if there is nothing to refresh
+        # (an expired token with a refresh_token is refreshed in the background)
+        if not creds or not (creds.valid or creds.refresh_token):
+            credentials_file = Path(self.credentials_path)
+            if not credentials_file.exists():
+                raise FileNotFoundError(
+                    f"Credentials file not found: {self.credentials_path}\n"
+                    "Please follow setup instructions to create credentials.json"
                 )
-                creds = flow.run_local_server(port=0)
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_file, SCOPES
+            )
+            creds = LockedCredentials.from_credentials(flow.run_local_server(port=0))
 
             # Save credentials for future use
             with open(token_path, 'w') as token:
                 token.write(creds.to_json())
 
-        # Build Gmail API service
-        self.service = build('gmail', 'v1', credentials=creds)
+        # Keep the token fresh off the startup path (one refresher per watcher)
+        if self._refresher is not None:
+            self._refresher.stop()
+        if creds.refresh_token:
+            self._refresher = CredentialRefresher(creds, token_path)
+            self._refresher.start()
+
+        # Build Gmail API service from the cached discovery document
+        self.creds = creds
+        discovery_doc = load_discovery_document()
+        if discovery_doc is not None:
+            self.service = build_from_document(discovery_doc, credentials=creds)
+        else:
+            self.service = build('gmail', 'v1', credentials=creds)
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Connected to Gmail API")
 
+    def _iter_parts(self, part: dict):
+        """Yield the leaf parts of a (possibly nested) multipart payload, depth first."""
+        children = part.get('parts')
+        if not children:
+            yield part
+            return
+        for child in children:
+            yield from self._iter_parts(child)
+
     def _decode_email_body(self, message: dict) -> str:
-        """Decode the email body from base64url encoding."""
+        """Decode the first text/plain part (else the first text/* part) of any MIME tree."""
         try:
-            # Try to get plain text body
-            if 'parts' in message['payload']:
-                for part in message['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        body = part['body'].get('data', '')
-                        if body:
-                            decoded = base64.urlsafe_b64decode(body).decode('utf-8')
-                            return decoded
-            # Fallback to body if no parts
-            body = message['payload']['body'].get('data', '')
-            if body:
-                decoded = base64.urlsafe_b64decode(body).decode('utf-8')
-                return decoded
+            fallback = None
+            for part in self._iter_parts(message['payload']):
+                if part.get('filename') or not part['mimeType'].startswith('text/'):
+                    continue
+                data = part.get('body', {}).get('data')
+                if not data:
+                    continue
+                if part['mimeType'] == 'text/plain':
+                    return base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
+                fallback = fallback or data
+            if fallback:
+                return base64.urlsafe_b64decode(fallback).decode('utf-8', errors='replace')
         except Exception as e:
             print(f"Error decoding email body: {e}")
         return "[Unable to decode email body]"
@@ -194,40 +434,126 @@ class GmailWatcher(BaseWatcher):
 
         return actions
 
+    def _thread_http(self):
+        """Per-thread authorized HTTP object (None when using an injected service)."""
+        if self.creds is None:
+            return None
+        if not hasattr(self._local, 'http'):
+            self._local.http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+        return self._local.http
+
+    def _execute_in_thread(self, request):
+        """Execute a request from any thread; the service's default HTTP object is not thread-safe."""
+        http = self._thread_http()
+        return request.execute(http=http) if http else request.execute()
+
+    def _message_request(self, message_id: str):
+        return self.service.users().messages().get(
+            userId='me', id=message_id, format='full', fields=MESSAGE_FIELDS
+        )
+
+    def _attachment_request(self, message_id: str, attachment_id: str):
+        return self.service.users().messages().attachments().get(
+            userId='me', messageId=message_id, id=attachment_id, fields='data'
+        )
+
+    def _fetch_attachment(self, request) -> str:
+        """Base64 data of one attachments.get call (runs on a file-writer thread)."""
+        return self._execute_in_thread(request)['data']
+
+    def _download_attachment(self, message_id: str, part: dict, target: Path):
+        """Decode one attachment (inline data or attachments.get) to target via a temp file."""
+        body = part.get('body', {})
+        data = body.get('data')
+        if data is None:
+            data = self._fetch_attachment(self._attachment_request(message_id, body['attachmentId']))
+
+        tmp_path = target.with_name(target.name + '.tmp')
+        with open(tmp_path, 'wb') as handle:
+            for start in range(0, len(data), ATTACHMENT_CHUNK_SIZE):
+                chunk = data[start:start + ATTACHMENT_CHUNK_SIZE]
+                handle.write(base64.urlsafe_b64decode(chunk + '=' * (-len(chunk) % 4)))
+        tmp_path.replace(target)
+
+    def _save_attachments(self, message: dict, folder: Path) -> list:
+        """Save every attachment of a message into folder; returns markdown list lines."""
+        lines = []
+        for index, part in enumerate(p for p in self._iter_parts(message['payload']) if p.get('filename')):
+            name = Path(part['filename']).name
+            safe_name = "".join(c if c.isalnum() or c in ' -_.' else '_' for c in name).lstrip('.') or 'attachment'
+            size = part.get('body', {}).get('size', 0)
+
+            if not DOWNLOAD_ATTACHMENTS or size > MAX_ATTACHMENT_BYTES:
+                lines.append(f"- {safe_name} ({size:,} bytes, not downloaded)")
+                continue
+
+            target = folder / f"{index + 1:02d}_{safe_name}"
+            try:
+                folder.mkdir(exist_ok=True)
+                self._download_attachment(message['id'], part, target)
+                lines.append(f"- [{safe_name}]({folder.name}/{target.name}) ({size:,} bytes)")
+            except Exception as error:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to save attachment {safe_name}: {error}")
+                lines.append(f"- {safe_name} ({size:,} bytes, download failed)")
+        return lines
+
+    def _fetch_messages(self, message_ids: list) -> tuple:
+        """
+        Fetch full messages through Gmail batch HTTP requests.
+
+        Returns (messages, failed_ids). Each batch carries up to BATCH_SIZE
+        messages.get calls in a single round trip.
+        """
+        fetched = {}
+        failed = []
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to fetch {request_id}: {exception}")
+                failed.append(request_id)
+            else:
+                fetched[request_id] = response
+
+        for start in range(0, len(message_ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for message_id in message_ids[start:start + BATCH_SIZE]:
+                batch.add(self._message_request(message_id), request_id=message_id)
+            batch.execute()
+
+        # Keep the listing order (newest first)
+        messages = [fetched[mid] for mid in message_ids if mid in fetched]
+        return messages, failed
+
     def _create_email_file(self, message: dict):
-        """Create a .md file in Needs_Action/ for the email."""
+        """Create a .md file in Needs_Action/ (plus its attachments) for a message fetched with format='full'."""
         message_id = message['id']
         snippet = message.get('snippet', '')
 
-        # Get full message details
-        full_message = self.service.users().messages().get(
-            userId='me',
-            id=message_id,
-            format='metadata',
-            metadataHeaders=['From', 'To', 'Subject', 'Date']
-        ).execute()
-
-        # Extract headers
-        headers = self._get_email_headers(full_message)
+        # Extract headers from the full payload
+        headers = self._get_email_headers(message)
         from_addr = headers.get('from', 'Unknown')
         subject = headers.get('subject', 'No Subject')
         received_date = headers.get('date', datetime.now().isoformat())
 
-        # Get full body
-        full_message_body = self.service.users().messages().get(
-            userId='me',
-            id=message_id,
-            format='full'
-        ).execute()
-        body = self._decode_email_body(full_message_body)
+        body = self._decode_email_body(message)
 
         # Generate filename
         # Sanitize subject for filename
         safe_subject = "".join(c if c.isalnum() or c in ' -_' else '_' for c in subject[:30])
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"EMAIL_{message_id}_{safe_subject}.md"
+        # Message ids are only unique per mailbox, so extra accounts get a prefix
+        account_prefix = "" if self.account == DEFAULT_ACCOUNT else f"{self.account}_"
+        filename = f"EMAIL_{account_prefix}{message_id}_{safe_subject}.md"
         filepath = self.needs_action_path / filename
 
+        # Attachments land before the .md file, so whoever picks it up finds them in place
+        attachment_lines = self._save_attachments(
+            message, self.needs_action_path / f"EMAIL_{account_prefix}{message_id}_attachments"
+        )
+        attachments_section = ""
+        if attachment_lines:
+            attachments_section = "## Attachments\n\n" + "\n".join(attachment_lines) + "\n\n---\n\n"
+
         # Generate suggested actions
         suggested_actions = self._generate_suggested_actions(subject, snippet)
 
@@ -239,11 +565,13 @@ received: "{received_date}"
 priority: high
 status: pending
 message_id: "{message_id}"
+account: "{self.account}"
 ---
 
 # Email: {subject}
 
 **From:** {from_addr}  
+**Account:** {self.account}  
 **Received:** {received_date}  
 **Priority:** High  
 **Status:** Pending
@@ -256,7 +584,7 @@ message_id: "{message_id}"
 
 ---
 
-## Suggested Actions
+{attachments_section}## Suggested Actions
 
 {chr(10).join(suggested_actions)}
 
@@ -279,40 +607,261 @@ message_id: "{message_id}"
 
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Created: {filename}")
 
-    def check_for_new_items(self):
-        """Check Gmail for new unread + important emails."""
+    def _profile_request(self):
+        return self.service.users().getProfile(userId='me', fields='historyId')
+
+    def _new_drain(self, profile: Optional[dict] = None) -> dict:
+        """
+        Start a drain: a history delta if we have a checkpoint, else a full listing.
+
+        A full listing needs the mailbox profile; pass it in if it was already
+        fetched (the async watcher does), otherwise it is fetched here.
+        """
+        if self.history_id:
+            return {'source': 'history', 'start_history_id': self.history_id,
+                    'target_history_id': self.history_id, 'page_token': None, 'processed': 0}
+
+        # Read the historyId before listing so mail arriving mid-drain is caught by the next delta
+        profile = profile or self._profile_request().execute()
+        return {'source': 'full', 'target_history_id': profile['historyId'],
+                'page_token': None, 'processed': 0}
+
+    def _page_request(self, drain: dict, page_token: Optional[str]):
+        """Build the list request for one page of a drain (history delta or full query)."""
+        if drain['source'] == 'history':
+            return self.service.users().history().list(
+                userId='me',
+                startHistoryId=drain['start_history_id'],
+                historyTypes=['messageAdded', 'labelAdded'],
+                maxResults=DRAIN_PAGE_SIZE,
+                pageToken=page_token,
+                fields=HISTORY_FIELDS
+            )
+        return self.service.users().messages().list(
+            userId='me',
+            q=GMAIL_QUERY,
+            maxResults=DRAIN_PAGE_SIZE,
+            pageToken=page_token,
+            fields=LIST_FIELDS
+        )
+
+    def _parse_page(self, drain: dict, results: dict) -> list:
+        """
+        Extract message stubs from a list response and update drain bookkeeping.
+
+        History pages are reduced to messages that now match GMAIL_QUERY.
+        """
+        if drain['source'] != 'history':
+            drain.setdefault('estimate', results.get('resultSizeEstimate'))
+            return results.get('messages', [])
+
+        messages = []
+        seen = set()
+        for record in results.get('history', []):
+            changes = record.get('messagesAdded', []) + record.get('labelsAdded', [])
+            for change in changes:
+                message = change['message']
+                if message['id'] in seen:
+                    continue
+                if GMAIL_QUERY_LABELS.issubset(message.get('labelIds', [])):
+                    seen.add(message['id'])
+                    messages.append(message)
+
+        drain['target_history_id'] = results.get('historyId', drain['target_history_id'])
+        return messages
+
+    def _iter_pages(self, drain: dict):
+        """
+        Stream (messages, next_page_token) for each remaining page of a drain.
+
+        Raises HttpError 404 if a history checkpoint has expired.
+        """
+        page_token = drain.get('page_token')
+        while True:
+            results = self._page_request(drain, page_token).execute()
+            messages = self._parse_page(drain, results)
+            page_token = results.get('nextPageToken')
+            yield messages, page_token
+            if not page_token:
+                return
+
+    # ------------------------------------------------------------------
+    # Drain bookkeeping, shared with AsyncGmailWatcher (gmail_watcher_async.py)
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_writers(self):
+        """The shared writer pool if one was given, else a private one for this drain."""
+        if self.writer_pool is not None:
+            yield self.writer_pool
+            return
+        pool = ThreadPoolExecutor(max_workers=DRAIN_WORKERS)
+        try:
+            yield pool
+        finally:
+            pool.shutdown()
+
+    def _new_ids(self, messages: list) -> list:
+        return [m['id'] for m in messages if m['id'] not in self.processed_ids]
+
+    def _throttle_delay(self, run: dict, upcoming: int) -> float:
+        """Seconds to wait before fetching `upcoming` more messages to stay under max_per_second."""
+        if not self.max_per_second:
+            return 0.0
+        due = run['started'] + (run['processed'] + upcoming) / self.max_per_second
+        return max(0.0, due - time.monotonic())
+
+    def _finish_page(self, drain: dict, run: dict, created: int, failed: bool,
+                     next_page_token: Optional[str]) -> Optional[bool]:
+        """
+        Account for one drained page and checkpoint the drain.
+
+        Returns None to go on with the next page, True when the drain is
+        complete, or False when it stops early (a fetch failed, or this run
+        reached max_items_per_cycle) to resume from the next unfinished page.
+        """
+        run['pages'] += 1
+        run['processed'] += created
+        drain['processed'] += created
+
+        if failed:
+            self._save_checkpoint()
+            return False
+
+        drain['page_token'] = next_page_token
+        self._save_checkpoint()
+        if not next_page_token:
+            return True
+
+        estimate = f" of ~{drain['estimate']}" if drain.get('estimate') else ""
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Drain progress: "
+              f"{drain['processed']} email(s) created{estimate} (page {run['pages']})")
+
+        # Yield the turn so other mailboxes sharing the pool are not starved
+        if self.max_items_per_cycle and run['processed'] >= self.max_items_per_cycle:
+            return False
+        return None
+
+    def _resume_drain(self) -> bool:
+        """True if an unfinished drain is picked up again (False: start a new one)."""
+        if self.drain_state is None:
+            return False
+        if self.drain_state.get('page_token'):
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Resuming interrupted drain "
+                  f"({self.drain_state['processed']} email(s) already created)")
+        return True
+
+    def _history_expired(self, error: HttpError) -> bool:
+        """True if error means the history checkpoint expired; drops the checkpoint for a full resync."""
+        if self.drain_state['source'] != 'history' or error.resp.status != 404:
+            return False
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] History checkpoint expired, running full resync")
+        self.history_id = None
+        return True
+
+    def _complete_drain(self):
+        """Advance the history checkpoint once every file for the drain exists."""
+        new_count = self.drain_state['processed']
+        self.history_id = self.drain_state['target_history_id']
+        self.drain_state = None
+        self._save_checkpoint()
+
+        if new_count > 0:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed {new_count} new email(s)")
+        else:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] No new unread+important emails")
+
+    def _drain(self, drain: dict) -> tuple:
+        """
+        Drain every page of a sync through batch fetch + the file-writer pool.
+
+        The page token is checkpointed after each completed page. Returns
+        (completed, files_created); completed is False if a fetch failed or
+        max_items_per_cycle was reached, leaving the drain to resume from
+        the next unfinished page.
+        """
+        run = {'started': time.monotonic(), 'processed': 0, 'pages': 0}
+        with self._file_writers() as pool:
+            for messages, next_page_token in self._iter_pages(drain):
+                new_ids = self._new_ids(messages)
+                time.sleep(self._throttle_delay(run, len(new_ids)))
+                full_messages, failed_ids = self._fetch_messages(new_ids)
+
+                # Consume the results so file errors surface here
+                list(pool.map(self._create_email_file, full_messages))
+
+                done = self._finish_page(drain, run, len(full_messages), bool(failed_ids), next_page_token)
+                if done is not None:
+                    return done, run['processed']
+
+        return True, run['processed']
+
+    @property
+    def has_pending_work(self) -> bool:
+        """True while a drain is unfinished (budget spent or a fetch failed)."""
+        return self.drain_state is not None
+
+    def _watch_request(self, topic: str):
+        return self.service.users().watch(userId='me', body={
+            'topicName': topic,
+            'labelIds': ['IMPORTANT'],
+            'labelFilterAction': 'include'
+        })
+
+    @property
+    def watch_renewal_due(self) -> bool:
+        """True when a push watch is registered and expires within WATCH_RENEW_MARGIN."""
+        return bool(self.push_topic) and time.time() > self.watch_expiration - WATCH_RENEW_MARGIN
+
+    def register_push_watch(self, topic: str):
+        """Ask Gmail to publish mailbox changes to a Pub/Sub topic (renewed automatically)."""
+        self._record_push_watch(topic, self._watch_request(topic).execute())
+
+    def _record_push_watch(self, topic: str, response: dict):
+        self.push_topic = topic
+        self.watch_expiration = int(response['expiration']) / 1000
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Gmail push watch active until "
+              f"{datetime.fromtimestamp(self.watch_expiration).strftime('%Y-%m-%d %H:%M')}")
+
+    def on_push_notification(self, history_id: str):
+        """Push listener callback: wake for a sync unless we are already past history_id."""
+        if self.history_id and self.drain_state is None and int(history_id) <= int(self.history_id):
+            return
+        self.wake()
+
+    def check_for_new_items(self) -> int:
+        """Check Gmail for new unread + important emails; returns files created."""
         if not self.service:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Not connected to Gmail API")
-            return
+            return 0
+
+        created = 0
 
         try:
-            # Query for unread + important emails
-            results = self.service.users().messages().list(
-                userId='me',
-                q=GMAIL_QUERY,
-                maxResults=10
-            ).execute()
+            if self.watch_renewal_due:
+                self.register_push_watch(self.push_topic)
 
-            messages = results.get('messages', [])
+            if not self._resume_drain():
+                self.drain_state = self._new_drain()
 
-            if not messages:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] No new unread+important emails")
-                return
+            try:
+                completed, created = self._drain(self.drain_state)
+            except HttpError as error:
+                if not self._history_expired(error):
+                    raise
+                self.drain_state = self._new_drain()
+                completed, created = self._drain(self.drain_state)
 
-            new_count = 0
-            for message in messages:
-                if message['id'] not in self.processed_ids:
-                    self._create_email_file(message)
-                    new_count += 1
-
-            if new_count > 0:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed {new_count} new email(s)")
+            if completed:
+                self._complete_drain()
 
         except HttpError as error:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Gmail API error: {error}")
         except Exception as error:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {error}")
 
+        return created
+
 
 def main():
     """Main function to start the Gmail watcher."""
@@ -325,7 +874,20 @@ def main():
 
     # Create and run watcher
     watcher = GmailWatcher(needs_action_path)
-    watcher.run(check_interval=CHECK_INTERVAL)
+
+    if not PUSH_ENABLED:
+        watcher.run(check_interval=CHECK_INTERVAL)
+        return
+
+    # Push mode: notifications trigger syncs, slow poll as a safety net
+    watcher.register_push_watch(PUBSUB_TOPIC)
+    listener = PushListener(watcher.on_push_notification, host=PUSH_HOST, port=PUSH_PORT,
+                            token=PUSH_TOKEN or None)
+    listener.start()
+    try:
+        watcher.run(check_interval=PUSH_SAFETY_INTERVAL)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
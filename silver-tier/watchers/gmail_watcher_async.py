@@ -0,0 +1,217 @@
+"""
+Async Gmail Watcher for Personal AI Employee - Silver Tier
+
+asyncio variant of GmailWatcher with the same checkpoints, dedupe index and
+EMAIL_*.md output. Instead of batch requests it fetches message details
+concurrently, which lets a backlog use the whole per-user quota.
+
+- A semaphore bounds in-flight requests (MAX_CONCURRENCY)
+- A token bucket models Gmail's per-user quota units (QUOTA_UNITS_PER_SECOND,
+  costs per method in QUOTA_COSTS) so bursts stay under the limit
+- HttpError 429/5xx responses are retried with exponential backoff + jitter
+- Attachment downloads (attachments.get) go through the same semaphore,
+  bucket and retries, although files are written on worker threads
+
+googleapiclient is blocking and its default HTTP object is not thread-safe,
+so each request runs in a worker thread with that thread's own AuthorizedHttp
+(GmailWatcher._execute_in_thread).
+
+Usage:
+    python watchers/gmail_watcher_async.py
+"""
+
+import time
+import random
+import asyncio
+from pathlib import Path
+from datetime import datetime
+
+from googleapiclient.errors import HttpError
+
+from gmail_watcher import GmailWatcher, CHECK_INTERVAL
+
+
+# Max Gmail requests in flight at once
+MAX_CONCURRENCY = 10
+
+# Gmail per-user rate limit and per-method quota unit costs
+QUOTA_UNITS_PER_SECOND = 250
+QUOTA_COSTS = {
+    'messages.get': 5,
+    'attachments.get': 5,
+    'messages.list': 5,
+    'history.list': 2,
+    'getProfile': 1,
+    'watch': 100,
+}
+
+# Retry policy for rate limiting and server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # Seconds; doubles per attempt
+BACKOFF_MAX = 32.0
+
+
+class QuotaBucket:
+    """Token bucket in Gmail quota units; refills continuously up to one second's worth."""
+
+    def __init__(self, units_per_second: float = QUOTA_UNITS_PER_SECOND):
+        self.rate = units_per_second
+        self.capacity = units_per_second
+        self.tokens = units_per_second
+        self.updated = None
+
+    def _refill(self, now: float):
+        if self.updated is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, units: float):
+        """Wait until `units` quota units are available, then take them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._refill(loop.time())
+            if self.tokens >= units:
+                self.tokens -= units
+                return
+            await asyncio.sleep((units - self.tokens) / self.rate)
+
+
+class AsyncGmailWatcher(GmailWatcher):
+    """
+    GmailWatcher that drains pages with concurrent, quota-aware message fetches.
+
+    Page accounting, checkpoints, max_items_per_cycle, max_per_second and
+    push-watch renewal are GmailWatcher's shared helpers; only the I/O differs.
+    """
+
+    def __init__(self, *args, max_concurrency: int = MAX_CONCURRENCY,
+                 quota: QuotaBucket = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self.quota = quota or QuotaBucket()
+        self.retries = 0
+        self._loop: asyncio.AbstractEventLoop = None
+        self._semaphore: asyncio.Semaphore = None
+
+    async def _execute(self, request, method: str):
+        """Execute a request off the event loop, charging quota and retrying 429/5xx."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self.quota.acquire(QUOTA_COSTS.get(method, 5))
+            try:
+                return await asyncio.to_thread(self._execute_in_thread, request)
+            except HttpError as error:
+                if error.resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+                self.retries += 1
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Gmail {error.resp.status} on {method}, "
+                      f"retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _execute_limited(self, request, method: str):
+        """_execute within the MAX_CONCURRENCY semaphore."""
+        async with self._semaphore:
+            return await self._execute(request, method)
+
+    async def _fetch_one(self, message_id: str):
+        try:
+            return await self._execute_limited(self._message_request(message_id), 'messages.get')
+        except HttpError as error:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to fetch {message_id}: {error}")
+            return None
+
+    def _fetch_attachment(self, request) -> str:
+        """
+        Runs on a file-writer thread: hand attachments.get back to the event
+        loop so it shares the semaphore, quota bucket and retries.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._execute_limited(request, 'attachments.get'), self._loop)
+        return future.result()['data']
+
+    async def _new_drain_async(self) -> dict:
+        profile = None
+        if not self.history_id:
+            profile = await self._execute(self._profile_request(), 'getProfile')
+        return self._new_drain(profile)
+
+    async def _drain_async(self, drain: dict) -> tuple:
+        """Async counterpart of GmailWatcher._drain; returns (completed, files_created)."""
+        run = {'started': time.monotonic(), 'processed': 0, 'pages': 0}
+        list_method = 'history.list' if drain['source'] == 'history' else 'messages.list'
+        page_token = drain.get('page_token')
+
+        # File writers get their own pool: they block on attachment fetches,
+        # which run on the default executor
+        with self._file_writers() as pool:
+            while True:
+                results = await self._execute(self._page_request(drain, page_token), list_method)
+                messages = self._parse_page(drain, results)
+                page_token = results.get('nextPageToken')
+
+                new_ids = self._new_ids(messages)
+                await asyncio.sleep(self._throttle_delay(run, len(new_ids)))
+                fetched = await asyncio.gather(*(self._fetch_one(mid) for mid in new_ids))
+                full_messages = [m for m in fetched if m is not None]
+
+                await asyncio.gather(*(self._loop.run_in_executor(pool, self._create_email_file, m)
+                                       for m in full_messages))
+
+                done = self._finish_page(drain, run, len(full_messages),
+                                         len(full_messages) < len(new_ids), page_token)
+                if done is not None:
+                    return done, run['processed']
+
+    async def check_for_new_items_async(self) -> int:
+        """Check Gmail for new unread + important emails; returns files created."""
+        if not self.service:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Not connected to Gmail API")
+            return 0
+
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        created = 0
+        try:
+            if self.watch_renewal_due:
+                response = await self._execute(self._watch_request(self.push_topic), 'watch')
+                self._record_push_watch(self.push_topic, response)
+
+            if not self._resume_drain():
+                self.drain_state = await self._new_drain_async()
+
+            try:
+                completed, created = await self._drain_async(self.drain_state)
+            except HttpError as error:
+                if not self._history_expired(error):
+                    raise
+                self.drain_state = await self._new_drain_async()
+                completed, created = await self._drain_async(self.drain_state)
+
+            if completed:
+                self._complete_drain()
+
+        except HttpError as error:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Gmail API error: {error}")
+        except Exception as error:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {error}")
+
+        return created
+
+    def check_for_new_items(self) -> int:
+        """Run one async cycle so the shared BaseWatcher.run loop can drive this watcher."""
+        return asyncio.run(self.check_for_new_items_async())
+
+
+def main():
+    """Main function to start the async Gmail watcher."""
+    root_path = Path('.')
+    needs_action_path = root_path / 'Needs_Action'
+    needs_action_path.mkdir(exist_ok=True)
+
+    watcher = AsyncGmailWatcher(needs_action_path)
+    watcher.run(check_interval=CHECK_INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
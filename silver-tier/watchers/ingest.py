@@ -0,0 +1,177 @@
+"""
+File Ingestion Strategies for Personal AI Employee - Silver Tier
+
+How InboxHandler places a dropped file into Needs_Action/. A plain copy
+doubles disk use and takes seconds to minutes for multi-GB drops; when the
+filesystem allows it, the data is shared or moved instead.
+
+Strategies (INGEST_STRATEGY):
+- 'hardlink': second name for the same inode (same filesystem only). No data
+  is written and no extra space is used. Both names see in-place edits
+- 'rename': moves the file out of Inbox/ (same filesystem only)
+- 'reflink': copy-on-write clone (FICLONE; Btrfs, XFS, bcachefs, ...).
+  Independent file, blocks shared until either side changes
+- 'copy_file_range': in-kernel copy (Linux); may be offloaded by the
+  filesystem or NFS server, never passes data through Python
+- 'copy': streaming chunked copy, works everywhere
+- 'auto' (default): hardlink -> reflink -> copy_file_range -> copy
+
+A strategy that the platform or filesystem does not support falls back along
+the same order and finally to 'copy'. With private=True hardlinks are never
+used, so later edits of the source cannot reach the destination. Copies are written to a hidden
+.partial file in the destination folder and renamed into place, so
+downstream stages never see a half-written file. File times and permissions
+are preserved, as with shutil.copy2.
+
+Usage:
+======
+from ingest import ingest_file
+method = ingest_file(source_path, dest_path)  # e.g. 'hardlink'
+"""
+
+import os
+import errno
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# Default strategy (see module docstring)
+INGEST_STRATEGY = 'auto'
+
+STRATEGIES = ('hardlink', 'rename', 'reflink', 'copy_file_range', 'copy')
+
+# Order tried by 'auto'; 'rename' empties Inbox/, so it is never chosen implicitly
+AUTO_ORDER = ('hardlink', 'reflink', 'copy_file_range', 'copy')
+
+# Streaming copy buffer
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Errors meaning "not possible here", as opposed to a real I/O failure
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EPERM, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EBADF,
+    errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP), errno.EMLINK,
+}
+
+
+class UnsupportedStrategy(OSError):
+    """The strategy cannot be used for this file pair on this platform."""
+
+
+def _check_unsupported(error: OSError):
+    if error.errno in UNSUPPORTED_ERRNOS:
+        raise UnsupportedStrategy(error.errno, error.strerror) from error
+    raise error
+
+
+def _hardlink(source: Path, dest: Path):
+    try:
+        os.link(source, dest)
+    except OSError as error:
+        _check_unsupported(error)
+
+
+def _rename(source: Path, dest: Path):
+    if source.stat().st_dev != dest.parent.stat().st_dev:
+        raise UnsupportedStrategy(errno.EXDEV, "different filesystems")
+    os.replace(source, dest)
+
+
+def _reflink(source_file, dest_file, size: int):
+    if not FCNTL_AVAILABLE:
+        raise UnsupportedStrategy(errno.ENOSYS, "FICLONE needs fcntl")
+    try:
+        fcntl.ioctl(dest_file.fileno(), FICLONE, source_file.fileno())
+    except OSError as error:
+        _check_unsupported(error)
+
+
+def _copy_file_range(source_file, dest_file, size: int):
+    if not hasattr(os, 'copy_file_range'):
+        raise UnsupportedStrategy(errno.ENOSYS, "os.copy_file_range not available")
+    source_fd, dest_fd = source_file.fileno(), dest_file.fileno()
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(source_fd, dest_fd, min(size - copied, 1 << 30))
+            if count == 0:
+                break
+            copied += count
+    except OSError as error:
+        if copied:
+            raise
+        _check_unsupported(error)
+
+
+def _stream_copy(source_file, dest_file, size: int):
+    buffer = bytearray(COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        count = source_file.readinto(buffer)
+        if not count:
+            break
+        dest_file.write(view[:count])
+
+
+_DATA_COPIERS = {
+    'reflink': _reflink,
+    'copy_file_range': _copy_file_range,
+    'copy': _stream_copy,
+}
+
+
+def _copy_via(strategy: str, source: Path, dest: Path):
+    """Copy data with one of the _DATA_COPIERS into a temp file, then rename into place."""
+    partial = dest.with_name(f".{dest.name}.partial")
+    try:
+        with open(source, 'rb') as source_file, open(partial, 'wb') as dest_file:
+            _DATA_COPIERS[strategy](source_file, dest_file, os.fstat(source_file.fileno()).st_size)
+        shutil.copystat(source, partial)
+        os.replace(partial, dest)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def ingest_file(source: Path, dest: Path, strategy: str = INGEST_STRATEGY,
+                fallback: bool = True, private: bool = False) -> str:
+    """
+    Place source at dest with the given strategy.
+
+    Returns the strategy actually used. With fallback=False an unsupported
+    strategy raises UnsupportedStrategy instead of trying the next one.
+    private=True skips 'hardlink' (dest must not share source's inode).
+    """
+    if strategy == 'auto':
+        order = AUTO_ORDER
+    elif strategy in STRATEGIES:
+        order = (strategy,) + tuple(s for s in AUTO_ORDER if s != strategy) if fallback else (strategy,)
+    else:
+        raise ValueError(f"Unknown ingest strategy: {strategy!r} (expected 'auto' or one of {STRATEGIES})")
+    if private:
+        order = tuple(s for s in order if s != 'hardlink')
+        if not order:
+            raise ValueError("The 'hardlink' strategy cannot make a private copy")
+
+    source, dest = Path(source), Path(dest)
+    last_error = None
+    for candidate in order:
+        try:
+            if candidate == 'hardlink':
+                _hardlink(source, dest)
+            elif candidate == 'rename':
+                _rename(source, dest)
+            else:
+                _copy_via(candidate, source, dest)
+            return candidate
+        except UnsupportedStrategy as error:
+            last_error = error
+    raise last_error
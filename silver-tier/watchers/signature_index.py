@@ -0,0 +1,117 @@
+"""
+Signature Index for Personal AI Employee - Silver Tier
+
+Remembers which files have already been handled, outside the files
+themselves. Each file name maps to the signature it had when handled:
+(inode, size, mtime in ns). A file whose current signature matches is
+skipped after a single stat(), without reading it; a missing name or a
+changed signature (file replaced or rewritten) means it needs handling.
+
+Stored in SQLite, one row per file, so recording is a single-row write
+however large the folder grows. Used for:
+
+- The Inbox manifest (filesystem_watcher.py): files InboxHandler ingested,
+  so a restart catches up on drops without ingesting anything twice
+- The approval notification index (src/orchestrator.py): Pending_Approval/
+  files already announced
+
+Usage:
+======
+from signature_index import SignatureIndex, file_signature
+index = SignatureIndex(Path('State') / 'inbox_manifest.sqlite3', table='ingested')
+if index.get(path.name) != file_signature(path.stat()):
+    ...
+    index.record(path.name, signature)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+
+def file_signature(stat: os.stat_result) -> tuple:
+    """(inode, size, mtime_ns): changes whenever the file is replaced or rewritten."""
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class SignatureIndex:
+    """
+    Name -> signature of every handled file. Safe to share across threads.
+
+    table and time_column name the SQLite table and its timestamp column,
+    so each use keeps its own table (and existing databases stay readable).
+    """
+
+    def __init__(self, db_path: Path, table: str, time_column: str = 'recorded_at'):
+        self.db_path = Path(db_path)
+        self.table = table
+        self.time_column = time_column
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30,
+                                    isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} ('
+            ' name TEXT PRIMARY KEY,'
+            ' inode INTEGER NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' mtime_ns INTEGER NOT NULL,'
+            f' {time_column} REAL NOT NULL'
+            ') WITHOUT ROWID'
+        )
+
+    def get(self, name: str) -> tuple:
+        """Signature recorded for name, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                f'SELECT inode, size, mtime_ns FROM {self.table} WHERE name = ?', (name,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def entries(self) -> dict:
+        """Snapshot of all entries: name -> signature."""
+        with self._lock:
+            rows = self.conn.execute(f'SELECT name, inode, size, mtime_ns FROM {self.table}').fetchall()
+        return {name: (inode, size, mtime_ns) for name, inode, size, mtime_ns in rows}
+
+    def record(self, name: str, signature: tuple):
+        self.record_many([(name, signature)])
+
+    def record_many(self, items: list):
+        """Record (name, signature) pairs in one transaction."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO {self.table} (name, inode, size, mtime_ns, {self.time_column})'
+                ' VALUES (?, ?, ?, ?, ?)',
+                [(name, *signature, now) for name, signature in items]
+            )
+            self.conn.execute('COMMIT')
+
+    def forget(self, entries: dict):
+        """Drop entries (name -> signature) whose files are gone; rows re-recorded since are kept."""
+        if not entries:
+            return
+        with self._lock:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                f'DELETE FROM {self.table} WHERE name = ? AND inode = ? AND size = ? AND mtime_ns = ?',
+                [(name, *signature) for name, signature in entries.items()]
+            )
+            self.conn.execute('COMMIT')
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
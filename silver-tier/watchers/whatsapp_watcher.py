@@ -39,21 +39,107 @@ Setup Instructions:
 4. If session expires:
    - Delete ./whatsapp_session/ folder
    - Repeat step 2 to re-authenticate
+
+Chat List Crawl:
+================
+WhatsApp Web only renders the chat rows near the viewport. Each cycle
+scrolls the list in steps (one page.evaluate per step), keeping each chat
+once by its key, until it reaches the end, a screen of chats older than the
+newest chat of the last finished crawl, MAX_CHATS, or CRAWL_TIME_BUDGET.
+A crawl cut short by the budget resumes at its scroll offset next cycle.
+The checkpoint lives in State/whatsapp_crawl.json.
+
+Event-Driven Mode:
+==================
+With EVENT_DRIVEN (default) the page is loaded once. A MutationObserver
+injected into the chat list reports changes to Python through a context
+binding (page.expose_binding), which wakes the watcher for an immediate
+scan; CHECK_INTERVAL only acts as a safety net. Each cycle runs a cheap
+health check: a missing observer is re-injected, and the page is reloaded
+only if the chat list itself has disappeared. Set EVENT_DRIVEN = False for
+the old reload-every-cycle behaviour.
+
+Lean Browser:
+=============
+Images, video/audio and fonts are aborted through a context route (the
+watcher only reads text; the login QR code is drawn on a canvas), and
+service workers are blocked so every request passes through that route.
+Before each cycle the watcher checks the resident memory of itself plus
+the browser (needs psutil) and the context's age; past MAX_BROWSER_RSS_MB
+or MAX_CONTEXT_AGE the persistent context is closed and relaunched on the
+same profile, so the session survives. Memory is logged every
+MEMORY_LOG_INTERVAL seconds to the console and the watcher metrics file.
+
+Deep Read (optional):
+=====================
+With DEEP_READ the watcher opens each new flagged chat and copies its last
+DEEP_READ_MESSAGES messages into the WHATSAPP_*.md file instead of only the
+one-line preview. WhatsApp Web allows one active tab per session (a second
+tab takes over and disconnects the first), so chats are read one at a time
+on the main page, at most DEEP_READ_MAX_CHATS per cycle, each bounded by
+DEEP_READ_TIMEOUT and all of them by DEEP_READ_BUDGET; a chat that runs out
+of time keeps its preview. Note that opening a chat marks it as read on
+your phone too.
+
+Message Identity:
+=================
+A message is identified by its chat key (the chat title) plus a hash of
+its normalized preview (NFKC, case-folded, whitespace collapsed), never by
+the time it was seen. The id is stored in the persistent dedupe index and
+also names the file (WHATSAPP_<chat>_<hash>.md), so the same preview is
+written once, even across restarts or when a chat shows no timestamp.
 """
 
+import json
 import time
 import re
+import hashlib
+import unicodedata
 from pathlib import Path
 from datetime import datetime
-from typing import Set, List, Optional
+from typing import List, Optional
+
+from playwright.sync_api import sync_playwright, Page, BrowserContext, Playwright, Route
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
-from playwright.sync_api import sync_playwright, Page, BrowserContext
+from base_watcher import BaseWatcher
+from dedupe_store import DEDUPE_DB_FILE
 
 
 # Configuration
 CHECK_INTERVAL = 60  # Seconds between checks
 HEADLESS = False  # Set to False for first run (QR scan), True for automated
 SESSION_PATH = './whatsapp_session'  # Persistent session storage
+WHATSAPP_URL = 'https://web.whatsapp.com'  # Overridden by the offline benchmarks
+
+# Event-driven mode (see module docstring)
+EVENT_DRIVEN = True
+EVENT_DEBOUNCE_MS = 500  # Coalesce bursts of DOM mutations into one callback
+EVENT_PUMP_SLICE = 1.0  # Seconds per Playwright event-pump slice while sleeping
+CHAT_LIST_BINDING = '__aiEmployeeChatListChanged'
+
+# Chat list crawl (see module docstring)
+CRAWL_TIME_BUDGET = 10.0  # Seconds of scrolling per cycle
+CRAWL_SETTLE_MS = 150  # Wait after each scroll step for the virtual list to render
+CRAWL_STATE_FILE = Path('State') / 'whatsapp_crawl.json'
+
+# Lean browser and context recycling (see module docstring)
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+MAX_BROWSER_RSS_MB = 1024  # 0 = no memory ceiling (needs psutil)
+MAX_CONTEXT_AGE = 12 * 3600  # Seconds; 0 = no age limit
+MEMORY_LOG_INTERVAL = 600  # Seconds between memory log lines
+
+# Deep read of flagged chats (see module docstring)
+DEEP_READ = False
+DEEP_READ_MESSAGES = 20  # Last N messages copied per chat
+DEEP_READ_MAX_CHATS = 10  # Chats opened per cycle
+DEEP_READ_TIMEOUT = 8.0  # Seconds per chat
+DEEP_READ_BUDGET = 30.0  # Seconds per cycle
 
 # Keywords that indicate high-priority messages
 PRIORITY_KEYWORDS = [
@@ -76,35 +162,121 @@ SELECTORS = {
     'unread_indicator': 'span[aria-label*="unread"]',
     'message_preview': 'div[role="row"] span[title*=":"]',
     'last_message_time': 'div[role="row"] time',
+    'conversation_panel': '#main',
+    'conversation_title': '#main header span[title]',
+    'conversation_message': '#main div[data-pre-plain-text]',
 }
 
+# Any of these inside a row marks it unread
+UNREAD_INDICATORS = [
+    'span[aria-label*="unread"]',
+    'span[aria-label*="message"]',
+    'div span[style*="background-color"]',
+]
 
-class BaseWatcher:
-    """Base class for all watchers in the AI Employee system."""
+# Max chats collected per crawl
+MAX_CHATS = 500
+
+# Selector set for the row reader in CRAWL_STEP_JS, built once at import
+EXTRACT_SPEC = {
+    'row': SELECTORS['chat_list'],
+    'name': SELECTORS['chat_name'],
+    'preview': SELECTORS['message_preview'],
+    'time': SELECTORS['last_message_time'],
+    'unread': ', '.join(UNREAD_INDICATORS),
+    'conversation': SELECTORS['conversation_panel'],
+}
 
-    def __init__(self, needs_action_path: Path):
-        self.needs_action_path = needs_action_path
-        self.processed_ids: Set[str] = set()
+# Row reader for CRAWL_STEP_JS: [name, preview, datetime|null, unread, chat key] per rendered row
+_READ_ROWS_JS = """
+    const readRows = (spec, limit) => {
+        const rows = Array.from(document.querySelectorAll(spec.row))
+            .filter(row => !row.closest(spec.conversation)).slice(0, limit);
+        return rows.map(row => {
+            const nameEl = row.querySelector(spec.name);
+            const previewEl = row.querySelector(spec.preview);
+            const time = row.querySelector(spec.time);
+            const titled = nameEl && (nameEl.matches('[title]') ? nameEl : nameEl.querySelector('[title]'));
+            const name = nameEl ? nameEl.innerText : null;
+            const unread = !!row.querySelector(spec.unread)
+                || String(row.className || '').includes('unread');
+            return [name, previewEl ? previewEl.innerText : '',
+                    time ? time.getAttribute('datetime') : null, unread,
+                    titled ? titled.getAttribute('title') : name];
+        });
+    };
+"""
 
-    def check_for_new_items(self):
-        """Check for new items to process. Override in subclass."""
-        raise NotImplementedError
+# One crawl step: read the rendered rows, then scroll the list pane.
+# action: 'top' | 'next' | <scroll offset>; the observer stays muted until MUTE_JS(false).
+CRAWL_STEP_JS = """
+([spec, action]) => {
+%s
+    const first = document.querySelector(spec.row);
+    if (!first) return null;
+    let pane = first.parentElement;
+    while (pane && pane.scrollHeight <= pane.clientHeight + 1) pane = pane.parentElement;
+    pane = pane || document.scrollingElement;
+    window.__aiEmployeeMuted = true;
+
+    if (action === 'top') pane.scrollTop = 0;
+    else if (typeof action === 'number') pane.scrollTop = action;
+    const rows = action === 'next' ? readRows(spec, Infinity) : [];
+    const atEnd = pane.scrollTop + pane.clientHeight >= pane.scrollHeight - 2;
+    if (action === 'next' && !atEnd) pane.scrollTop += Math.max(1, Math.floor(pane.clientHeight * 0.8));
+    return {rows, atEnd, offset: pane.scrollTop};
+}
+""" % _READ_ROWS_JS
+
+# Injected once per page load; calls CHAT_LIST_BINDING (debounced) on any chat list change
+OBSERVER_JS = """
+([rowSelector, bindingName, debounceMs]) => {
+    if (window.__aiEmployeeObserver) return false;
+    const row = document.querySelector(rowSelector);
+    if (!row) throw new Error('chat list not found');
+    const root = row.closest('[role="grid"]') || row.parentElement.parentElement || document.body;
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        if (timer || window.__aiEmployeeMuted) return;
+        timer = setTimeout(() => { timer = null; window[bindingName](Date.now()); }, debounceMs);
+    });
+    observer.observe(root, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['aria-label', 'class', 'title'],
+    });
+    window.__aiEmployeeObserver = observer;
+    return true;
+}
+"""
 
-    def run(self, check_interval: int = CHECK_INTERVAL):
-        """Run the watcher in an infinite loop."""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {self.__class__.__name__} started...")
-        print(f"Output to: {self.needs_action_path.absolute()}")
-        print(f"Check interval: {check_interval} seconds")
-        print("Press Ctrl+C to stop\n")
+# Mute/unmute the chat list observer while the watcher itself changes the page
+MUTE_JS = "(muted) => { window.__aiEmployeeMuted = muted; }"
 
-        try:
-            while True:
-                self.check_for_new_items()
-                time.sleep(check_interval)
-        except KeyboardInterrupt:
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Stopping {self.__class__.__name__}...")
+# Last N messages of the open conversation: [["[time, date] Sender: ", text], ...]
+READ_MESSAGES_JS = """
+([selector, limit]) => Array.from(document.querySelectorAll(selector)).slice(-limit).map(el => [
+    el.getAttribute('data-pre-plain-text') || '',
+    (el.querySelector('.selectable-text') || el).innerText.trim(),
+])
+"""
 
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {self.__class__.__name__} stopped.")
+# True once the open conversation is chat key and its messages are rendered
+# (right after a click the previous chat's messages can still be attached)
+CONVERSATION_READY_JS = """
+([titleSelector, messageSelector, key]) => {
+    const title = document.querySelector(titleSelector);
+    return !!title && title.getAttribute('title') === key
+        && !!document.querySelector(messageSelector);
+}
+"""
+
+# Health check: is the chat list still rendered, and is our observer still attached?
+HEALTH_JS = """
+(rowSelector) => ({
+    chatList: !!document.querySelector(rowSelector),
+    observer: !!window.__aiEmployeeObserver,
+})
+"""
 
 
 class WhatsAppWatcher(BaseWatcher):
@@ -114,12 +286,31 @@ class WhatsAppWatcher(BaseWatcher):
     """
 
     def __init__(self, needs_action_path: Path, session_path: str = SESSION_PATH,
-                 headless: bool = HEADLESS):
-        super().__init__(needs_action_path)
+                 headless: bool = HEADLESS, dedupe_path: Path = DEDUPE_DB_FILE,
+                 event_driven: bool = EVENT_DRIVEN, crawl_state_path: Path = CRAWL_STATE_FILE,
+                 url: str = WHATSAPP_URL, max_rss_mb: float = MAX_BROWSER_RSS_MB,
+                 max_context_age: float = MAX_CONTEXT_AGE, deep_read: bool = DEEP_READ):
+        super().__init__(needs_action_path, dedupe_path)
+        self.url = url
+        self.max_rss_mb = max_rss_mb
+        self.max_context_age = max_context_age
+        self.deep_read = deep_read
         self.session_path = Path(session_path)
         self.headless = headless
+        self.event_driven = event_driven
+        self.crawl_state_path = Path(crawl_state_path)
+        self.crawl_state = self._load_crawl_state()
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.playwright: Optional[Playwright] = None
+        self.context_started = 0.0
+        self.events = 0
+        self.reloads = 0
+        self.recycles = 0
+        self.blocked_requests = 0
+        self._last_memory_log = 0.0
+        if self.max_rss_mb and not PSUTIL_AVAILABLE:
+            print("⚠️  psutil not available, memory ceiling disabled. Install: pip install psutil")
         self._connect()
 
     def _connect(self):
@@ -127,11 +318,19 @@ class WhatsAppWatcher(BaseWatcher):
         # Ensure session directory exists
         self.session_path.mkdir(parents=True, exist_ok=True)
 
-        # Launch Playwright with persistent context using launch_persistent_context
-        playwright = sync_playwright().start()
-        
+        # One Playwright driver for the watcher's lifetime; reconnects only relaunch the context
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+
+        # The profile directory allows one context at a time
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+
         # Use launch_persistent_context for persistent session
-        self.context = playwright.chromium.launch_persistent_context(
+        self.context = self.playwright.chromium.launch_persistent_context(
             user_data_dir=str(self.session_path.absolute()),
             headless=self.headless,
             args=[
@@ -140,23 +339,78 @@ class WhatsAppWatcher(BaseWatcher):
                 '--disable-dev-shm-usage',
                 '--disable-accelerated-2d-canvas',
                 '--disable-gpu',
+                '--disable-extensions',
+                '--mute-audio',
                 '--window-size=1920,1080',
             ],
             viewport={'width': 1920, 'height': 1080},
             locale='en-US',
-            timezone_id='UTC'
+            timezone_id='UTC',
+            service_workers='block'  # Otherwise their requests bypass the route below
         )
+        self.context.route('**/*', self._route_request)
+        self.context_started = time.monotonic()
 
         self.page = self.context.pages[0]
+        if self.event_driven:
+            # Context bindings survive reloads, so this is registered once per context
+            self.context.expose_binding(CHAT_LIST_BINDING, self._on_chat_list_changed)
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Browser launched (headless={self.headless})")
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Session path: {self.session_path.absolute()}")
 
         # Navigate to WhatsApp Web
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Loading WhatsApp Web...")
-        self.page.goto('https://web.whatsapp.com', wait_until='networkidle', timeout=120000)
+        self.page.goto(self.url, wait_until='networkidle', timeout=120000)
 
         # Wait for page to load (check for chat list or QR code)
         self._wait_for_load()
+        if self.event_driven:
+            self._install_observer()
+
+    def _route_request(self, route: Route):
+        """Abort requests the watcher never needs (images, media, fonts)."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            self.blocked_requests += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    def _resident_memory_mb(self) -> Optional[float]:
+        """RSS of this process plus its children (Playwright driver and browser), or None."""
+        if not PSUTIL_AVAILABLE:
+            return None
+        process = psutil.Process()
+        total = 0
+        for proc in [process] + process.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def _check_resources(self):
+        """Log memory periodically; recycle the context past the memory or age limit."""
+        rss = self._resident_memory_mb()
+        age = time.monotonic() - self.context_started
+
+        if time.monotonic() - self._last_memory_log >= MEMORY_LOG_INTERVAL:
+            self._last_memory_log = time.monotonic()
+            rss_text = f"{rss:.0f} MB" if rss is not None else "n/a"
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Memory: {rss_text}, context age "
+                  f"{age / 3600:.1f} h, {self.blocked_requests} request(s) blocked")
+            self.metrics.record(self.__class__.__name__, rss_mb=rss and round(rss, 1),
+                                context_age_s=round(age), recycles=self.recycles,
+                                blocked_requests=self.blocked_requests)
+
+        reason = None
+        if self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            reason = f"memory {rss:.0f} MB over {self.max_rss_mb:g} MB"
+        elif self.max_context_age and age > self.max_context_age:
+            reason = f"context age {age / 3600:.1f} h over {self.max_context_age / 3600:g} h"
+        if reason:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Recycling browser context ({reason})")
+            self.recycles += 1
+            self._connect()
 
     def _wait_for_load(self, timeout: int = 60):
         """Wait for WhatsApp to fully load (chat list or QR code)."""
@@ -223,65 +477,179 @@ class WhatsAppWatcher(BaseWatcher):
             print(f"💡 TIP: Set HEADLESS=False to see what's happening in browser")
             raise
 
+    def _install_observer(self):
+        """Inject the chat list MutationObserver (no-op if it is already attached)."""
+        if self.page.evaluate(OBSERVER_JS, [SELECTORS['chat_list'], CHAT_LIST_BINDING, EVENT_DEBOUNCE_MS]):
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Chat list observer attached")
+
+    def _on_chat_list_changed(self, source: dict, changed_at: float):
+        """Binding callback, run on the watcher thread while it pumps Playwright events."""
+        self.events += 1
+        self.wake()
+
+    def _health_check(self):
+        """Re-attach a lost observer; reload only if the chat list is gone."""
+        health = self.page.evaluate(HEALTH_JS, SELECTORS['chat_list'])
+        if not health['chatList']:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Chat list missing, reloading WhatsApp Web")
+            self.reloads += 1
+            self.page.reload(wait_until='networkidle')
+            self._wait_for_load()
+            self._install_observer()
+        elif not health['observer']:
+            self._install_observer()
+
+    def _sleep(self, timeout: float) -> bool:
+        """Sleep in Playwright event-pump slices so observer callbacks can wake us."""
+        if not self.event_driven or self.page is None:
+            return super()._sleep(timeout)
+
+        deadline = time.monotonic() + timeout
+        while not self._wake.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self.page.wait_for_timeout(min(remaining, EVENT_PUMP_SLICE) * 1000)
+            except Exception:
+                # Page is gone; the next cycle reconnects
+                return super()._sleep(max(0.0, deadline - time.monotonic()))
+
+        woken = self._wake.is_set()
+        self._wake.clear()
+        return woken
+
+    def _load_crawl_state(self) -> dict:
+        """Load the newest chat time of the last finished crawl and any resume offset."""
+        try:
+            return json.loads(self.crawl_state_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return {'newest': None, 'resume_offset': None}
+
+    def _save_crawl_state(self):
+        self.crawl_state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.crawl_state_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(dict(self.crawl_state, updated=datetime.now().isoformat())),
+                            encoding='utf-8')
+        tmp_path.replace(self.crawl_state_path)
+
+    def _crawl_chats(self, time_budget: float = CRAWL_TIME_BUDGET) -> List[list]:
+        """
+        Scroll through the virtualized chat list and return each chat's row once.
+
+        Stops at the end of the list, at a screen of chats older than the
+        last crawl's checkpoint, at MAX_CHATS, or when time_budget runs out
+        (in which case the next crawl resumes from the current offset). All
+        but the last count as a finished crawl and advance the checkpoint.
+        """
+        deadline = time.monotonic() + time_budget
+        checkpoint = self.crawl_state.get('newest')
+        resume_offset = self.crawl_state.get('resume_offset')
+        seen = {}
+        completed = False
+
+        if self.page.evaluate(CRAWL_STEP_JS, [EXTRACT_SPEC, 'top']) is None:
+            return []
+        try:
+            while True:
+                self.page.wait_for_timeout(CRAWL_SETTLE_MS)
+                step = self.page.evaluate(CRAWL_STEP_JS, [EXTRACT_SPEC, 'next'])
+                if step is None:
+                    break
+                for row in step['rows']:
+                    seen.setdefault(row[4], row)
+
+                stamps = [row[2] for row in step['rows']]
+                if (step['atEnd'] or len(seen) >= MAX_CHATS
+                        or (checkpoint and stamps and all(t and t < checkpoint for t in stamps))):
+                    # Reaching MAX_CHATS finishes the crawl too, so the checkpoint still advances
+                    completed = True
+                    break
+                if time.monotonic() >= deadline:
+                    self.crawl_state['resume_offset'] = step['offset']
+                    break
+
+                # Skip the stretch the last (interrupted) crawl already covered
+                if resume_offset and resume_offset > step['offset']:
+                    self.page.evaluate(CRAWL_STEP_JS, [EXTRACT_SPEC, resume_offset])
+                resume_offset = None
+        finally:
+            # Back to the top, where new messages appear; unmute once the list settles
+            self.page.evaluate(CRAWL_STEP_JS, [EXTRACT_SPEC, 'top'])
+            self.page.wait_for_timeout(CRAWL_SETTLE_MS)
+            self.page.evaluate(MUTE_JS, False)
+
+        if completed:
+            stamps = [row[2] for row in seen.values() if row[2]]
+            self.crawl_state = {'newest': max(stamps + ([checkpoint] if checkpoint else []), default=None),
+                                'resume_offset': None}
+        self._save_crawl_state()
+        return list(seen.values())
+
     def _get_unread_chats(self) -> List[dict]:
-        """Get list of chats with unread messages."""
+        """Get list of chats with unread messages from a crawl of the whole chat list."""
         unread_chats = []
 
         try:
             # Wait for chat list
             self.page.wait_for_selector(SELECTORS['chat_list'], timeout=10000)
 
-            # Get all chat rows
-            chat_rows = self.page.query_selector_all(SELECTORS['chat_list'])
+            rows = self._crawl_chats()
 
-            for idx, row in enumerate(chat_rows[:20]):  # Limit to first 20 chats
-                try:
-                    # Extract chat name
-                    name_elem = row.query_selector(SELECTORS['chat_name'])
-                    chat_name = name_elem.inner_text() if name_elem else f"Unknown_{idx}"
-
-                    # Extract message preview
-                    preview_elem = row.query_selector(SELECTORS['message_preview'])
-                    preview_text = preview_elem.inner_text() if preview_elem else ""
-
-                    # Extract timestamp
-                    time_elem = row.query_selector(SELECTORS['last_message_time'])
-                    timestamp = time_elem.get_attribute('datetime') if time_elem else datetime.now().isoformat()
-
-                    # Check for unread indicator (various selectors)
-                    is_unread = False
-                    unread_indicators = [
-                        'span[aria-label*="unread"]',
-                        'span[aria-label*="message"]',
-                        'div span[style*="background-color"]',
-                    ]
-                    for indicator in unread_indicators:
-                        if row.query_selector(indicator):
-                            is_unread = True
-                            break
-
-                    # Also check for unread badge class
-                    if 'unread' in row.get_attribute('class') or 'unread' in str(row.evaluate('el => el.className')):
-                        is_unread = True
-
-                    if is_unread or self._contains_priority_keyword(preview_text):
-                        unread_chats.append({
-                            'name': chat_name,
-                            'preview': preview_text,
-                            'timestamp': timestamp,
-                            'element': row,
-                            'is_unread': is_unread
-                        })
-
-                except Exception as e:
-                    print(f"Error processing chat row: {e}")
-                    continue
+            for idx, (chat_name, preview_text, timestamp, is_unread, chat_key) in enumerate(rows):
+                if is_unread or self._contains_priority_keyword(preview_text):
+                    unread_chats.append({
+                        'name': chat_name or f"Unknown_{idx}",
+                        'preview': preview_text,
+                        'timestamp': timestamp or datetime.now().isoformat(),
+                        'key': chat_key or chat_name or f"Unknown_{idx}",
+                        'is_unread': is_unread
+                    })
 
         except Exception as e:
             print(f"Error getting unread chats: {e}")
 
         return unread_chats
 
+    def _read_conversation(self, chat_key: str, timeout: float) -> Optional[List[str]]:
+        """Open one chat and return its last messages as lines, or None if it can't be read in time."""
+        deadline = time.monotonic() + timeout
+
+        def remaining_ms() -> float:
+            return max(1.0, (deadline - time.monotonic()) * 1000)
+
+        row = self.page.locator(SELECTORS['chat_list'],
+                                has=self.page.locator(f"[title={json.dumps(chat_key, ensure_ascii=False)}]"))
+        if row.count() == 0:
+            return None  # Not rendered (virtualized away)
+        row.first.click(timeout=remaining_ms())
+        self.page.wait_for_function(CONVERSATION_READY_JS,
+                                    arg=[SELECTORS['conversation_title'],
+                                         SELECTORS['conversation_message'], chat_key],
+                                    timeout=remaining_ms())
+        messages = self.page.evaluate(READ_MESSAGES_JS,
+                                      [SELECTORS['conversation_message'], DEEP_READ_MESSAGES])
+        return [f"{meta.strip()} {text}".strip() for meta, text in messages if text]
+
+    def _deep_read(self, chats: List[dict]):
+        """Attach the last messages to each chat, one chat at a time, within the cycle budget."""
+        deadline = time.monotonic() + DEEP_READ_BUDGET
+        self.page.evaluate(MUTE_JS, True)
+        try:
+            for chat in chats[:DEEP_READ_MAX_CHATS]:
+                timeout = min(DEEP_READ_TIMEOUT, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                try:
+                    chat['messages'] = self._read_conversation(chat['key'], timeout)
+                except Exception as error:
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Deep read skipped for {chat['name']}: {error}")
+        finally:
+            # Close the conversation so its message rows never mix with the chat list
+            self.page.keyboard.press('Escape')
+            self.page.wait_for_timeout(CRAWL_SETTLE_MS)
+            self.page.evaluate(MUTE_JS, False)
+
     def _contains_priority_keyword(self, text: str) -> bool:
         """Check if text contains any priority keywords."""
         text_lower = text.lower()
@@ -317,21 +685,36 @@ class WhatsAppWatcher(BaseWatcher):
 
         return actions
 
-    def _create_message_file(self, chat: dict):
-        """Create a .md file in Needs_Action/ for the WhatsApp message."""
+    def _message_id(self, chat: dict) -> str:
+        """Stable id: chat key + hash of the normalized preview (see module docstring)."""
+        normalized = " ".join(unicodedata.normalize('NFKC', chat['preview']).casefold().split())
+        digest = hashlib.sha256(f"{chat['key']}\n{normalized}".encode('utf-8')).hexdigest()[:16]
+        return f"{chat['key']}:{digest}"
+
+    def _create_message_file(self, chat: dict) -> bool:
+        """Create a .md file in Needs_Action/ for the WhatsApp message; False if it already exists."""
         chat_name = chat['name']
         preview = chat['preview']
         timestamp = chat['timestamp']
+        message_id = self._message_id(chat)
 
-        # Generate unique filename
+        # Deterministic filename, so a lost index still can't produce a duplicate file
         safe_name = "".join(c if c.isalnum() or c in ' -_' else '_' for c in chat_name[:20])
-        file_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"WHATSAPP_{file_timestamp}_{safe_name}.md"
+        filename = f"WHATSAPP_{safe_name}_{message_id.rsplit(':', 1)[1]}.md"
         filepath = self.needs_action_path / filename
+        if filepath.exists():
+            self.processed_ids.add(message_id)
+            return False
 
         # Generate suggested actions
         suggested_actions = self._generate_suggested_actions(chat_name, preview)
 
+        # Full messages from the optional deep read
+        messages_section = ""
+        if chat.get('messages'):
+            messages_section = "## Recent Messages\n\n" + "\n".join(
+                f"- {line}" for line in chat['messages']) + "\n\n---\n\n"
+
         # Determine priority based on keywords
         priority = 'high' if self._contains_priority_keyword(preview) else 'medium'
 
@@ -343,6 +726,7 @@ priority: {priority}
 status: pending
 source: whatsapp
 chat_name: "{chat_name}"
+message_id: "{message_id}"
 ---
 
 # WhatsApp Message: {chat_name}
@@ -361,7 +745,7 @@ chat_name: "{chat_name}"
 
 ---
 
-## Suggested Actions
+{messages_section}## Suggested Actions
 
 {chr(10).join(suggested_actions)}
 
@@ -382,34 +766,45 @@ chat_name: "{chat_name}"
 
         filepath.write_text(content, encoding='utf-8')
 
-        # Track processed chat to avoid duplicates (using name + timestamp as ID)
-        chat_id = f"{chat_name}:{timestamp}"
-        self.processed_ids.add(chat_id)
+        # Track processed message to avoid duplicates
+        self.processed_ids.add(message_id)
 
         print(f"[{datetime.now().strftime('%H:%M:%S')}] Created: {filename}")
+        return True
 
-    def check_for_new_items(self):
-        """Check WhatsApp for new unread messages with priority keywords."""
+    def check_for_new_items(self) -> int:
+        """Check WhatsApp for new unread messages with priority keywords; returns files created."""
+        new_count = 0
         try:
-            # Refresh page to get latest messages
-            self.page.reload(wait_until='networkidle')
-            time.sleep(3)  # Wait for messages to load
+            self._check_resources()
+
+            if self.event_driven:
+                # The live page is already current; only make sure it is healthy
+                self._health_check()
+            else:
+                # Refresh page to get latest messages
+                self.page.reload(wait_until='networkidle')
+                self.reloads += 1
+                time.sleep(3)  # Wait for messages to load
 
             # Get unread/priority chats
             chats = self._get_unread_chats()
 
             if not chats:
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] No new priority WhatsApp messages")
-                return
+                return 0
+
+            # Only create file if unread or contains priority keyword
+            new_chats = [chat for chat in chats
+                         if self._message_id(chat) not in self.processed_ids
+                         and (chat['is_unread'] or self._contains_priority_keyword(chat['preview']))]
 
-            new_count = 0
-            for chat in chats:
-                chat_id = f"{chat['name']}:{chat['timestamp']}"
-                if chat_id not in self.processed_ids:
-                    # Only create file if unread or contains priority keyword
-                    if chat['is_unread'] or self._contains_priority_keyword(chat['preview']):
-                        self._create_message_file(chat)
-                        new_count += 1
+            if self.deep_read and new_chats:
+                self._deep_read(new_chats)
+
+            for chat in new_chats:
+                if self._create_message_file(chat):
+                    new_count += 1
 
             if new_count > 0:
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] Processed {new_count} new WhatsApp message(s)")
@@ -422,11 +817,15 @@ chat_name: "{chat_name}"
             except Exception as reconnect_error:
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] Reconnection failed: {reconnect_error}")
 
+        return new_count
+
     def close(self):
         """Close browser and cleanup."""
         if self.context:
             self.context.close()
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Browser closed")
+        if self.playwright:
+            self.playwright.stop()
 
 
 def main():